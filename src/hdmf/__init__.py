@@ -1,5 +1,4 @@
 from . import query
-from .backends.hdf5.h5_utils import H5Dataset, H5RegionSlicer
 from .container import Container, Data, DataRegion, HERDManager
 from .region import ListSlicer
 from .utils import docval, getargs
@@ -19,6 +18,8 @@ def get_region_slicer(**kwargs):
         DeprecationWarning,
     )
 
+    from .backends.hdf5.h5_utils import H5Dataset, H5RegionSlicer
+
     dataset, region = getargs("dataset", "region", kwargs)
     if isinstance(dataset, (list, tuple, Data)):
         return ListSlicer(dataset, region)
@@ -27,6 +28,15 @@ def get_region_slicer(**kwargs):
     return None
 
 
+def __getattr__(name):
+    # import the HDF5 backend when it is first used, to keep "import hdmf" fast
+    if name in ("H5Dataset", "H5RegionSlicer"):
+        from .backends.hdf5 import h5_utils
+
+        return getattr(h5_utils, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 try:
     # see https://effigies.gitlab.io/posts/python-packaging-2023/
     from ._version import __version__
@@ -6,22 +6,33 @@ writing the spec among others"""
 from collections import deque
 from abc import ABCMeta, abstractmethod
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from copy import copy
+from itertools import product
+from queue import Queue
+from threading import Condition
+import zlib
 
-from h5py import Group, Dataset, RegionReference, Reference, special_dtype
+from h5py import Group, Dataset, RegionReference, Reference, special_dtype, check_dtype, h5r, h5s, h5t, h5z
 from h5py import filters as h5py_filters
 import json
+import pickle
 import numpy as np
 import warnings
 import os
 import logging
+import time
 
 from ...array import Array
-from ...data_utils import DataIO, AbstractDataChunkIterator, append_data
+from ...data_utils import DataIO, AbstractDataChunkIterator, DataChunkIterator, GenericDataChunkIterator, append_data
+from ...monitor import DataChunkProcessor
 from ...query import HDMFDataset, ReferenceResolver, ContainerResolver, BuilderResolver
 from ...region import RegionSlicer
 from ...spec import SpecWriter, SpecReader
-from ...utils import docval, getargs, popargs, get_docval, get_data_shape
+from ...utils import docval, getargs, popargs, get_docval, get_data_shape, StrDataset
+
+PREFETCH_MAX_BYTES = 256*2**20  # default maximum size of the chunks read ahead of the writes = 256 MiB
 
 
 class HDF5IODataChunkIteratorQueue(deque):
@@ -31,12 +42,33 @@ class HDF5IODataChunkIteratorQueue(deque):
     Each queue element must be a tuple of two elements:
     1) the dataset to write to and 2) the AbstractDataChunkIterator with the data
     """
-    def __init__(self):
+    def __init__(self, io_stats=None, prefetch_workers=None, prefetch_max_bytes=PREFETCH_MAX_BYTES,
+                 max_buffer_bytes=None):
+        """
+        :param io_stats: the IOStats to record the exhaustion of the queue and the chunks written in
+        :type io_stats: IOStats
+        :param prefetch_workers: the number of threads that read chunks from the queued DataChunkIterators ahead of
+                                 the writes, or None to read and write the chunks in turn on the calling thread
+        :type prefetch_workers: int
+        :param prefetch_max_bytes: the maximum number of bytes of chunks that are read ahead of the writes
+        :type prefetch_max_bytes: int
+        :param max_buffer_bytes: the maximum total number of bytes of the buffers of the DataChunkIterators that are
+                                 exhausted concurrently, or None to not limit the buffers
+        :type max_buffer_bytes: int
+        """
         self.logger = logging.getLogger('%s.%s' % (self.__class__.__module__, self.__class__.__qualname__))
+        self.io_stats = io_stats
+        self.prefetch_workers = prefetch_workers
+        self.prefetch_max_bytes = prefetch_max_bytes
+        self.max_buffer_bytes = max_buffer_bytes
+        self.checkpoint = None  # HDF5IODataChunkIteratorCheckpoint to record the chunks written in
+        self.__dataio = dict()  # map from id of DataChunkIterator to the H5DataIO that wrapped it
+        self.__started = set()  # ids of the DataChunkIterators that chunks were read from
+        self.__executors = dict()  # map from id of H5DataIO to the thread pool that compresses the chunks of its data
         super().__init__()
 
     @classmethod
-    def _write_chunk(cls, dset, data):
+    def _write_chunk(cls, dset, data, io_stats=None, dataio=None):
         """
         Read a chunk from the given DataChunkIterator and write it to the given Dataset
 
@@ -44,6 +76,10 @@ class HDF5IODataChunkIteratorQueue(deque):
         :type dset: Dataset
         :param data: The DataChunkIterator to read from
         :type data: AbstractDataChunkIterator
+        :param io_stats: The IOStats to record the written chunk in
+        :type io_stats: IOStats
+        :param dataio: The H5DataIO that wrapped the DataChunkIterator, whose write options are used
+        :type dataio: H5DataIO
         :return: True if a chunk was written, False otherwise
         :rtype: bool
 
@@ -53,26 +89,217 @@ class HDF5IODataChunkIteratorQueue(deque):
             chunk_i = next(data)
         except StopIteration:
             return False
+        cls._write_data_chunk(dset, chunk_i, io_stats, dataio)
+        return True
+
+    @classmethod
+    def _write_data_chunk(cls, dset, chunk_i, io_stats=None, dataio=None, executor=None):
+        """
+        Write the given DataChunk to the given Dataset
+
+        :param dset: The Dataset to write to
+        :type dset: Dataset
+        :param chunk_i: The DataChunk to write
+        :type chunk_i: DataChunk
+        :param io_stats: The IOStats to record the written chunk in
+        :type io_stats: IOStats
+        :param dataio: The H5DataIO that wrapped the DataChunkIterator, whose write options are used
+        :type dataio: H5DataIO
+        :param executor: The thread pool that compresses the chunks if the compression_workers option is set
+        :type executor: ThreadPoolExecutor
+        """
         # Determine the minimum array size required to store the chunk
         max_bounds = chunk_i.get_min_bounds()
         # Expand the dataset if needed
         dset.id.extend(max_bounds)
         # Write the data
-        dset[chunk_i.selection] = chunk_i.data
-
-        return True
+        skipped = write_selection(dset, chunk_i.data, chunk_i.selection, dataio, executor=executor)
+        if dataio is not None:
+            for processor in dataio.chunk_processors:
+                processor.process_data_chunk(chunk_i)
+        if io_stats is not None:
+            io_stats.add(dset.name, bytes_written=_chunk_nbytes(chunk_i), chunks_written=1, write_calls=1)
+            if skipped > 0:
+                io_stats.add(dset.name, chunks_skipped=skipped)
 
     def exhaust_queue(self):
         """
         Read and write from any queued DataChunkIterators in a round-robin fashion
+
+        If prefetch_workers is set, the chunks are read from the DataChunkIterators on a pool of threads, one thread
+        per iterator at a time, while the calling thread writes the chunks in the order in which they were read.
+
+        If max_buffer_bytes is set, the buffers of GenericDataChunkIterators that have not been started are first
+        shrunk to their share of max_buffer_bytes among the iterators that are exhausted concurrently. Without
+        prefetch_workers, an iterator is then started only when its buffers fit in max_buffer_bytes together with the
+        buffers of the iterators that are being exhausted, where the buffers of iterators other than
+        GenericDataChunkIterators are estimated from the largest chunk that was read from them. The time that each
+        iterator waited before it was started is recorded as 'dci_wait_time' of its dataset in io_stats.
         """
-        while len(self) > 0:
+        if len(self) == 0:
+            return
+        with self.io_stats.timed('exhaust_dci') if self.io_stats is not None else nullcontext():
+            if self.max_buffer_bytes is not None:
+                self.__shrink_buffers()
+            if self.prefetch_workers is not None:
+                self.__exhaust_queue_prefetch()
+                return
+            start = time.perf_counter()
+            # the queue holds the iterators that are being exhausted, which are started in the order of waiting
+            waiting = deque(self)
+            self.clear()
+            try:
+                self.__exhaust_queue(waiting, start)
+            finally:
+                self.extend(waiting)
+                for executor in self.__executors.values():
+                    executor.shutdown(wait=True)
+                self.__executors.clear()
+
+    def __get_executor(self, dataio):
+        """
+        Get the thread pool that compresses the chunks of the data of the given H5DataIO, which is created when the
+        first chunk is written and shut down when the data are exhausted, or None if compression_workers is not set
+        """
+        if dataio is None or dataio.compression_workers is None:
+            return None
+        executor = self.__executors.get(id(dataio))
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=dataio.compression_workers, thread_name_prefix='hdmf-compress')
+            self.__executors[id(dataio)] = executor
+        return executor
+
+    def __shutdown_executor(self, dataio):
+        """Shut down the thread pool that compresses the chunks of the data of the given H5DataIO, if any"""
+        executor = self.__executors.pop(id(dataio), None)
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __exhaust_queue(self, waiting, start):
+        """Exhaust the given waiting iterators in turn on the calling thread, starting them within the budget"""
+        buffer_nbytes = dict()  # map from id of started DataChunkIterator to the estimated size of its buffers
+        while len(self) > 0 or len(waiting) > 0:
+            while len(waiting) > 0:
+                dset, data = waiting[0]
+                nbytes = _estimate_buffer_nbytes(data)
+                if (self.max_buffer_bytes is not None and len(self) > 0
+                        and sum(buffer_nbytes.values()) + nbytes > self.max_buffer_bytes):
+                    break
+                waiting.popleft()
+                if self.max_buffer_bytes is not None and self.io_stats is not None:
+                    self.io_stats.add(dset.name, dci_wait_time=time.perf_counter() - start)
+                buffer_nbytes[id(data)] = nbytes
+                self.__started.add(id(data))
+                super().append((dset, data))
             self.logger.debug("Exhausting DataChunkIterator from queue (length %d)" % len(self))
             dset, data = self.popleft()
-            if self._write_chunk(dset, data):
-                self.append(dataset=dset, data=data)
+            dataio = self.__dataio.get(id(data))
+            try:
+                chunk_i = next(data)
+            except StopIteration:
+                buffer_nbytes.pop(id(data))
+                self.__started.discard(id(data))
+                dataio = self.__dataio.pop(id(data), None)
+                if dataio is not None:
+                    self.__shutdown_executor(dataio)
+                    finish_chunk_processors(dset, dataio)
+                if self.checkpoint is not None:
+                    self.checkpoint.done(dset)
+                continue
+            buffer_nbytes[id(data)] = max(buffer_nbytes[id(data)], _chunk_nbytes(chunk_i))
+            self._write_data_chunk(dset, chunk_i, self.io_stats, dataio, self.__get_executor(dataio))
+            self.append(dataset=dset, data=data)
+            if self.checkpoint is not None:
+                self.checkpoint.chunk_written(dset)
+
+    def __shrink_buffers(self):
+        """Shrink the buffers of the GenericDataChunkIterators that have not been started to their share of
+        max_buffer_bytes"""
+        concurrency = len(self) if self.prefetch_workers is None else min(len(self), self.prefetch_workers)
+        share = self.max_buffer_bytes / concurrency
+        for dset, data in self:
+            if (isinstance(data, GenericDataChunkIterator) and id(data) not in self.__started
+                    and data.buffer_nbytes > share and data.shrink_buffer(buffer_gb=share / 1e9)):
+                self.logger.debug("Shrunk the buffer of the DataChunkIterator of dataset '%s' to %s"
+                                  % (dset.name, str(data.buffer_shape)))
+
+    def __exhaust_queue_prefetch(self):
+        """Exhaust the queue, reading the chunks from the DataChunkIterators ahead of the writes on a thread pool"""
+        # (dataset, H5DataIO, DataChunk, nbytes) of the chunks that were read, with an exception instead of the
+        # DataChunk if reading failed, or None when the iterator is done
+        ready = Queue()
+        budget = Condition()
+        state = {'nbytes': 0, 'stop': False}
+        start = time.perf_counter()
+        wait_times = dict()  # map from dataset path to the time that its iterator waited for a thread or the budget
+
+        def produce(dset, data, dataio):
+            if state['stop']:  # the exhaustion failed before this iterator was started
+                return
+            wait_time = time.perf_counter() - start
+            try:
+                for chunk_i in data:
+                    nbytes = _chunk_nbytes(chunk_i)
+                    with budget:
+                        # always admit a chunk if no chunks are buffered so that large chunks cannot block the write
+                        wait_start = time.perf_counter()
+                        budget.wait_for(lambda: state['stop'] or state['nbytes'] == 0
+                                        or state['nbytes'] + nbytes <= self.prefetch_max_bytes)
+                        wait_time += time.perf_counter() - wait_start
+                        if state['stop']:
+                            return
+                        state['nbytes'] += nbytes
+                    ready.put((dset, dataio, chunk_i, nbytes))
+                wait_times[dset.name] = wait_time
+            except BaseException as e:
+                ready.put((dset, dataio, e, 0))
+            else:
+                ready.put((dset, dataio, None, 0))
 
-    def append(self, dataset, data):
+        entries = list()
+        while len(self) > 0:
+            dset, data = self.popleft()
+            self.__started.add(id(data))
+            entries.append((dset, data, self.__dataio.pop(id(data), None)))
+        self.logger.debug("Exhausting %d DataChunkIterators with %d prefetch threads"
+                          % (len(entries), self.prefetch_workers))
+        executor = ThreadPoolExecutor(max_workers=self.prefetch_workers)
+        try:
+            for dset, data, dataio in entries:
+                executor.submit(produce, dset, data, dataio)
+            remaining = len(entries)
+            while remaining > 0:
+                dset, dataio, chunk_i, nbytes = ready.get()
+                if chunk_i is None:
+                    remaining -= 1
+                    if self.io_stats is not None and dset.name in wait_times:
+                        self.io_stats.add(dset.name, dci_wait_time=wait_times[dset.name])
+                    if dataio is not None:
+                        self.__shutdown_executor(dataio)
+                        finish_chunk_processors(dset, dataio)
+                    if self.checkpoint is not None:
+                        self.checkpoint.done(dset)
+                    continue
+                if isinstance(chunk_i, BaseException):
+                    raise chunk_i
+                self._write_data_chunk(dset, chunk_i, self.io_stats, dataio, self.__get_executor(dataio))
+                if self.checkpoint is not None:
+                    self.checkpoint.chunk_written(dset)
+                with budget:
+                    state['nbytes'] -= nbytes
+                    budget.notify_all()
+        finally:
+            with budget:
+                state['stop'] = True
+                budget.notify_all()
+            executor.shutdown(wait=True)
+            for _, data, _ in entries:
+                self.__started.discard(id(data))
+            for compress_executor in self.__executors.values():
+                compress_executor.shutdown(wait=True)
+            self.__executors.clear()
+
+    def append(self, dataset, data, dataio=None):
         """
         Append a value to the queue
 
@@ -80,10 +307,474 @@ class HDF5IODataChunkIteratorQueue(deque):
         :type dataset: :py:class:`~h5py.Dataset`
         :param data: DataChunkIterator with the data to be written
         :type data: AbstractDataChunkIterator
+        :param dataio: The H5DataIO that wrapped the DataChunkIterator. Its compression_workers and skip_fill_chunks
+                       options are used to write the chunks. See :py:func:`write_selection`.
+        :type dataio: H5DataIO
         """
+        if dataio is not None:
+            self.__dataio[id(data)] = dataio
         super().append((dataset, data))
 
 
+class HDF5IODataChunkIteratorCheckpoint:
+    """
+    Helper class used by HDF5IO to record the progress of writing DataChunkIterators to a checkpoint file
+
+    For each dataset that is written from a DataChunkIterator, the checkpoint holds the path of the dataset, the
+    pickled iterator before any chunk was read from it, the options of the H5DataIO that wrapped it, the buffer
+    shape of GenericDataChunkIterators, the number of chunks that were written, the pickled chunk processors of the
+    H5DataIO after processing these chunks, and whether the iterator is exhausted. The pickled iterators and the
+    options do not change and are written once to a separate file next to the checkpoint file, named
+    ``<path>.iterators``. The rest is written to the checkpoint file after flushing the HDF5 file, at most every
+    save_chunks chunks or save_interval seconds and when an iterator is exhausted, so that the writes can be resumed
+    from the checkpoint file by skipping the chunks that were written. This requires the iterators to be picklable
+    and to return the same chunks in the same order when they are unpickled, as
+    :py:class:`~hdmf.data_utils.GenericDataChunkIterator` does.
+    """
+
+    __static_keys = ('iterator', 'dataio')  # the keys of the progress of a dataset that do not change
+
+    def __init__(self, path, file, datasets=None, save_chunks=None, save_interval=None):
+        """
+        :param path: the path of the checkpoint file
+        :type path: str
+        :param file: the HDF5 file that the datasets are written to
+        :type file: File
+        :param datasets: the progress of each dataset, as returned by :py:meth:`load`
+        :type datasets: dict
+        :param save_chunks: the number of chunks written after which the checkpoint is saved, or None to not save
+                            it by the number of chunks
+        :type save_chunks: int
+        :param save_interval: the number of seconds after which the checkpoint is saved when the next chunk is
+                              written, or None to not save it by time
+        :type save_interval: float
+        """
+        self.path = path
+        self.__file = file
+        self.datasets = dict() if datasets is None else datasets
+        self.__save_chunks = save_chunks
+        self.__save_interval = save_interval
+        self.__static_saved = datasets is not None  # the iterators of loaded datasets were saved already
+        self.__changed = set()  # the paths of the datasets whose chunk processors changed since they were pickled
+        self.__chunks = 0  # the number of chunks written since the checkpoint was saved
+        self.__last_save = time.perf_counter()
+        self.__dataio = dict()  # map from dataset path to the H5DataIO with the chunk processors of the dataset
+        self.__data = dict()  # map from dataset path to the DataChunkIterator of the dataset
+
+    @property
+    def static_path(self):
+        """The path of the file with the pickled iterators and the H5DataIO options of the datasets"""
+        return self.path + '.iterators'
+
+    def add(self, dataset, data, dataio=None):
+        """
+        Add a dataset that is written from a DataChunkIterator that has not been read from
+
+        :raises ValueError: if the DataChunkIterator cannot be pickled
+        """
+        try:
+            iterator = pickle.dumps(data)
+        except Exception as e:
+            raise ValueError("Cannot checkpoint the write of dataset '%s' because its %s cannot be pickled. Use a "
+                             "GenericDataChunkIterator that defines _to_dict and _from_dict."
+                             % (dataset.name, type(data).__name__)) from e
+        options = dict()
+        if dataio is not None:
+            # the arguments to create the H5DataIO again when the write is resumed. the shape and dtype in the
+            # io_settings are set from the iterator when the dataset is created and are not options of the H5DataIO.
+            io_settings = {k: v for k, v in dataio.io_settings.items() if k not in ('shape', 'dtype')}
+            options = {'io_settings': io_settings,
+                       'allow_plugin_filters': dataio.allow_plugin_filters,
+                       'compression_workers': dataio.compression_workers,
+                       'skip_fill_chunks': dataio.skip_fill_chunks,
+                       'write_processor_attributes': dataio.write_processor_attributes}
+            self.__dataio[dataset.name] = dataio
+        self.__data[dataset.name] = data
+        self.datasets[dataset.name] = {'iterator': iterator, 'dataio': options, 'chunks_written': 0, 'done': False}
+        self.__static_saved = False
+        self.__changed.add(dataset.name)
+
+    def resume(self, dataset, data, dataio=None):
+        """Track the DataChunkIterator and H5DataIO of a loaded dataset whose write is resumed"""
+        if dataio is not None:
+            self.__dataio[dataset.name] = dataio
+        self.__data[dataset.name] = data
+
+    def chunk_written(self, dataset):
+        """
+        Record that the next chunk of the given dataset was written and save the checkpoint if save_chunks chunks
+        were written or save_interval seconds passed since it was saved
+        """
+        self.datasets[dataset.name]['chunks_written'] += 1
+        self.__changed.add(dataset.name)
+        self.__chunks += 1
+        if ((self.__save_chunks is not None and self.__chunks >= self.__save_chunks)
+                or (self.__save_interval is not None
+                    and time.perf_counter() - self.__last_save >= self.__save_interval)):
+            self.save()
+
+    def done(self, dataset):
+        """Record that all chunks of the given dataset were written and save the checkpoint"""
+        progress = self.datasets[dataset.name]
+        progress['done'] = True
+        progress.pop('chunk_processors', None)
+        self.__changed.discard(dataset.name)
+        self.save()
+
+    def save(self):
+        """Flush the HDF5 file and replace the checkpoint file"""
+        # pickle only the chunk processors of the datasets that were written to since the checkpoint was saved
+        for name in self.__changed:
+            dataio = self.__dataio.get(name)
+            if dataio is not None and dataio.chunk_processors:
+                self.datasets[name]['chunk_processors'] = pickle.dumps(dataio.chunk_processors)
+        self.__changed.clear()
+        for name, data in self.__data.items():
+            # the buffers may have been shrunk to fit the memory budget of the queue after the iterator was pickled
+            if isinstance(data, GenericDataChunkIterator):
+                self.datasets[name]['buffer_shape'] = data.buffer_shape
+        self.__file.flush()
+        if not self.__static_saved:
+            self.__dump(self.static_path, {name: {k: progress[k] for k in self.__static_keys}
+                                           for name, progress in self.datasets.items()})
+            self.__static_saved = True
+        self.__dump(self.path, {name: {k: v for k, v in progress.items() if k not in self.__static_keys}
+                                for name, progress in self.datasets.items()})
+        self.__chunks = 0
+        self.__last_save = time.perf_counter()
+
+    @staticmethod
+    def __dump(path, datasets):
+        """Replace the given file with the given progress of each dataset"""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'datasets': datasets}, f)
+        os.replace(tmp_path, path)
+
+    def remove(self):
+        """Remove the checkpoint file and the file with the iterators after all chunks were written"""
+        for path in (self.path, self.static_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    @classmethod
+    def load(cls, path):
+        """Load the progress of each dataset from the given checkpoint file and the file with the iterators"""
+        with open(path, 'rb') as f:
+            datasets = pickle.load(f)['datasets']
+        with open(path + '.iterators', 'rb') as f:
+            for name, progress in pickle.load(f)['datasets'].items():
+                datasets[name].update(progress)
+        return datasets
+
+
+def _estimate_buffer_nbytes(data):
+    """Estimate the number of bytes of the buffers of the given DataChunkIterator before chunks are read from it"""
+    if isinstance(data, GenericDataChunkIterator):
+        return data.buffer_nbytes
+    if isinstance(data, DataChunkIterator) and not data.blocks and data.maxshape is not None:
+        shape = list(data.maxshape)
+        shape[data.iter_axis] = data.buffer_size
+        if None not in shape and data.dtype is not None:
+            try:
+                return int(np.prod(shape)) * np.dtype(data.dtype).itemsize
+            except TypeError:  # not a numpy dtype
+                pass
+    return 0
+
+
+def _chunk_nbytes(chunk_i):
+    """Get the number of bytes of the data of the given DataChunk"""
+    data = chunk_i.data
+    if isinstance(data, np.ndarray) and not data.dtype.hasobject:
+        return data.nbytes
+    return _data_nbytes(data)
+
+
+def _data_nbytes(data):
+    """
+    Get the number of bytes of the values of the given data, counting the UTF-8 encoded length of strings and the
+    bytes of the values in object arrays and lists instead of the size of the references to them
+    """
+    if isinstance(data, str):
+        return len(data.encode('utf-8'))
+    if isinstance(data, bytes):
+        return len(data)
+    if isinstance(data, np.ndarray):
+        if not data.dtype.hasobject and data.dtype.kind != 'U':
+            return data.nbytes
+        return sum(_data_nbytes(v) for v in data.flat)
+    if isinstance(data, np.void):  # an element of a compound array with object fields
+        return _data_nbytes(data.item())
+    if isinstance(data, (list, tuple)):
+        return sum(_data_nbytes(v) for v in data)
+    return np.asarray(data).nbytes
+
+
+def _has_vlen_dtype(dtype):
+    """Check whether the given numpy dtype of an h5py Dataset holds variable-length values"""
+    if dtype.names is not None:
+        return any(_has_vlen_dtype(dtype.fields[name][0]) for name in dtype.names)
+    return dtype.hasobject
+
+
+def finish_chunk_processors(dset, dataio):
+    """
+    Mark the chunk processors of the given H5DataIO as exhausted and, if its write_processor_attributes option is
+    set, write their attributes to the given dataset
+
+    :param dset: the dataset that the data of the H5DataIO were written to
+    :type dset: Dataset
+    :param dataio: the H5DataIO with the chunk processors
+    :type dataio: H5DataIO
+    """
+    for processor in dataio.chunk_processors:
+        processor.mark_exhausted()
+        if dataio.write_processor_attributes:
+            for key, value in processor.get_attributes().items():
+                dset.attrs[key] = value
+
+
+def _normalize_selection(dset, data, selection):
+    """
+    Get the start and stop of each axis of the given selection of the given h5py Dataset, or None if the selection
+    is not a slice or tuple of slices with step 1 that matches the shape of the given numpy array
+    """
+    if selection is None:
+        selection = tuple(slice(0, n) for n in dset.shape)
+    elif not isinstance(selection, tuple):
+        selection = (selection,)
+    if (len(selection) != dset.ndim or data.ndim != dset.ndim
+            or any(not isinstance(s, slice) or s.step not in (None, 1) for s in selection)):
+        return None
+    start = [0 if s.start is None else s.start for s in selection]
+    stop = [dset.shape[i] if s.stop is None else s.stop for i, s in enumerate(selection)]
+    if list(data.shape) != [b - a for a, b in zip(start, stop)]:
+        return None
+    return start, stop
+
+
+def _iter_chunk_parts(dset, start, stop):
+    """
+    Iterate over the chunks of the given h5py Dataset that intersect the selection from start to stop, yielding the
+    offset of the chunk, the part of the dataset in the chunk and the selection, and the part of the selected data
+    """
+    chunks = dset.chunks
+    for index in product(*(range(a // c, (b - 1) // c + 1) for a, b, c in zip(start, stop, chunks))):
+        offset = tuple(i * c for i, c in zip(index, chunks))
+        part = tuple(slice(max(o, a), min(o + c, b)) for o, c, a, b in zip(offset, chunks, start, stop))
+        yield offset, part, tuple(slice(p.start - a, p.stop - a) for p, a in zip(part, start))
+
+
+def _is_fill(data, fillvalue):
+    """Check whether all values of the given numpy array are equal to the given fill value"""
+    if data.dtype.kind in 'fc' and np.isnan(fillvalue):
+        return bool(np.isnan(data).all())
+    return bool((data == fillvalue).all())
+
+
+def write_selection(dset, data, selection=None, dataio=None, executor=None):
+    """
+    Write the given data to the given selection of an h5py Dataset using the write options of the given H5DataIO
+
+    If the compression_workers option is set, the chunks are compressed with :py:func:`write_direct_chunks` on the
+    given thread pool, or on a thread pool that is created for this call if no thread pool is given. If the
+    skip_fill_chunks option is set, the parts of the selection in each chunk of the dataset that contain only the
+    fill value of the dataset are not written, so chunks that contain only the fill value are not allocated in the
+    file, and the skipped chunk parts are counted in H5DataIO.skipped_chunks.
+
+    :param dset: the dataset to write to
+    :type dset: Dataset
+    :param data: the data to write
+    :param selection: the selection of the dataset to write to, or None to write the whole dataset
+    :param dataio: the H5DataIO with the write options, or None to write the data with h5py
+    :type dataio: H5DataIO
+    :param executor: the thread pool to compress the chunks on, e.g., to reuse it for all chunks of a dataset
+    :type executor: ThreadPoolExecutor
+    :return: the number of chunk parts that were skipped
+    :rtype: int
+    """
+    compression_workers = None if dataio is None else dataio.compression_workers
+    if compression_workers is not None and executor is None and can_write_direct_chunks(dset):
+        # compress the chunks of all parts of the selection on the same threads
+        with ThreadPoolExecutor(max_workers=compression_workers, thread_name_prefix='hdmf-compress') as executor:
+            return write_selection(dset, data, selection, dataio, executor)
+    parts = [(selection, data)]
+    skipped = 0
+    if dataio is not None and dataio.skip_fill_chunks and dset.chunks is not None:
+        data = np.asarray(data)
+        bounds = _normalize_selection(dset, data, selection) if data.dtype.kind in 'biufc' else None
+        if bounds is not None:
+            fillvalue = dset.fillvalue
+            parts = list()
+            for _, part, src in _iter_chunk_parts(dset, *bounds):
+                if _is_fill(data[src], fillvalue):
+                    skipped += 1
+                else:
+                    parts.append((part, data[src]))
+            if skipped == 0:  # write the selection at once
+                parts = [(selection, data)]
+            dataio.skipped_chunks += skipped
+    for part, part_data in parts:
+        if compression_workers is not None and can_write_direct_chunks(dset):
+            write_direct_chunks(dset, part_data, part, max_workers=compression_workers, executor=executor)
+        else:
+            dset[... if part is None else part] = part_data
+    return skipped
+
+
+def _get_chunk_filters(dset):
+    """
+    Get the functions that apply the filter pipeline of the given chunked h5py Dataset to the bytes of a chunk, or
+    None if the pipeline contains filters other than shuffle and gzip (deflate)
+    """
+    plist = dset.id.get_create_plist()
+    filters = list()
+    for i in range(plist.get_nfilters()):
+        code, _, values, _ = plist.get_filter(i)
+        if code == h5z.FILTER_SHUFFLE:
+            itemsize = dset.dtype.itemsize
+            filters.append(lambda b, s=itemsize: np.frombuffer(b, dtype=np.uint8).reshape(-1, s).T.tobytes())
+        elif code == h5z.FILTER_DEFLATE:
+            level = values[0] if len(values) > 0 else 6
+            filters.append(lambda b, level=level: zlib.compress(b, level))
+        else:
+            return None
+    return filters
+
+
+def can_write_direct_chunks(dset):
+    """
+    Check whether chunks of the given h5py Dataset can be compressed by :py:func:`write_direct_chunks`, i.e., whether
+    the dataset is chunked, has a numeric or boolean data type, and uses only the shuffle and gzip filters
+    """
+    return dset.chunks is not None and dset.dtype.kind in 'biufc' and _get_chunk_filters(dset) is not None
+
+
+def write_direct_chunks(dset, data, selection=None, max_workers=None, executor=None):
+    """
+    Write the given data to the given selection of a chunked h5py Dataset, compressing chunks in a pool of threads
+
+    Each chunk of the dataset that is covered by the selection is filled, padded with the fill value of the dataset at
+    the edges of dimensions that cannot be extended, passed through the shuffle and gzip filters of the dataset on the
+    threads, and then written in order with ``write_direct_chunk``. The parts of chunks that are only partially
+    covered by the selection are written with h5py, which reads, updates, and compresses the chunk within libhdf5.
+    zlib releases the GIL while compressing, so the threads compress in parallel.
+
+    :param dset: the dataset to write to. :py:func:`can_write_direct_chunks` must be True for the dataset.
+    :type dset: Dataset
+    :param data: the data to write
+    :param selection: a slice or tuple of slices with step 1 that select the part of the dataset to write, or None to
+                      write the whole dataset. If the selection is not of this form, the data are written with h5py.
+    :param max_workers: the number of threads used to compress chunks
+    :type max_workers: int
+    :param executor: the thread pool with max_workers threads to compress the chunks on, or None to create a thread
+                     pool for this call
+    :type executor: ThreadPoolExecutor
+    """
+    data = np.asarray(data, dtype=dset.dtype)
+    bounds = _normalize_selection(dset, data, selection)
+    if bounds is None:
+        dset[selection] = data
+        return
+    start, stop = bounds
+    if data.size == 0:
+        return
+    filters = _get_chunk_filters(dset)
+    chunks = dset.chunks
+    fillvalue = dset.fillvalue
+
+    def compress(offset):
+        # fill a whole chunk, since the chunks at the edges of the dataset are stored padded to the chunk shape
+        buf = np.full(chunks, fillvalue, dtype=dset.dtype)
+        src = tuple(slice(o - a, min(o + c, b) - a) for o, c, a, b in zip(offset, chunks, start, stop))
+        buf[tuple(slice(0, s.stop - s.start) for s in src)] = data[src]
+        ret = buf.tobytes()
+        for f in filters:
+            ret = f(ret)
+        return ret
+
+    # chunks at the edges of dimensions that can still be extended are written with h5py, since they would be
+    # written again when the dataset is extended
+    fixed = [m is not None and m == n for m, n in zip(dset.maxshape, dset.shape)]
+    full = list()
+    for index in product(*(range(a // c, (b - 1) // c + 1) for a, b, c in zip(start, stop, chunks))):
+        offset = tuple(i * c for i, c in zip(index, chunks))
+        chunk_stop = [min(o + c, n) for o, c, n in zip(offset, chunks, dset.shape)]
+        if all(o >= a and e <= b and (e == o + c or f)
+               for o, e, a, b, c, f in zip(offset, chunk_stop, start, stop, chunks, fixed)):
+            full.append(offset)
+        else:  # write the part of the chunk that is selected with h5py
+            part = tuple(slice(max(o, a), min(e, b)) for o, e, a, b in zip(offset, chunk_stop, start, stop))
+            dset[part] = data[tuple(slice(p.start - a, p.stop - a) for p, a in zip(part, start))]
+    if len(full) == 0:
+        return
+    shutdown = executor is None
+    if shutdown:
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='hdmf-compress')
+    try:
+        # submit a bounded number of chunks ahead of the writes to limit the memory used by compressed chunks
+        window = 2 * (max_workers or os.cpu_count() or 1)
+        pending = deque()
+        for offset in full:
+            pending.append((offset, executor.submit(compress, offset)))
+            if len(pending) >= window:
+                done, future = pending.popleft()
+                dset.id.write_direct_chunk(done, future.result())
+        while len(pending) > 0:
+            done, future = pending.popleft()
+            dset.id.write_direct_chunk(done, future.result())
+    finally:
+        if shutdown:
+            executor.shutdown(wait=True)
+
+
+def read_regions(dataset, regions):
+    """
+    Read the selections of the given region references into the given h5py Dataset
+
+    Selections that are a single hyperslab block are sorted and merged with the blocks that overlap or are adjacent
+    along the first dimension and have the same bounds in all other dimensions, so that each merged block is a tight
+    slab that is read with a single call. Other selections (e.g., point selections) are read one at a time.
+
+    :param dataset: the h5py Dataset that the region references point to
+    :param regions: the region references
+    :return: a list with the data selected by each region reference, i.e., ``[dataset[r] for r in regions]``
+    """
+    ret = [None] * len(regions)
+    blocks = list()
+    for i, ref in enumerate(regions):
+        space = h5r.get_region(ref, dataset.id)
+        if dataset.ndim > 0 and space.get_select_type() == h5s.SEL_HYPERSLABS \
+                and space.get_select_hyper_nblocks() == 1:
+            start, end = space.get_select_bounds()
+            blocks.append((start, end, i))
+        else:
+            ret[i] = dataset[ref]
+    # group the blocks by their bounds in the other dimensions, then sort them along the first dimension
+    blocks.sort(key=lambda block: (block[0][1:], block[1][1:], block[0][0], block[1][0]))
+    use_read_direct = dataset.dtype.kind != 'O' and not isinstance(dataset, StrDataset)
+    j = 0
+    while j < len(blocks):
+        lo, hi = list(blocks[j][0]), list(blocks[j][1])
+        k = j + 1
+        while k < len(blocks) and blocks[k][0][0] <= hi[0] + 1 \
+                and blocks[k][0][1:] == tuple(lo[1:]) and blocks[k][1][1:] == tuple(hi[1:]):
+            hi[0] = max(hi[0], blocks[k][1][0])
+            k += 1
+        merged = tuple(slice(a, b + 1) for a, b in zip(lo, hi))
+        if use_read_direct:
+            buf = np.empty(tuple(b - a + 1 for a, b in zip(lo, hi)), dtype=dataset.dtype)
+            dataset.read_direct(buf, source_sel=merged)
+        else:
+            buf = dataset[merged]
+        for start, end, i in blocks[j:k]:
+            region = buf[tuple(slice(a - m, b - m + 1) for a, b, m in zip(start, end, lo))]
+            ret[i] = region if k - j == 1 else region.copy()  # do not share memory between regions
+        j = k
+    return ret
+
+
 class H5Dataset(HDMFDataset):
     @docval({'name': 'dataset', 'type': (Dataset, Array), 'doc': 'the HDF5 file lazily evaluate'},
             {'name': 'io', 'type': 'hdmf.backends.hdf5.h5tools.HDF5IO',
@@ -150,9 +841,87 @@ class DatasetOfReferences(H5Dataset, ReferenceResolver, metaclass=ABCMeta):
             self.__inverted = cls(**kwargs)
         return self.__inverted
 
+    @abstractmethod
+    def get_object_from_builder(self, builder):
+        """
+        A method that maps a Builder to the Builder or Container that references are resolved to
+        """
+        pass
+
     def _get_ref(self, ref):
         return self.get_object(self.dataset.file[ref])
 
+    def _get_indices(self, arg):
+        """
+        Get the indices of the elements that the given selection of a 1D dataset selects, or None if the selection
+        is not a slice or a 1D array of indices or booleans
+        """
+        n = len(self.dataset)
+        if isinstance(arg, slice):
+            return np.arange(*arg.indices(n))
+        if not isinstance(arg, (list, np.ndarray)):
+            return None
+        indices = np.asarray(arg)
+        if indices.ndim != 1:
+            return None
+        if indices.dtype == bool:
+            return np.flatnonzero(indices) if len(indices) == n else None
+        if len(indices) == 0:
+            return indices.astype(np.int64)
+        if not np.issubdtype(indices.dtype, np.integer) or indices.min() < -n or indices.max() >= n:
+            return None
+        return np.where(indices < 0, indices + n, indices)
+
+    def _read_addresses(self, arg):
+        """
+        Read the addresses of the objects that the object references in the given selection of a 1D dataset point
+        to, together with the indices of the selected elements
+
+        The raw object references are read as addresses in a single read. Returns None if the selection is not a
+        slice or a 1D array of indices or booleans.
+        """
+        indices = self._get_indices(arg)
+        if indices is None:
+            return None
+        addresses = np.empty(len(indices), dtype=np.uint64)
+        if len(indices) > 0:
+            fspace = self.dataset.id.get_space()
+            step = int(indices[1] - indices[0]) if len(indices) > 1 else 1
+            if isinstance(arg, slice) and step > 0:
+                fspace.select_hyperslab((int(indices[0]), ), (len(indices), ), (step, ))
+            else:
+                fspace.select_elements(indices.reshape(-1, 1))
+            mspace = h5s.create_simple((len(indices), ))
+            self.dataset.id.read(mspace, fspace, addresses, mtype=h5t.STD_REF_OBJ)
+        return indices, addresses
+
+    def _get_refs(self, indices, addresses):
+        """
+        Resolve the object references at the given indices of a 1D dataset, dereferencing each unique target object
+        only once
+
+        The builders of the target objects are also cached by the IO object, so that reading many references to the
+        same objects, e.g., from different slices of the dataset, is fast. The object references themselves are only
+        read for the target objects whose builders are not cached.
+
+        :param indices: the indices of the object references to resolve
+        :param addresses: the addresses of the objects that the object references point to
+        """
+        if len(indices) == 0:
+            return list()
+        unique_addresses, first, inverse = np.unique(addresses, return_index=True, return_inverse=True)
+
+        def read_refs(positions):
+            # h5py requires increasing indices
+            rows, rows_inverse = np.unique(indices[first[positions]], return_inverse=True)
+            return self.dataset[rows.tolist()][rows_inverse.ravel()]
+
+        builders = self.io._get_ref_builders(self.dataset.file, unique_addresses.tolist(), read_refs)
+        targets = np.empty(len(builders), dtype=object)
+        for i, builder in enumerate(builders):
+            targets[i] = self.get_object_from_builder(builder)
+        return targets[inverse.ravel()].tolist()
+
     def __iter__(self):
         for ref in super().__iter__():
             yield self._get_ref(ref)
@@ -173,6 +942,12 @@ class BuilderResolverMixin(BuilderResolver):
         """
         return self.io.get_builder(h5obj)
 
+    def get_object_from_builder(self, builder):
+        """
+        A method that maps a Builder to itself
+        """
+        return builder
+
 
 class ContainerResolverMixin(ContainerResolver):
     """
@@ -186,6 +961,12 @@ class ContainerResolverMixin(ContainerResolver):
         """
         return self.io.get_container(h5obj)
 
+    def get_object_from_builder(self, builder):
+        """
+        A method that maps a Builder to a Container
+        """
+        return self.io.manager.construct(builder)
+
 
 class AbstractH5TableDataset(DatasetOfReferences):
 
@@ -272,6 +1053,11 @@ class AbstractH5TableDataset(DatasetOfReferences):
 class AbstractH5ReferenceDataset(DatasetOfReferences):
 
     def __getitem__(self, arg):
+        if isinstance(self.dataset, Dataset) and self.dataset.ndim == 1 \
+                and check_dtype(ref=self.dataset.dtype) is Reference:
+            selection = self._read_addresses(arg)
+            if selection is not None:
+                return self._get_refs(*selection)
         ref = super().__getitem__(arg)
         if isinstance(ref, np.ndarray):
             return [self._get_ref(x) for x in ref]
@@ -286,10 +1072,37 @@ class AbstractH5ReferenceDataset(DatasetOfReferences):
 class AbstractH5RegionDataset(AbstractH5ReferenceDataset):
 
     def __getitem__(self, arg):
+        if not np.issubdtype(type(arg), np.integer):
+            refs = self.dataset[arg]
+            if isinstance(refs, np.ndarray):
+                return self._get_regions(refs)
         obj = super().__getitem__(arg)
         ref = self.dataset[arg]
         return obj[ref]
 
+    def _get_regions(self, refs):
+        """
+        Read the regions that a 1D array of region references select, reading the regions of each target in bulk
+
+        The region references are grouped by their target, each target is resolved once, and the regions of each
+        target dataset are read with :py:func:`read_regions`.
+        """
+        h5file = self.dataset.file
+        targets = dict()
+        for i, ref in enumerate(refs):
+            targets.setdefault(h5r.get_name(ref, h5file.id), list()).append(i)
+        ret = [None] * len(refs)
+        for indices in targets.values():
+            target = self._get_ref(refs[indices[0]])
+            target_refs = [refs[i] for i in indices]
+            if isinstance(getattr(target, 'data', None), Dataset):
+                regions = read_regions(target.data, target_refs)
+            else:
+                regions = [target[ref] for ref in target_refs]
+            for i, region in zip(indices, regions):
+                ret[i] = region
+        return ret
+
     @property
     def dtype(self):
         return 'region'
@@ -434,6 +1247,25 @@ class H5RegionSlicer(RegionSlicer):
         if self.__region is None:
             self.__region = self.__dataset[self.__regref]
 
+    @staticmethod
+    def read_regions(slicers):
+        """
+        Read the regions of the given H5RegionSlicers in bulk
+
+        The regions of slicers of the same dataset are read with :py:func:`read_regions`, which merges the reads of
+        overlapping or adjacent regions.
+        """
+        datasets = dict()
+        for slicer in slicers:
+            if slicer.__region is None:
+                datasets.setdefault(id(slicer.__dataset), list()).append(slicer)
+        for group in datasets.values():
+            dataset = group[0].__dataset
+            if isinstance(dataset, H5Dataset):
+                dataset = dataset.dataset
+            for slicer, region in zip(group, read_regions(dataset, [slicer.__regref for slicer in group])):
+                slicer.__region = region
+
     def __getitem__(self, idx):
         self.__read_region()
         return self.__region[idx]
@@ -499,12 +1331,41 @@ class H5DataIO(DataIO):
             {'name': 'dtype',
              'type': (str, type, np.dtype),
              'doc': 'the data type of the new dataset, used only if data is None',
-             'default': None}
+             'default': None},
+            {'name': 'compression_workers',
+             'type': int,
+             'doc': 'Compress the chunks of the dataset in this number of threads and write them directly to the '
+                    'file, instead of compressing them one at a time in HDF5. Requires gzip compression and no '
+                    'fletcher32 checksum. Data that are not numeric, or not aligned with the chunks, are written '
+                    'as usual.',
+             'default': None},
+            {'name': 'skip_fill_chunks',
+             'type': bool,
+             'doc': 'Do not write the parts of chunks of the dataset that contain only the fill value (see fillvalue), '
+                    'so that chunks that contain only the fill value are not allocated in the file. This saves time '
+                    'and space when writing sparse data from a DataChunkIterator. Only applies to chunked datasets '
+                    'of numeric data, and assumes that the parts of the dataset that are written have not been '
+                    'written before. The number of skipped chunk parts is available as skipped_chunks.',
+             'default': False},
+            {'name': 'chunk_processors',
+             'type': (list, tuple),
+             'doc': 'DataChunkProcessors (see hdmf.monitor), e.g., SummaryStatistics, that process the chunks of '
+                    'the data as they are written. The results are available from their get_final_result method '
+                    'when all chunks have been written.',
+             'default': None},
+            {'name': 'write_processor_attributes',
+             'type': bool,
+             'doc': 'Write the attributes returned by the get_attributes method of the chunk_processors to the '
+                    'dataset when all chunks have been written. These attributes, e.g., "stats_mean", are not part '
+                    'of any specification, so files with them may not pass validation against their schema.',
+             'default': False}
             )
     def __init__(self, **kwargs):
         # Get the list of I/O options that user has passed in
         ioarg_names = [name for name in kwargs.keys() if name not in ['data', 'link_data', 'allow_plugin_filters',
-                                                                      'dtype', 'shape']]
+                                                                      'dtype', 'shape', 'compression_workers',
+                                                                      'skip_fill_chunks', 'chunk_processors',
+                                                                      'write_processor_attributes']]
 
         # Remove the ioargs from kwargs
         ioarg_values = [popargs(argname, kwargs) for argname in ioarg_names]
@@ -512,6 +1373,18 @@ class H5DataIO(DataIO):
         self.__link_data = popargs('link_data', kwargs)
         # Consume allow_plugin_filters parameter
         self.__allow_plugin_filters = popargs('allow_plugin_filters', kwargs)
+        # Consume compression_workers parameter
+        self.__compression_workers = popargs('compression_workers', kwargs)
+        # Consume skip_fill_chunks parameter
+        self.__skip_fill_chunks = popargs('skip_fill_chunks', kwargs)
+        self.__skipped_chunks = 0
+        # Consume chunk_processors parameter
+        self.__chunk_processors = list(popargs('chunk_processors', kwargs) or [])
+        for processor in self.__chunk_processors:
+            if not isinstance(processor, DataChunkProcessor):
+                raise ValueError("chunk_processors must be DataChunkProcessors, not %s" % type(processor).__name__)
+        # Consume write_processor_attributes parameter
+        self.__write_processor_attributes = popargs('write_processor_attributes', kwargs)
         # Check for possible collision with other parameters
         if not isinstance(getargs('data', kwargs), Dataset) and self.__link_data:
             self.__link_data = False
@@ -543,6 +1416,14 @@ class H5DataIO(DataIO):
                     self.__iosettings.pop('compression_opts', None)
         # Validate the compression options used
         self._check_compression_options()
+        if self.__compression_workers is not None:
+            if self.__compression_workers < 1:
+                raise ValueError("compression_workers must be a positive integer, not %d"
+                                 % self.__compression_workers)
+            if self.__iosettings.get('compression') not in ('gzip', h5py_filters.h5z.FILTER_DEFLATE):
+                raise ValueError("compression_workers requires gzip compression")
+            if self.__iosettings.get('fletcher32', False):
+                raise ValueError("compression_workers cannot be used with the fletcher32 checksum")
         # Confirm that the compressor is supported by h5py
         if not self.filter_available(self.__iosettings.get('compression', None),
                                      self.__allow_plugin_filters):
@@ -663,6 +1544,40 @@ class H5DataIO(DataIO):
     def link_data(self):
         return self.__link_data
 
+    @property
+    def allow_plugin_filters(self):
+        """Whether compression filters that are loaded dynamically by HDF5 are allowed"""
+        return self.__allow_plugin_filters
+
+    @property
+    def compression_workers(self):
+        """The number of threads used to compress the chunks of the dataset, or None to compress them in HDF5"""
+        return self.__compression_workers
+
+    @property
+    def skip_fill_chunks(self):
+        """Whether the parts of chunks that contain only the fill value are not written"""
+        return self.__skip_fill_chunks
+
+    @property
+    def skipped_chunks(self):
+        """The number of parts of chunks that were not written because they contained only the fill value"""
+        return self.__skipped_chunks
+
+    @skipped_chunks.setter
+    def skipped_chunks(self, val):
+        self.__skipped_chunks = val
+
+    @property
+    def chunk_processors(self):
+        """The DataChunkProcessors that process the chunks of the data as they are written"""
+        return self.__chunk_processors
+
+    @property
+    def write_processor_attributes(self):
+        """Whether the attributes of the chunk processors are written to the dataset"""
+        return self.__write_processor_attributes
+
     @property
     def io_settings(self):
         return self.__iosettings
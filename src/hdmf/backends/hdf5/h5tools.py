@@ -1,8 +1,15 @@
+import hashlib
+import itertools
 import logging
+import math
 import os.path
+import pickle
+import tempfile
 import warnings
 from collections import deque
-from functools import partial
+from collections.abc import Callable
+from contextlib import nullcontext
+from functools import partial, wraps
 from pathlib import Path, PurePosixPath as pp
 
 import numpy as np
@@ -10,17 +17,19 @@ import h5py
 from h5py import File, Group, Dataset, special_dtype, SoftLink, ExternalLink, Reference, RegionReference, check_dtype
 
 from .h5_utils import (BuilderH5ReferenceDataset, BuilderH5RegionDataset, BuilderH5TableDataset, H5DataIO,
-                       H5SpecReader, H5SpecWriter, HDF5IODataChunkIteratorQueue)
+                       H5SpecReader, H5SpecWriter, HDF5IODataChunkIteratorCheckpoint, HDF5IODataChunkIteratorQueue,
+                       PREFETCH_MAX_BYTES, finish_chunk_processors, write_selection, _data_nbytes, _has_vlen_dtype)
 from ..io import HDMFIO
 from ..errors import UnsupportedOperation
 from ..warnings import BrokenLinkWarning
 from ...build import (Builder, GroupBuilder, DatasetBuilder, LinkBuilder, BuildManager, RegionBuilder,
                       ReferenceBuilder, TypeMap, ObjectMapper)
 from ...container import Container
-from ...data_utils import AbstractDataChunkIterator
+from ...data_utils import AbstractDataChunkIterator, DataChunk, GenericDataChunkIterator
 from ...spec import RefSpec, DtypeSpec, NamespaceCatalog
-from ...utils import docval, getargs, popargs, get_data_shape, get_docval, StrDataset
-from ..utils import NamespaceToBuilderHelper, WriteStatusTracker
+from ...utils import (docval, getargs, popargs, get_data_shape, get_docval, StrDataset,
+                      skip_docval_validation)
+from ..utils import IOStats, NamespaceToBuilderHelper, WriteStatusTracker
 
 ROOT_NAME = 'root'
 SPEC_LOC_ATTR = '.specloc'
@@ -30,9 +39,180 @@ H5_REF = special_dtype(ref=Reference)
 H5_REGREF = special_dtype(ref=RegionReference)
 
 RDCC_NBYTES = 32*2**20  # set raw data chunk cache size = 32 MiB
+CHUNK_CACHE_BUDGET = 256*2**20  # default total size of the chunk caches sized automatically by HDF5IO = 256 MiB
 
 H5PY_3 = h5py.__version__.startswith('3')
 
+STRUCTURE_CACHE_VERSION = 1  # increment when the format of cached file structures changes
+
+
+def _new_builder(cls):
+    return dict.__new__(cls)
+
+
+def _set_builder_state(builder, state):
+    items, attrs = state
+    dict.update(builder, items)
+    builder.__dict__.update(attrs)
+
+
+def _memmap_dataset(dset):
+    """
+    Get a read-only numpy.memmap of the data of the given h5py Dataset
+
+    The data of a dataset can only be mapped into memory if it is stored contiguously and unfiltered in a file on disk,
+    has been allocated, and has a numeric or boolean data type. Return None if the dataset cannot be mapped.
+    """
+    if dset.shape is None or len(dset.shape) == 0 or dset.dtype.kind not in 'biufc':
+        return None
+    if dset.file.mode != 'r' or dset.file.driver not in ('sec2', 'stdio'):
+        return None
+    dcpl = dset.id.get_create_plist()
+    if dcpl.get_layout() != h5py.h5d.CONTIGUOUS or dcpl.get_nfilters() > 0 or dcpl.get_external_count() > 0:
+        return None
+    offset = dset.id.get_offset()
+    if offset is None:  # storage has not been allocated
+        return None
+    return np.memmap(dset.file.filename, dtype=dset.dtype, mode='r', offset=offset, shape=dset.shape, order='C')
+
+
+def _object_path(parent, name):
+    """Get the path of the object with the given name in the given h5py Group"""
+    return parent.name.rstrip('/') + '/' + name
+
+
+def _object_address(id):
+    """Get the address of the HDF5 object with the given h5py ObjectID in its file, or the given address"""
+    if isinstance(id, int):
+        return id
+    return h5py.h5o.get_info(id).addr
+
+
+def _timed(operation, get_path=None):
+    """
+    Decorator for methods of HDF5IO that records the calls of the given operation and the time spent in it if I/O
+    statistics are enabled. get_path is called with the arguments of the method to get the path of the object that the
+    operation is applied to.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if self._io_stats is None:
+                return func(self, *args, **kwargs)
+            path = None if get_path is None else get_path(*args, **kwargs)
+            with self._io_stats.timed(operation, path):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _next_prime(n):
+    """Get the smallest prime number that is greater than or equal to n"""
+    n = max(n, 2)
+    while any(n % i == 0 for i in range(2, math.isqrt(n) + 1)):
+        n += 1
+    return n
+
+
+def _auto_chunk_cache(shape, chunks, itemsize):
+    """
+    Get the size in bytes and the number of slots of a chunk cache that fits the chunks of a dataset that are read
+    when reading a slice of the dataset that spans all dimensions but one, e.g., a row or a column of a 2D dataset
+
+    Holding all of these chunks in the cache means that reading the data row by row or column by column reads each
+    chunk from the file only once. The number of slots is a prime number about 100 times the number of chunks in the
+    cache, as recommended by the HDF5 documentation.
+    """
+    grid = [max(1, -(-s // c)) for s, c in zip(shape, chunks)]
+    nchunks = max(math.prod(grid[:i] + grid[i+1:]) for i in range(len(grid)))
+    chunk_nbytes = math.prod(chunks) * itemsize
+    return chunk_nbytes * nchunks, _next_prime(min(100 * nchunks, 2**24))
+
+
+class _StructurePickler(pickle.Pickler):
+    """Pickle a hierarchy of builders read from an HDF5 file, storing datasets by their path in the file"""
+
+    def __init__(self, file, filename):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.__filename = filename
+
+    def persistent_id(self, obj):
+        if isinstance(obj, np.memmap):
+            if os.path.abspath(obj.filename) != os.path.abspath(self.__filename):
+                raise pickle.PicklingError("cannot cache memory-mapped data from another file")
+            return 'memmap', (obj.offset, obj.dtype, obj.shape)
+        if isinstance(obj, StrDataset):
+            kind, dset = 'str', obj.dset
+        elif isinstance(obj, BuilderH5RegionDataset):
+            kind, dset = 'region_ref', obj.dataset
+        elif isinstance(obj, BuilderH5ReferenceDataset):
+            kind, dset = 'ref', obj.dataset
+        elif isinstance(obj, BuilderH5TableDataset):
+            kind, dset = 'compound', obj.dataset
+        elif isinstance(obj, Dataset):
+            kind, dset = 'dataset', obj
+        else:
+            return None
+        if dset.file.filename != self.__filename:
+            raise pickle.PicklingError("cannot cache dataset '%s' from another file" % dset.name)
+        return kind, dset.name
+
+    def reducer_override(self, obj):
+        if isinstance(obj, Builder):
+            # Builders are dicts that do not support __setitem__, so set the dict items and attributes directly
+            return _new_builder, (type(obj),), (dict(dict.items(obj)), vars(obj)), None, None, _set_builder_state
+        return NotImplemented
+
+
+class _StructureUnpickler(pickle.Unpickler):
+    """
+    Unpickle a hierarchy of builders pickled with _StructurePickler, opening datasets from the given HDF5IO
+
+    Only the classes and functions needed to restore builders and their attribute values can be loaded, so that a
+    cache file that was tampered with cannot run arbitrary code when it is loaded.
+    """
+
+    __allowed_globals = {
+        'builtins': {'bool', 'bytearray', 'bytes', 'complex', 'dict', 'float', 'frozenset', 'int', 'list', 'set',
+                     'slice', 'str', 'tuple'},
+        'hdmf.build.builders': {'GroupBuilder', 'DatasetBuilder', 'LinkBuilder', 'ReferenceBuilder', 'RegionBuilder'},
+        __name__: {'_new_builder', '_set_builder_state'},
+        'numpy': {'dtype', 'ndarray'},
+        'numpy.core.multiarray': {'_reconstruct', 'scalar'},
+        'numpy._core.multiarray': {'_reconstruct', 'scalar'},
+        'numpy.core.numeric': {'_frombuffer'},
+        'numpy._core.numeric': {'_frombuffer'},
+    }
+
+    def __init__(self, file, io):
+        super().__init__(file)
+        self.__io = io
+        self.__fid = io._file.id
+
+    def find_class(self, module, name):
+        if module == 'numpy.dtypes' and name.endswith('DType'):
+            return super().find_class(module, name)
+        if name not in self.__allowed_globals.get(module, ()):
+            raise pickle.UnpicklingError("'%s.%s' is not allowed in a structure cache file" % (module, name))
+        return super().find_class(module, name)
+
+    def persistent_load(self, pid):
+        kind, path = pid
+        if kind == 'memmap':
+            offset, dtype, shape = path
+            return np.memmap(self.__io._file.filename, dtype=dtype, mode='r', offset=offset, shape=shape, order='C')
+        name = path.encode('UTF-8')
+        dset = Dataset(self.__io._reopen_with_chunk_cache(self.__fid, name, h5py.h5o.open(self.__fid, name), path))
+        if kind == 'str':
+            return StrDataset(dset, None)
+        elif kind == 'region_ref':
+            return BuilderH5RegionDataset(dset, self.__io)
+        elif kind == 'ref':
+            return BuilderH5ReferenceDataset(dset, self.__io)
+        elif kind == 'compound':
+            return BuilderH5TableDataset(dset, self.__io, HDF5IO._get_ref_cols(dset.dtype))
+        return dset
+
 
 class HDF5IO(HDMFIO):
 
@@ -69,7 +249,58 @@ class HDF5IO(HDMFIO):
                 'default': None
             },
             {'name': 'herd_path', 'type': str,
-             'doc': 'The path to read/write the HERD file', 'default': None},)
+             'doc': 'The path to read/write the HERD file', 'default': None},
+            {'name': 'lazy', 'type': bool,
+             'doc': ('If True, read the hierarchy of the file on demand, i.e., the subgroups, datasets, and links of '
+                     'a group are read only when they are first accessed. If False (default), the whole hierarchy '
+                     'is read when the file is read.'),
+             'default': False},
+            {'name': 'cache_dir', 'type': (str, Path),
+             'doc': ('a directory in which to cache the structure of the file, i.e., its groups, datasets, links, and '
+                     'attributes, when the file is read in "r" mode. If the file has not been modified since it was '
+                     'cached, its structure is read from the cache instead of from the file. Only use a directory '
+                     'that is trusted and that cannot be written by other users.'),
+             'default': None},
+            {'name': 'memmap', 'type': bool,
+             'doc': ('If True and the file is opened in "r" mode, read the data of datasets that are stored '
+                     'contiguously and unfiltered and have a numeric or boolean data type as read-only '
+                     'numpy.memmap arrays that map the data in the file into memory instead of as h5py.Dataset '
+                     'objects.'),
+             'default': False},
+            {'name': 'chunk_cache', 'type': (str, dict),
+             'doc': ('the chunk cache settings to use for chunked datasets. If "auto", the chunk cache of each '
+                     'chunked dataset is sized to hold the chunks that are read when reading a slice of the dataset '
+                     'along any dimension, e.g., a row or a column of a 2D dataset, until "chunk_cache_budget" is '
+                     'used up. Chunk caches are never made smaller than the chunk cache of the file. If a dict, map '
+                     'the paths of datasets to dicts with the "rdcc_nbytes", "rdcc_nslots", and/or "rdcc_w0" '
+                     'settings to use for the dataset. If None (default), all datasets use the chunk cache settings '
+                     'of the file.'),
+             'default': None},
+            {'name': 'chunk_cache_budget', 'type': int,
+             'doc': 'the total size in bytes of the chunk caches sized automatically when chunk_cache="auto"',
+             'default': CHUNK_CACHE_BUDGET},
+            {'name': 'io_stats', 'type': bool,
+             'doc': 'If True, record statistics of the operations of this IO object. See get_io_stats.',
+             'default': False},
+            {'name': 'io_stats_callback', 'type': Callable,
+             'doc': ('a function to call with the name of the operation, the path of the object (or None), and the '
+                     'time in seconds spent in the operation each time a timed operation finishes. Setting a '
+                     'callback enables I/O statistics.'),
+             'default': None},
+            {'name': 'dci_prefetch_workers', 'type': int,
+             'doc': ('the number of threads that read chunks from DataChunkIterators ahead of the writes when '
+                     'exhausting them, so that reading and writing overlap. If None (default), chunks are read and '
+                     'written in turn.'),
+             'default': None},
+            {'name': 'dci_prefetch_max_bytes', 'type': int,
+             'doc': 'the maximum number of bytes of chunks read ahead of the writes if dci_prefetch_workers is set',
+             'default': PREFETCH_MAX_BYTES},
+            {'name': 'dci_max_buffer_bytes', 'type': int,
+             'doc': ('the maximum total number of bytes of the buffers of the DataChunkIterators that are exhausted '
+                     'concurrently, e.g., with exhaust_dci=False. The buffers of GenericDataChunkIterators are '
+                     'shrunk to fit and iterators are started only when their buffers fit. If None (default), the '
+                     'buffers are not limited.'),
+             'default': None},)
     def __init__(self, **kwargs):
         """Open an HDF5 file for IO.
         """
@@ -78,6 +309,17 @@ class HDF5IO(HDMFIO):
                                                                                        'comm', 'file', 'driver',
                                                                                        'aws_region', 'herd_path',
                                                                                        kwargs)
+        lazy, cache_dir, memmap = popargs('lazy', 'cache_dir', 'memmap', kwargs)
+        chunk_cache, chunk_cache_budget = popargs('chunk_cache', 'chunk_cache_budget', kwargs)
+        io_stats, io_stats_callback = popargs('io_stats', 'io_stats_callback', kwargs)
+        dci_prefetch_workers, dci_prefetch_max_bytes = popargs('dci_prefetch_workers', 'dci_prefetch_max_bytes', kwargs)
+        dci_max_buffer_bytes = popargs('dci_max_buffer_bytes', kwargs)
+        if isinstance(chunk_cache, str) and chunk_cache != 'auto':
+            raise ValueError("chunk_cache must be 'auto', a dict, or None, got '%s'" % chunk_cache)
+        if dci_prefetch_workers is not None and dci_prefetch_workers < 1:
+            raise ValueError("dci_prefetch_workers must be a positive integer, got %d" % dci_prefetch_workers)
+        if dci_max_buffer_bytes is not None and dci_max_buffer_bytes < 1:
+            raise ValueError("dci_max_buffer_bytes must be a positive integer, got %d" % dci_max_buffer_bytes)
 
         self.__open_links = []  # keep track of other files opened from links in this file
         self.__file = None  # This will be set below, but set to None first in case an error occurs and we need to close
@@ -98,15 +340,35 @@ class HDF5IO(HDMFIO):
             manager = BuildManager(manager)
         self.__driver = driver
         self.__aws_region = aws_region
+        self.__lazy = lazy
+        self.__lazy_read = False  # whether the builders of the file are being read lazily
+        self.__abspaths = dict()  # cache of absolute paths of the files that objects are read from
+        self.__cache_dir = str(cache_dir) if cache_dir is not None else None
+        self.__memmap = memmap
+        self.__chunk_cache = chunk_cache
+        self.__chunk_cache_budget = chunk_cache_budget
+        self.__chunk_cache_used = 0  # total size of the chunk caches sized automatically
+        self._io_stats = IOStats(io_stats_callback) if io_stats or io_stats_callback is not None else None
+        self.__object_id_index = None  # map from object ID to the path of the object in the file
+        self.__data_type_index = None  # map from path of the object in the file to its namespace and data type
+        self.__ref_builders = dict()  # map from (file path, object address) to builder of referenced objects
+        self.__lazy_pending = deque()  # paths of lazily read builders that still need to be attached to a parent
+        self.__lazy_loading = 0  # depth of nested calls to lazy loaders of GroupBuilders
+        self.__lazy_resolving = False
         self.__comm = comm
         self.__mode = mode
         self.__file = file_obj
         super().__init__(manager, source=path, herd_path=herd_path)
         # NOTE: source is not set if path is None and file_obj is passed
         self.__built = dict() # keep track of each builder for each dataset/group/link for each file
+        self.__tree = None  # the links and objects of the file while the whole file is read (see __index_tree)
         self.__read = dict() # keep track of which files have been read. Key is the filename value is the builder
         self.__ref_queue = deque()  # a queue of the references that need to be added
-        self.__dci_queue = HDF5IODataChunkIteratorQueue()  # a queue of DataChunkIterators that need to be exhausted
+        # a queue of DataChunkIterators that need to be exhausted
+        self.__dci_queue = HDF5IODataChunkIteratorQueue(io_stats=self._io_stats,
+                                                        prefetch_workers=dci_prefetch_workers,
+                                                        prefetch_max_bytes=dci_prefetch_max_bytes,
+                                                        max_buffer_bytes=dci_max_buffer_bytes)
         ObjectMapper.no_convert(Dataset)
         self._written_builders = WriteStatusTracker()  # track which builders were written (or read) by this IO object
 
@@ -127,6 +389,61 @@ class HDF5IO(HDMFIO):
     def aws_region(self):
         return self.__aws_region
 
+    @property
+    def cache_dir(self):
+        """The directory in which the structure of the file is cached, or None if it is not cached"""
+        return self.__cache_dir
+
+    @property
+    def lazy(self):
+        """Whether the hierarchy of the file is read on demand."""
+        return self.__lazy
+
+    def get_io_stats(self):
+        """
+        Get the statistics of the operations of this IO object, or None if I/O statistics are not enabled
+
+        The statistics are a dict with the following keys:
+
+        * 'operations': maps the name of each operation, i.e., 'read_group', 'read_dataset', 'write_group',
+          'write_dataset', 'list_fill', 'scalar_fill', 'add_refs', and 'exhaust_dci', to a dict with the number of
+          'calls' and the total 'time' in seconds
+        * 'objects': maps the path of each group and dataset to a dict of counters, i.e., the time spent in each
+          operation on the object, e.g., 'read_dataset_time' (including the time spent reading the children of
+          groups), 'bytes_read' and 'read_calls' for scalar datasets, which are read eagerly, 'bytes_written'
+          (uncompressed, counting the UTF-8 encoded length of variable-length strings, and not recorded for
+          variable-length datasets that are copied from other files), 'chunks_written', 'chunks_skipped',
+          'write_calls', 'attributes_read', 'attributes_written', and 'dci_wait_time', the time that the
+          DataChunkIterator of a dataset waited for the memory budget set by dci_max_buffer_bytes, or for prefetch
+          threads and read-ahead bytes
+        * 'counters': maps the name of each counter of the file, i.e., 'references_resolved' and
+          'references_written', to its value
+        """
+        if self._io_stats is None:
+            return None
+        return self._io_stats.get()
+
+    def reset_io_stats(self):
+        """Reset the statistics of the operations of this IO object"""
+        if self._io_stats is not None:
+            self._io_stats.reset()
+
+    def __timed(self, operation, path=None):
+        """Get a context manager that records the time spent in the given operation if I/O statistics are enabled"""
+        if self._io_stats is None:
+            return nullcontext()
+        return self._io_stats.timed(operation, path)
+
+    @property
+    def chunk_cache(self):
+        """The chunk cache settings to use for chunked datasets, 'auto', or None to use the settings of the file."""
+        return self.__chunk_cache
+
+    @property
+    def memmap(self):
+        """Whether the data of contiguous, unfiltered numeric datasets is read as numpy.memmap arrays."""
+        return self.__memmap
+
     @classmethod
     def __check_path_file_obj(cls, path, file_obj):
         if isinstance(path, Path):
@@ -383,7 +700,24 @@ class HDF5IO(HDMFIO):
              'default': True},
             {'name': 'herd', 'type': 'hdmf.common.resources.HERD',
              'doc': 'A HERD object to populate with references.',
-             'default': None})
+             'default': None},
+            {'name': 'checkpoint', 'type': (str, Path),
+             'doc': ('The path of a file to record the progress of writing DataChunkIterators in, so that the write '
+                     'can be completed with resume_write if it is interrupted. The DataChunkIterators are written '
+                     'after the rest of the file and must be picklable. The pickled DataChunkIterators are stored '
+                     'once in a second file named after the checkpoint file with the suffix ".iterators". The files '
+                     'are removed when the write is done.'),
+             'default': None},
+            {'name': 'checkpoint_chunks', 'type': int,
+             'doc': ('the number of chunks written after which the checkpoint file is saved, or None (default) to '
+                     'save it only after checkpoint_interval seconds'),
+             'default': None},
+            {'name': 'checkpoint_interval', 'type': (int, float),
+             'doc': ('the number of seconds after which the checkpoint file is saved when the next chunk is '
+                     'written, or None to save it only after checkpoint_chunks chunks. The checkpoint file is also '
+                     'saved when a DataChunkIterator is exhausted. Chunks written after the checkpoint file was last '
+                     'saved are written again when the write is resumed.'),
+             'default': 10.0, 'allow_none': True})
     def write(self, **kwargs):
         """Write the container to an HDF5 file."""
         if self.__mode == 'r':
@@ -391,10 +725,78 @@ class HDF5IO(HDMFIO):
                                         "Please use mode 'r+', 'w', 'w-', 'x', or 'a'")
                                        % (self.source, self.__mode))
 
-        cache_spec = popargs('cache_spec', kwargs)
-        super().write(**kwargs)
+        cache_spec, checkpoint, checkpoint_chunks, checkpoint_interval = popargs(
+            'cache_spec', 'checkpoint', 'checkpoint_chunks', 'checkpoint_interval', kwargs)
+        if checkpoint is None:
+            super().write(**kwargs)
+            if cache_spec:
+                self.__cache_spec()
+            return
+        # cache the specification first so that the file is complete once the DataChunkIterators are written
         if cache_spec:
             self.__cache_spec()
+        checkpoint = HDF5IODataChunkIteratorCheckpoint(str(checkpoint), self.__file, save_chunks=checkpoint_chunks,
+                                                       save_interval=checkpoint_interval)
+        self.__dci_queue.checkpoint = checkpoint
+        try:
+            super().write(**kwargs)
+        finally:
+            self.__dci_queue.checkpoint = None
+        checkpoint.remove()
+
+    @docval({'name': 'checkpoint', 'type': (str, Path),
+             'doc': 'the path of the checkpoint file recorded by an interrupted call to write'},
+            {'name': 'checkpoint_chunks', 'type': int,
+             'doc': ('the number of chunks written after which the checkpoint file is saved, or None (default) to '
+                     'save it only after checkpoint_interval seconds'),
+             'default': None},
+            {'name': 'checkpoint_interval', 'type': (int, float),
+             'doc': ('the number of seconds after which the checkpoint file is saved when the next chunk is '
+                     'written, or None to save it only after checkpoint_chunks chunks'),
+             'default': 10.0, 'allow_none': True})
+    def resume_write(self, **kwargs):
+        """Complete an interrupted write of the DataChunkIterators of this file from a checkpoint file.
+
+        The DataChunkIterators are unpickled from the checkpoint file and the chunks that were written before the
+        write was interrupted are skipped. The checkpoint file is updated while the remaining chunks are written and
+        removed when the write is done.
+        """
+        if self.__mode == 'r':
+            raise UnsupportedOperation(("Cannot write to file %s in mode '%s'. Please use mode 'r+' or 'a'")
+                                       % (self.source, self.__mode))
+        path, checkpoint_chunks, checkpoint_interval = getargs('checkpoint', 'checkpoint_chunks',
+                                                               'checkpoint_interval', kwargs)
+        path = str(path)
+        checkpoint = HDF5IODataChunkIteratorCheckpoint(path, self.__file, HDF5IODataChunkIteratorCheckpoint.load(path),
+                                                       save_chunks=checkpoint_chunks, save_interval=checkpoint_interval)
+        for dset_path, progress in checkpoint.datasets.items():
+            if progress['done']:
+                continue
+            data = pickle.loads(progress['iterator'])
+            if isinstance(data, GenericDataChunkIterator):
+                if 'buffer_shape' in progress:
+                    data.shrink_buffer(buffer_shape=progress['buffer_shape'])
+                data.skip_buffers(progress['chunks_written'])
+            else:
+                for _ in range(progress['chunks_written']):
+                    next(data)
+            options = dict(progress['dataio'])
+            dataio = None
+            if len(options) > 0:
+                # wrap the iterator in an H5DataIO with the options of the H5DataIO that wrapped it originally
+                if 'chunk_processors' in progress:
+                    options['chunk_processors'] = pickle.loads(progress['chunk_processors'])
+                io_settings = options.pop('io_settings')
+                dataio = H5DataIO(data=data, **io_settings, **options)
+            dset = self.__file[dset_path]
+            checkpoint.resume(dset, data, dataio=dataio)
+            self.__dci_queue.append(dataset=dset, data=data, dataio=dataio)
+        self.__dci_queue.checkpoint = checkpoint
+        try:
+            self.__dci_queue.exhaust_queue()
+        finally:
+            self.__dci_queue.checkpoint = None
+        checkpoint.remove()
 
     def __cache_spec(self):
         ref = self.__file.attrs.get(SPEC_LOC_ATTR)
@@ -497,6 +899,15 @@ class HDF5IO(HDMFIO):
             raise UnsupportedOperation("Cannot read from file %s in mode '%s'. Please use mode 'r', 'r+', or 'a'."
                                        % (self.source, self.__mode))
         try:
+            paths = kwargs.get('paths')
+            if paths is not None and self.__file:
+                if self.__read.get(self.__file) is None:
+                    # read only the groups that are needed to find the requested objects
+                    self.__read_root(lazy=True)
+                if self.__lazy_read:
+                    # find the objects of the requested data types from their attributes so that the groups that do
+                    # not contain them are not loaded
+                    kwargs['paths'] = self.__resolve_data_type_paths(paths)
             return super().read(**kwargs)
         except UnsupportedOperation as e:
             if str(e) == 'Cannot build data. There are no values.':  # pragma: no cover
@@ -515,16 +926,87 @@ class HDF5IO(HDMFIO):
         if not self.__file:
             raise UnsupportedOperation("Cannot read data from closed HDF5 file '%s'" % self.source)
         f_builder = self.__read.get(self.__file)
+        if f_builder is None:
+            # the builders are constructed from the contents of the file, so skip checking their arguments
+            with skip_docval_validation():
+                f_builder = self.__read_root(lazy=self.__lazy)
+        return f_builder
+
+    def __read_root(self, lazy):
+        """Read the root GroupBuilder of the file. If lazy, the contents of groups are read on first access."""
         # ignore cached specs when reading builder
         ignore = set()
         specloc = self.__file.attrs.get(SPEC_LOC_ATTR)
         if specloc is not None:
             ignore.add(self.__file[specloc].name)
-        if f_builder is None:
-            f_builder = self.__read_group(self.__file, ROOT_NAME, ignore=ignore)
+        self.__lazy_read = lazy
+        cache_path = self.__get_cache_path()
+        f_builder = None
+        if cache_path is not None:
+            f_builder = self.__load_cached_structure(cache_path)
+        if f_builder is not None:
             self.__read[self.__file] = f_builder
+            return f_builder
+        if not lazy:
+            self.__tree = self.__index_tree()
+        try:
+            f_builder = self.__read_group(self.__file, ROOT_NAME, ignore=ignore)
+        finally:
+            self.__tree = None
+        self.__read[self.__file] = f_builder
+        self.__resolve_lazy_pending()
+        if cache_path is not None and not lazy:
+            self.__cache_structure(cache_path, f_builder)
+        return f_builder
+
+    def __get_cache_path(self):
+        """Get the path of the file that caches the structure of the file, or None if it cannot be cached"""
+        if self.__cache_dir is None or self.__mode != 'r' or self.__comm is not None:
+            return None
+        if self.source is None or not os.path.isfile(self.source):
+            return None
+        from ... import __version__
+        stat = os.stat(self.source)
+        key = repr((STRUCTURE_CACHE_VERSION, __version__, self.source, stat.st_size, stat.st_mtime_ns,
+                    self.__memmap))
+        return os.path.join(self.__cache_dir, hashlib.sha256(key.encode('UTF-8')).hexdigest() + '.pkl')
+
+    def __load_cached_structure(self, cache_path):
+        """Read the root GroupBuilder from the given cache file. Return None if it cannot be read."""
+        if not os.path.isfile(cache_path):
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                f_builder = _StructureUnpickler(f, self).load()
+        except Exception as e:
+            self.logger.debug("Could not read cached structure of '%s' from '%s': %s" % (self.source, cache_path, e))
+            return None
+        stack = [f_builder]
+        while len(stack) > 0:
+            builder = stack.pop()
+            self.__set_written(builder)
+            if isinstance(builder, GroupBuilder):
+                stack.extend(builder.groups.values())
+                stack.extend(builder.datasets.values())
+                stack.extend(builder.links.values())
         return f_builder
 
+    def __cache_structure(self, cache_path, f_builder):
+        """Write the hierarchy of the given root GroupBuilder to the given cache file if possible"""
+        tmp_path = None
+        try:
+            os.makedirs(self.__cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=self.__cache_dir, suffix='.tmp', delete=False) as f:
+                tmp_path = f.name
+                _StructurePickler(f, self.__file.filename).dump(f_builder)
+            os.replace(tmp_path, cache_path)  # replace atomically so that readers never see a partial cache file
+        except Exception as e:
+            # e.g., the file links to other files, has attributes that cannot be pickled, or the cache directory
+            # cannot be written
+            self.logger.debug("Could not cache structure of '%s' in '%s': %s" % (self.source, self.__cache_dir, e))
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     def __set_written(self, builder):
         """
         Helper function used to set the written status for builders
@@ -550,11 +1032,11 @@ class HDF5IO(HDMFIO):
 
         :param fpath: Path to the HDF5 file containing the object
         :type fpath: str
-        :param id: ID of the HDF5 object in the path
-        :type id: h5py GroupID object
+        :param id: ID or address of the HDF5 object in the path
+        :type id: h5py GroupID object or int
         :param builder: The builder to be cached
         """
-        self.__built.setdefault(fpath, dict()).setdefault(id, builder)
+        self.__built.setdefault(fpath, dict()).setdefault(_object_address(id), builder)
 
     def __get_built(self, fpath, id):
         """
@@ -562,15 +1044,15 @@ class HDF5IO(HDMFIO):
 
         :param fpath: Path to the HDF5 file containing the object
         :type fpath: str
-        :param id: ID of the HDF5 object in the path
-        :type id: h5py GroupID object
+        :param id: ID or address of the HDF5 object in the path
+        :type id: h5py GroupID object or int
 
         :return: Builder in the self.__built cache or None
         """
 
         fdict = self.__built.get(fpath)
         if fdict:
-            return fdict.get(id)
+            return fdict.get(_object_address(id))
         else:
             return None
 
@@ -585,11 +1067,42 @@ class HDF5IO(HDMFIO):
         h5obj = getargs('h5obj', kwargs)
         fpath = h5obj.file.filename
         builder = self.__get_built(fpath, h5obj.id)
+        if builder is None and self.__file is not None and fpath == self.__file.filename:
+            # the object may not have been read yet (when reading lazily) or may have been read from a cache.
+            # read the groups along the path to the object, which builds the object with the correct parents
+            builder = self.__get_lazy(h5obj.name)
+            if isinstance(builder, LinkBuilder):
+                builder = builder.builder
+            if isinstance(builder, (GroupBuilder, DatasetBuilder)):
+                self.__set_built(fpath, h5obj.id, builder)
+            else:
+                builder = None
         if builder is None:
             msg = '%s:%s has not been built' % (fpath, h5obj.name)
             raise ValueError(msg)
         return builder
 
+    def _get_ref_builders(self, h5file, addresses, read_refs):
+        """
+        Get the builders for the objects at the given addresses that object references point to, caching them by the
+        object address
+
+        :param h5file: the h5py File containing the object references
+        :param addresses: the unique addresses of the objects that the object references point to
+        :param read_refs: a function that reads the object references to the objects at the given positions in
+                          addresses. It is only called for the objects whose builders are not cached.
+        """
+        fpath = h5file.filename
+        builders = [self.__ref_builders.get((fpath, address)) for address in addresses]
+        if self._io_stats is not None:
+            self._io_stats.count(references_resolved=len(addresses))
+        missing = [i for i, builder in enumerate(builders) if builder is None]
+        if missing:
+            for i, ref in zip(missing, read_refs(missing)):
+                builders[i] = self.get_builder(h5file[ref])
+                self.__ref_builders[(fpath, addresses[i])] = builders[i]
+        return builders
+
     @docval({'name': 'h5obj', 'type': (Dataset, Group),
              'doc': 'the HDF5 object to the corresponding Container/Data object for'})
     def get_container(self, **kwargs):
@@ -603,87 +1116,441 @@ class HDF5IO(HDMFIO):
         container = self.manager.construct(builder)
         return container
 
-    def __read_group(self, h5obj, name=None, ignore=set()):
+    @docval({'name': 'object_id', 'type': str, 'doc': 'the object ID of the container to read'},
+            returns='the Container with the given object ID', rtype=Container)
+    def get_container_by_id(self, **kwargs):
+        """
+        Read and construct only the container with the given object ID
+
+        The object IDs of the objects in the file are indexed on first use, either from the builders that have
+        already been read or, if the file has not been read or is read lazily, by reading only the object ID
+        attribute of each object in the file. The container is then read as with :py:meth:`read` with ``paths``.
+
+        :raises ValueError: When there is no object with the given object ID in the file
+        """
+        object_id = getargs('object_id', kwargs)
+        path = self.__get_object_id_index().get(object_id)
+        if path is None:
+            raise ValueError("No object with object ID '%s' found in file '%s'" % (object_id, self.source))
+        return self.read(paths=[path])[path]
+
+    def __get_object_id_index(self):
+        """Get the map from object ID to path of the objects in the file, building it if needed"""
+        if self.__object_id_index is None:
+            f_builder = self.__read.get(self.__file)
+            if f_builder is not None and not self.__lazy_read:
+                self.__object_id_index = self.__index_builder_object_ids(f_builder)
+            else:
+                self.__object_id_index = self.__index_file_object_ids()
+        return self.__object_id_index
+
+    def __get_id_key(self):
+        return self.manager.namespace_catalog.group_spec_cls.id_key()
+
+    def __index_builder_object_ids(self, f_builder):
+        """Map the object IDs of the given root builder and its descendants to their paths in the file.
+
+        Links and the contents of groups that have not been loaded yet are not indexed.
+        """
+        id_key = self.__get_id_key()
+        ret = dict()
+        stack = [(f_builder, '/')]
+        while len(stack) > 0:
+            builder, path = stack.pop()
+            object_id = builder.attributes.get(id_key)
+            if object_id is not None:
+                ret[object_id] = path
+            if isinstance(builder, GroupBuilder) and builder.loaded:
+                prefix = path.rstrip('/') + '/'
+                for sub_builder in itertools.chain(builder.groups.values(), builder.datasets.values()):
+                    stack.append((sub_builder, prefix + sub_builder.name))
+        return ret
+
+    def __index_file_object_ids(self):
+        """Map the object IDs of the objects in the file to their paths, reading only the object ID attributes"""
+        fid = self.__file.id
+        id_key = self.__get_id_key().encode('UTF-8')
+        ret = dict()
+
+        def add_object_id(name):
+            value = self.__read_str_attr(fid, name, id_key)
+            if value is not None:
+                ret[value] = '/' if name == b'.' else '/' + name.decode('UTF-8')
+
+        add_object_id(b'.')
+        h5py.h5o.visit(fid, add_object_id)
+        return ret
+
+    @staticmethod
+    def __read_str_attr(fid, name, key):
+        """Read the string attribute with the given key of the object with the given name, or None if it is missing"""
+        if not h5py.h5a.exists(fid, key, obj_name=name):
+            return None
+        attr = h5py.h5a.open(fid, key, obj_name=name)
+        value = np.zeros(attr.shape, dtype=attr.dtype)
+        attr.read(value, mtype=h5py.h5t.py_create(attr.dtype))
+        value = value[()]
+        if isinstance(value, bytes):
+            value = value.decode('UTF-8')
+        return value
+
+    def __get_data_type_index(self):
+        """
+        Get the map from the path of each object in the file to its namespace and data type, building it if needed by
+        reading only the namespace and data type attributes of each object
+        """
+        if self.__data_type_index is None:
+            fid = self.__file.id
+            catalog = self.manager.namespace_catalog
+            type_keys = [key.encode('UTF-8') for key in {catalog.group_spec_cls.type_key(),
+                                                          catalog.dataset_spec_cls.type_key()}]
+            index = dict()
+
+            def add_data_type(name):
+                for type_key in type_keys:
+                    data_type = self.__read_str_attr(fid, name, type_key)
+                    if data_type is not None:
+                        namespace = self.__read_str_attr(fid, name, b'namespace')
+                        if namespace is not None:
+                            index['/' if name == b'.' else '/' + name.decode('UTF-8')] = (namespace, data_type)
+                        return
+
+            add_data_type(b'.')
+            h5py.h5o.visit(fid, add_data_type)
+            self.__data_type_index = index
+        return self.__data_type_index
+
+    def __resolve_data_type_paths(self, paths):
+        """
+        Replace the data types in the given paths for :py:meth:`read` with the paths of the objects of these data
+        types, except for the objects within another object of these data types, which are constructed with it
+        """
+        data_types = [path for path in paths if isinstance(path, str) and not path.startswith('/')]
+        if len(data_types) == 0:
+            return paths
+        catalog = self.manager.namespace_catalog
+        namespaces = set(catalog.namespaces)
+        found = set()
+        # visit the parents before their children to skip the objects within objects that were found
+        for path, (namespace, data_type) in sorted(self.__get_data_type_index().items(),
+                                                   key=lambda item: (item[0].count('/'), item[0])):
+            if path == '/':
+                ancestors = []
+            else:
+                names = path.split('/')
+                ancestors = ['/'] + ['/'.join(names[:i]) for i in range(2, len(names))]
+            if namespace not in namespaces or any(ancestor in found for ancestor in ancestors):
+                continue
+            if any(catalog.is_sub_data_type(namespace, data_type, dt) for dt in data_types):
+                found.add(path)
+        return [path for path in paths if path not in data_types] + sorted(found)
+
+    @_timed('read_group', lambda h5obj, name=None, ignore=None, path=None, source=None: path or h5obj.name)
+    def __read_group(self, h5obj, name=None, ignore=set(), path=None, source=None):
         kwargs = {
             "attributes": self.__read_attrs(h5obj),
-            "groups": dict(),
-            "datasets": dict(),
-            "links": dict()
         }
 
         for key, val in kwargs['attributes'].items():
             if isinstance(val, bytes):
                 kwargs['attributes'][key] = val.decode('UTF-8')
 
+        if path is None:
+            path = h5obj.name
         if name is None:
-            name = str(os.path.basename(h5obj.name))
-        for k in h5obj:
-            sub_h5obj = h5obj.get(k)
-            if sub_h5obj is not None:
-                if sub_h5obj.name in ignore:
-                    continue
-                link_type = h5obj.get(k, getlink=True)
-                if isinstance(link_type, (SoftLink, ExternalLink)):
-                    # Reading links might be better suited in its own function
-                    # get path of link (the key used for tracking what's been built)
-                    target_path = link_type.path
-                    target_obj = sub_h5obj.file[target_path]
-                    builder_name = os.path.basename(target_path)
-                    # get builder if already read, else build it
-                    builder = self.__get_built(sub_h5obj.file.filename, target_obj.id)
-                    if builder is None:
-                        # NOTE: all links must have absolute paths
-                        if isinstance(target_obj, Dataset):
-                            builder = self.__read_dataset(target_obj, builder_name)
-                        else:
-                            builder = self.__read_group(target_obj, builder_name, ignore=ignore)
-                        self.__set_built(sub_h5obj.file.filename, target_obj.id, builder)
-                    link_builder = LinkBuilder(builder=builder, name=k, source=os.path.abspath(h5obj.file.filename))
-                    link_builder.location = h5obj.name
-                    self.__set_written(link_builder)
-                    kwargs['links'][builder_name] = link_builder
-                    if isinstance(link_type, ExternalLink):
-                        self.__open_links.append(sub_h5obj)
-                else:
-                    builder = self.__get_built(sub_h5obj.file.filename, sub_h5obj.id)
-                    obj_type = None
-                    read_method = None
-                    if isinstance(sub_h5obj, Dataset):
-                        read_method = self.__read_dataset
-                        obj_type = kwargs['datasets']
-                    else:
-                        read_method = partial(self.__read_group, ignore=ignore)
-                        obj_type = kwargs['groups']
-                    if builder is None:
-                        builder = read_method(sub_h5obj)
-                        self.__set_built(sub_h5obj.file.filename, sub_h5obj.id, builder)
-                    obj_type[builder.name] = builder
-            else:
-                warnings.warn('Path to Group altered/broken at ' + os.path.join(h5obj.name, k), BrokenLinkWarning)
-                kwargs['datasets'][k] = None
-                continue
-        kwargs['source'] = os.path.abspath(h5obj.file.filename)
+            name = str(os.path.basename(path))
+        if source is None:
+            source = self.__get_abspath(h5obj.file.filename)
+        kwargs['source'] = source
         ret = GroupBuilder(name, **kwargs)
-        ret.location = os.path.dirname(h5obj.name)
+        ret.location = os.path.dirname(path)
+        self.__set_written(ret)
+        if self.__lazy_read:
+            ret._set_loader(partial(self.__load_group, h5obj=h5obj, ignore=ignore))
+        else:
+            self.__read_sub_builders(ret, h5obj, ignore, path=path)
+        return ret
+
+    def __get_abspath(self, fpath):
+        """Get the absolute path of the given file path, caching the result"""
+        ret = self.__abspaths.get(fpath)
+        if ret is None:
+            ret = os.path.abspath(fpath)
+            self.__abspaths[fpath] = ret
+        return ret
+
+    def __index_tree(self):
+        """
+        Collect the links of all groups of the file and the type and number of attributes of all objects of the file
+
+        The links are collected in a single traversal of the file with H5Lvisit and the objects in a single traversal
+        with H5Ovisit, so that the whole file can be read without iterating over each group or opening the groups
+        that have no attributes.
+
+        :return: a tuple with the path of the file, a dict from the address of each group to a list of the name, link
+                 type, and target address of each of its links, in the same order as iterating over the h5py.Group,
+                 and a dict from the address of each object to its object type and number of attributes
+        """
+        fid = self.__file.id
+        addresses = {b'': _object_address(fid)}  # map from path of a group to its address
+        links = dict()
+        corders = dict()  # map from address of a group to the creation order of its links, if it is tracked
+
+        # h5py reuses the info objects passed to the callbacks, so their values are copied
+        def add_link(name, info):
+            parent, _, k = name.rpartition(b'/')
+            group = addresses[parent]
+            links.setdefault(group, list()).append((k, info.type, info.u))
+            if info.corder_valid:
+                corders.setdefault(group, list()).append(info.corder)
+            if info.type == h5py.h5l.TYPE_HARD:
+                addresses[name] = info.u
+
+        # the links of a group are visited after the link to the group, and the groups with multiple hard links
+        # are only visited once, so the links are collected by the address of the group
+        fid.links.visit(add_link, info=True)
+        objects = dict()
+
+        def add_object(name, info):
+            objects[info.addr] = (info.type, info.num_attrs)
+
+        h5py.h5o.visit(fid, add_object, info=True)
+        for group, group_corders in corders.items():
+            # the links of groups with tracked creation order are iterated in creation order by h5py.Group
+            links[group] = [link for _, link in sorted(zip(group_corders, links[group]), key=lambda x: x[0])]
+        return self.__file.filename, links, objects
+
+    @_timed('read_group', lambda path, address, ignore, source: path)
+    def __read_indexed_group(self, path, address, ignore, source):
+        """
+        Read the group with the given path and address from the index of the whole file that is being read
+
+        The group is only opened if it has attributes or soft or external links.
+        """
+        h5obj = None
+        attributes = dict()
+        if self.__tree[2][address][1] > 0:
+            h5obj = Group(h5py.h5o.open(self.__file.id, path.encode('UTF-8')))
+            attributes = self.__read_attrs(h5obj)
+            for key, val in attributes.items():
+                if isinstance(val, bytes):
+                    attributes[key] = val.decode('UTF-8')
+        ret = GroupBuilder(os.path.basename(path), attributes=attributes, source=source)
+        ret.location = os.path.dirname(path)
         self.__set_written(ret)
+        self.__read_indexed_sub_builders(ret, h5obj, ignore, path, address)
         return ret
 
-    def __read_dataset(self, h5obj, name=None):
+    def __read_indexed_sub_builders(self, builder, h5obj, ignore, path, address):
+        """
+        Read the subgroups, datasets, and links of the group with the given path and address from the index of the
+        whole file that is being read and add them to the given GroupBuilder
+
+        :param h5obj: the h5py Group, or None to open it only if it has soft or external links
+        """
+        fpath, links, objects = self.__tree
+        source = self.__get_abspath(fpath)
+        fid = self.__file.id
+        prefix = path.rstrip('/') + '/'
+        for bname, link_type, sub_address in links.get(address, ()):
+            k = bname.decode('UTF-8')
+            sub_path = prefix + k
+            if sub_path in ignore:
+                continue
+            if link_type != h5py.h5l.TYPE_HARD:
+                if h5obj is None:
+                    h5obj = Group(h5py.h5o.open(fid, path.encode('UTF-8')))
+                self.__read_link(builder, h5obj, k, ignore, source)
+                continue
+            sub_builder = self.__get_built(fpath, sub_address)
+            obj_type = objects[sub_address][0]
+            if obj_type == h5py.h5o.TYPE_DATASET:
+                if sub_builder is None:
+                    bpath = sub_path.encode('UTF-8')
+                    oid = self._reopen_with_chunk_cache(fid, bpath, h5py.h5o.open(fid, bpath), sub_path)
+                    sub_builder = self.__read_dataset(Dataset(oid), path=sub_path, source=source)
+                    self.__set_built(fpath, sub_address, sub_builder)
+                builder.set_dataset(sub_builder)
+            elif obj_type == h5py.h5o.TYPE_GROUP:
+                if sub_builder is None:
+                    sub_builder = self.__read_indexed_group(sub_path, sub_address, ignore, source)
+                    self.__set_built(fpath, sub_address, sub_builder)
+                builder.set_group(sub_builder)
+
+    def __read_sub_builders(self, builder, h5obj, ignore, path=None):
+        """Read the subgroups, datasets, and links of the given h5py Group and add them to the given GroupBuilder
+
+        When the whole file is read, the links of the group are taken from the index of the file built by
+        __index_tree. Otherwise, the names and types of all links of the group are collected in a single pass with
+        the low-level h5py API, and the targets of hard links are opened directly by name. This avoids creating h5py
+        high-level objects and looking up each name in the group multiple times.
+        """
+        if path is None:
+            path = h5obj.name
+        fpath = h5obj.file.filename
+        if self.__tree is not None and fpath == self.__tree[0]:
+            # the whole file is being read
+            self.__read_indexed_sub_builders(builder, h5obj, ignore, path, _object_address(h5obj.id))
+            return
+        source = self.__get_abspath(fpath)
+        gid = h5obj.id
+        # iterate in the same order as iterating over the h5py.Group
+        idx_type = h5py.h5.INDEX_NAME
+        if gid.get_create_plist().get_link_creation_order() & h5py.h5p.CRT_ORDER_TRACKED:
+            idx_type = h5py.h5.INDEX_CRT_ORDER
+        links = list()
+        gid.links.iterate(lambda k, info: links.append((k, info.type)), info=True, idx_type=idx_type)
+        prefix = path.rstrip('/') + '/'
+        for bname, link_type in links:
+            k = bname.decode('UTF-8')
+            sub_path = prefix + k
+            if sub_path in ignore:
+                continue
+            if link_type != h5py.h5l.TYPE_HARD:
+                self.__read_link(builder, h5obj, k, ignore, source)
+                continue
+            oid = h5py.h5o.open(gid, bname)
+            sub_builder = self.__get_built(fpath, oid)
+            if isinstance(oid, h5py.h5d.DatasetID):
+                if sub_builder is None:
+                    oid = self._reopen_with_chunk_cache(gid, bname, oid, sub_path)
+                    sub_builder = self.__read_dataset(Dataset(oid), path=sub_path, source=source)
+                    self.__set_built(fpath, oid, sub_builder)
+                builder.set_dataset(sub_builder)
+            elif isinstance(oid, h5py.h5g.GroupID):
+                if sub_builder is None:
+                    sub_builder = self.__read_group(Group(oid), ignore=ignore, path=sub_path, source=source)
+                    self.__set_built(fpath, oid, sub_builder)
+                builder.set_group(sub_builder)
+
+    def _reopen_with_chunk_cache(self, loc_id, name, dsid, path):
+        """
+        Reopen the dataset with the given name relative to loc_id with the chunk cache settings for the dataset
+
+        The chunk cache of a dataset can only be set when the dataset is opened for the first time, so the given
+        DatasetID is closed and must not be in use elsewhere. Return the given DatasetID if no settings apply.
+        """
+        settings = self.__get_chunk_cache_settings(dsid, path)
+        if settings is None:
+            return dsid
+        dapl = h5py.h5p.create(h5py.h5p.DATASET_ACCESS)
+        dapl.set_chunk_cache(*settings)
+        dsid.close()
+        return h5py.h5d.open(loc_id, name, dapl=dapl)
+
+    def __get_chunk_cache_settings(self, dsid, path):
+        """Get the (nslots, nbytes, w0) chunk cache settings for the given dataset, or None to use the defaults"""
+        if self.__chunk_cache is None:
+            return None
+        dcpl = dsid.get_create_plist()
+        if dcpl.get_layout() != h5py.h5d.CHUNKED:
+            return None
+        nslots, nbytes, w0 = dsid.get_access_plist().get_chunk_cache()
+        if self.__chunk_cache == 'auto':
+            auto_nbytes, auto_nslots = _auto_chunk_cache(dsid.shape, dcpl.get_chunk(), dsid.get_type().get_size())
+            # keep the default cache if it is large enough or if the budget left cannot make it any larger
+            remaining = self.__chunk_cache_budget - self.__chunk_cache_used
+            if auto_nbytes <= nbytes or remaining <= nbytes:
+                return None
+            nbytes, nslots = min(auto_nbytes, remaining), auto_nslots
+            self.__chunk_cache_used += nbytes
+        else:
+            config = self.__chunk_cache.get(path)
+            if config is None:
+                return None
+            nslots = config.get('rdcc_nslots', nslots)
+            nbytes = config.get('rdcc_nbytes', nbytes)
+            w0 = config.get('rdcc_w0', w0)
+        return nslots, nbytes, w0
+
+    def __read_link(self, builder, h5obj, k, ignore, source):
+        """Read the soft or external link with the given name in the given h5py Group and add it to the GroupBuilder"""
+        sub_h5obj = h5obj.get(k)
+        if sub_h5obj is None:
+            warnings.warn('Path to Group altered/broken at ' + os.path.join(h5obj.name, k), BrokenLinkWarning)
+            return
+        link_type = h5obj.get(k, getlink=True)
+        # get path of link (the key used for tracking what's been built)
+        target_path = link_type.path
+        target_obj = sub_h5obj.file[target_path]
+        builder_name = os.path.basename(target_path)
+        # get builder if already read, else build it
+        sub_builder = self.__get_built(sub_h5obj.file.filename, target_obj.id)
+        if sub_builder is None:
+            # NOTE: all links must have absolute paths
+            if isinstance(target_obj, Dataset):
+                sub_builder = self.__read_dataset(target_obj, builder_name)
+            else:
+                sub_builder = self.__read_group(target_obj, builder_name, ignore=ignore)
+            self.__set_built(sub_h5obj.file.filename, target_obj.id, sub_builder)
+        link_builder = LinkBuilder(builder=sub_builder, name=k, source=source)
+        link_builder.location = h5obj.name
+        self.__set_written(link_builder)
+        builder.set_link(link_builder)
+        if isinstance(link_type, ExternalLink):
+            self.__open_links.append(sub_h5obj)
+
+    def __load_group(self, builder, h5obj, ignore):
+        """Lazy loader for the sub-builders of a GroupBuilder (see :py:meth:`GroupBuilder._set_loader`)"""
+        if not h5obj.id.valid:
+            raise UnsupportedOperation("Cannot read the contents of '%s' from closed HDF5 file '%s'"
+                                       % (h5obj.name, self.source))
+        self.__lazy_loading += 1
+        try:
+            self.__read_sub_builders(builder, h5obj, ignore)
+        finally:
+            self.__lazy_loading -= 1
+        self.__resolve_lazy_pending()
+
+    def __get_lazy(self, path):
+        """Get the builder at the given path of this file, reading only the groups along the path"""
+        f_builder = self.__read.get(self.__file)
+        if f_builder is None:
+            return None
+        path = path.strip('/')
+        if not path:
+            return f_builder
+        return f_builder.get(path)
+
+    def __resolve_lazy_pending(self):
+        """Attach builders that were read out of order (e.g., as the target of a reference) to their parents.
+
+        When reading lazily, the target of a reference may be read before the group containing it. The groups
+        along the path to the target are read here so that the target builder gets its parent.
+        """
+        if self.__lazy_loading > 0 or self.__lazy_resolving or self.__read.get(self.__file) is None:
+            return
+        self.__lazy_resolving = True
+        try:
+            while len(self.__lazy_pending) > 0:
+                self.__get_lazy(self.__lazy_pending.popleft())
+        finally:
+            self.__lazy_resolving = False
+
+    @_timed('read_dataset', lambda h5obj, name=None, path=None, source=None: path or h5obj.name)
+    def __read_dataset(self, h5obj, name=None, path=None, source=None):
+        dtype = h5obj.dtype
         kwargs = {
             "attributes": self.__read_attrs(h5obj),
-            "dtype": h5obj.dtype,
+            "dtype": dtype,
             "maxshape": h5obj.maxshape
         }
         for key, val in kwargs['attributes'].items():
             if isinstance(val, bytes):
                 kwargs['attributes'][key] = val.decode('UTF-8')
 
+        if path is None:
+            path = h5obj.name
         if name is None:
-            name = str(os.path.basename(h5obj.name))
-        kwargs['source'] = os.path.abspath(h5obj.file.filename)
-        ndims = len(h5obj.shape)
+            name = str(os.path.basename(path))
+        if source is None:
+            source = self.__get_abspath(h5obj.file.filename)
+        kwargs['source'] = source
+        ndims = len(h5obj.id.shape)
         if ndims == 0:  # read scalar
             scalar = h5obj[()]
+            if self._io_stats is not None:
+                self._io_stats.add(path, bytes_read=dtype.itemsize, read_calls=1)
             if isinstance(scalar, bytes):
                 scalar = scalar.decode('UTF-8')
 
@@ -698,17 +1565,15 @@ class HDF5IO(HDMFIO):
                     d = ReferenceBuilder(target_builder)
                 kwargs['data'] = d
                 kwargs['dtype'] = d.dtype
-            elif h5obj.dtype.kind == 'V':  # scalar compound data type
-                kwargs['data'] = np.array(scalar, dtype=h5obj.dtype)
-                cpd_dt = h5obj.dtype
-                ref_cols = [check_dtype(ref=cpd_dt[i]) or check_dtype(vlen=cpd_dt[i]) for i in range(len(cpd_dt))]
-                d = BuilderH5TableDataset(h5obj, self, ref_cols)
-                kwargs['dtype'] = HDF5IO.__compound_dtype_to_list(h5obj.dtype, d.dtype)
+            elif dtype.kind == 'V':  # scalar compound data type
+                kwargs['data'] = np.array(scalar, dtype=dtype)
+                d = BuilderH5TableDataset(h5obj, self, self._get_ref_cols(dtype))
+                kwargs['dtype'] = HDF5IO.__compound_dtype_to_list(dtype, d.dtype)
             else:
                 kwargs["data"] = scalar
         else:
             d = None
-            if h5obj.dtype.kind == 'O' and len(h5obj) > 0:
+            if dtype.kind == 'O' and len(h5obj) > 0:
                 elem1 = h5obj[tuple([0] * (h5obj.ndim - 1) + [0])]
                 if isinstance(elem1, (str, bytes)):
                     d = self._check_str_dtype(h5obj)
@@ -718,16 +1583,16 @@ class HDF5IO(HDMFIO):
                 elif isinstance(elem1, Reference):
                     d = BuilderH5ReferenceDataset(h5obj, self)
                     kwargs['dtype'] = d.dtype
-            elif h5obj.dtype.kind == 'V':  # table / compound data type
-                cpd_dt = h5obj.dtype
-                ref_cols = [check_dtype(ref=cpd_dt[i]) or check_dtype(vlen=cpd_dt[i]) for i in range(len(cpd_dt))]
-                d = BuilderH5TableDataset(h5obj, self, ref_cols)
-                kwargs['dtype'] = HDF5IO.__compound_dtype_to_list(h5obj.dtype, d.dtype)
+            elif dtype.kind == 'V':  # table / compound data type
+                d = BuilderH5TableDataset(h5obj, self, self._get_ref_cols(dtype))
+                kwargs['dtype'] = HDF5IO.__compound_dtype_to_list(dtype, d.dtype)
             else:
-                d = h5obj
+                d = _memmap_dataset(h5obj) if self.__memmap else None
+                if d is None:
+                    d = h5obj
             kwargs["data"] = d
         ret = DatasetBuilder(name, **kwargs)
-        ret.location = os.path.dirname(h5obj.name)
+        ret.location = os.path.dirname(path)
         self.__set_written(ret)
         return ret
 
@@ -738,6 +1603,11 @@ class HDF5IO(HDMFIO):
                 return StrDataset(h5obj, None)
         return h5obj
 
+    @staticmethod
+    def _get_ref_cols(cpd_dt):
+        """Get whether each field of the given compound numpy dtype is a reference or variable-length type"""
+        return [check_dtype(ref=cpd_dt[i]) or check_dtype(vlen=cpd_dt[i]) for i in range(len(cpd_dt))]
+
     @classmethod
     def __compound_dtype_to_list(cls, h5obj_dtype, dset_dtype):
         ret = []
@@ -747,6 +1617,10 @@ class HDF5IO(HDMFIO):
 
     def __read_attrs(self, h5obj):
         ret = dict()
+        if h5py.h5a.get_num_attrs(h5obj.id) == 0:
+            return ret
+        if self._io_stats is not None:
+            self._io_stats.add(h5obj.name, attributes_read=h5py.h5a.get_num_attrs(h5obj.id))
         for k, v in h5obj.attrs.items():
             if k == SPEC_LOC_ATTR:  # ignore cached spec
                 continue
@@ -760,6 +1634,8 @@ class HDF5IO(HDMFIO):
 
     def __read_ref(self, h5obj):
         ret = None
+        if self._io_stats is not None:
+            self._io_stats.count(references_resolved=1)
         ret = self.__get_built(h5obj.file.filename, h5obj.id)
         if ret is None:
             if isinstance(h5obj, Dataset):
@@ -769,6 +1645,9 @@ class HDF5IO(HDMFIO):
             else:
                 raise ValueError("h5obj must be a Dataset or a Group - got %s" % str(h5obj))
             self.__set_built(h5obj.file.filename, h5obj.id, ret)
+            if self.__lazy_read and h5obj.file.filename == self.__file.filename:
+                # the group containing the target may not be read yet
+                self.__lazy_pending.append(h5obj.name)
         return ret
 
     def open(self):
@@ -846,11 +1725,18 @@ class HDF5IO(HDMFIO):
             self.write_link(self.__file, lbldr, export_source=kwargs.get("export_source"))
         self.set_attributes(self.__file, f_builder.attributes)
         self.__add_refs()
+        if self.__dci_queue.checkpoint is not None:
+            self.__dci_queue.checkpoint.save()
         self.__dci_queue.exhaust_queue()
         self.__set_written(f_builder)
+        if self.__object_id_index is not None:
+            # add the objects that were written. objects in groups that have not been loaded have not changed.
+            self.__object_id_index.update(self.__index_builder_object_ids(f_builder))
+        self.__data_type_index = None
         self.logger.debug("Done writing %s '%s' to path '%s'" %
                           (f_builder.__class__.__qualname__, f_builder.name, self.source))
 
+    @_timed('add_refs')
     def __add_refs(self):
         '''
         Add all references in the file.
@@ -867,6 +1753,8 @@ class HDF5IO(HDMFIO):
                               % (id(call), len(self.__ref_queue)))
             try:
                 call()
+                if self._io_stats is not None:
+                    self._io_stats.count(references_written=1)
             except KeyError:
                 if id(call) in failed:
                     raise RuntimeError('Unable to resolve reference')
@@ -954,6 +1842,8 @@ class HDF5IO(HDMFIO):
              'doc': 'a dict containing the attributes on the Group or Dataset, indexed by attribute name'})
     def set_attributes(self, **kwargs):
         obj, attributes = getargs('obj', 'attributes', kwargs)
+        if self._io_stats is not None and len(attributes) > 0:
+            self._io_stats.add(obj.name, attributes_written=len(attributes))
         for key, value in attributes.items():
             try:
                 if isinstance(value, (set, list, tuple)):
@@ -1007,6 +1897,7 @@ class HDF5IO(HDMFIO):
             {'name': 'export_source', 'type': str,
              'doc': 'The source of the builders when exporting', 'default': None},
             returns='the Group that was created', rtype=Group)
+    @_timed('write_group', lambda parent, builder, **kwargs: _object_path(parent, builder.name))
     def write_group(self, **kwargs):
         parent, builder = popargs('parent', 'builder', kwargs)
         self.logger.debug("Writing GroupBuilder '%s' to parent group '%s'" % (builder.name, parent.name))
@@ -1107,6 +1998,7 @@ class HDF5IO(HDMFIO):
             {'name': 'export_source', 'type': str,
              'doc': 'The source of the builders when exporting', 'default': None},
             returns='the Dataset that was created', rtype=Dataset)
+    @_timed('write_dataset', lambda parent, builder, **kwargs: _object_path(parent, builder.name))
     def write_dataset(self, **kwargs):  # noqa: C901
         """ Write a dataset to HDF5
 
@@ -1125,6 +2017,7 @@ class HDF5IO(HDMFIO):
         options = dict()  # dict with additional
         if isinstance(data, H5DataIO):
             options['io_settings'] = data.io_settings
+            options['dataio'] = data
             dataio = data
             link_data = data.link_data
             data = data.data
@@ -1234,9 +2127,11 @@ class HDF5IO(HDMFIO):
                 return
             # If the compound data type contains only regular data (i.e., no references) then we can write it as usual
             elif len(np.shape(data)) == 0:
-                dset = self.__scalar_fill__(parent, name, data, options)
+                with self.__timed('scalar_fill', _object_path(parent, name)):
+                    dset = self.__scalar_fill__(parent, name, data, options)
             else:
-                dset = self.__list_fill__(parent, name, data, options)
+                with self.__timed('list_fill', _object_path(parent, name)):
+                    dset = self.__list_fill__(parent, name, data, options)
         # Write a dataset containing references, i.e., a region or object reference.
         # NOTE: we can ignore options['io_settings'] for scalar data
         elif self.__is_ref(options['dtype']):
@@ -1324,17 +2219,30 @@ class HDF5IO(HDMFIO):
                 dataio.dataset = dset
             # Write a scalar dataset containing a single string
             elif isinstance(data, (str, bytes)):
-                dset = self.__scalar_fill__(parent, name, data, options)
+                with self.__timed('scalar_fill', _object_path(parent, name)):
+                    dset = self.__scalar_fill__(parent, name, data, options)
             # Iterative write of a data chunk iterator
             elif isinstance(data, AbstractDataChunkIterator):
                 dset = self.__setup_chunked_dset__(parent, name, data, options)
-                self.__dci_queue.append(dataset=dset, data=data)
+                self.__dci_queue.append(dataset=dset, data=data, dataio=options.get('dataio'))
+                if self.__dci_queue.checkpoint is not None:
+                    self.__dci_queue.checkpoint.add(dset, data, dataio=options.get('dataio'))
             # Write a regular in memory array (e.g., numpy array, list etc.)
             elif hasattr(data, '__len__'):
-                dset = self.__list_fill__(parent, name, data, options)
+                with self.__timed('list_fill', _object_path(parent, name)):
+                    dset = self.__list_fill__(parent, name, data, options)
             # Write a regular scalar dataset
             else:
-                dset = self.__scalar_fill__(parent, name, data, options)
+                with self.__timed('scalar_fill', _object_path(parent, name)):
+                    dset = self.__scalar_fill__(parent, name, data, options)
+        if self._io_stats is not None and dset is not None and not isinstance(data, AbstractDataChunkIterator):
+            if not _has_vlen_dtype(dset.dtype):
+                self._io_stats.add(dset.name, bytes_written=dset.size * dset.dtype.itemsize, write_calls=1)
+            elif data is not None and not isinstance(data, Dataset):
+                # count the bytes of the variable-length values instead of the size of the references to them
+                self._io_stats.add(dset.name, bytes_written=_data_nbytes(data), write_calls=1)
+            else:  # the size of the values of a copied dataset is not known without reading them
+                self._io_stats.add(dset.name, write_calls=1)
         # Create the attributes on the dataset only if we are the primary and not just a Soft/External link
         if link is None:
             self.set_attributes(dset, attributes)
@@ -1342,7 +2250,8 @@ class HDF5IO(HDMFIO):
         elif len(attributes) > 0:
             pass
         self.__set_written(builder)
-        if exhaust_dci:
+        # the DataChunkIterators of checkpointed writes are exhausted after the rest of the file is written
+        if exhaust_dci and self.__dci_queue.checkpoint is None:
             self.__dci_queue.exhaust_queue()
 
     @classmethod
@@ -1494,8 +2403,17 @@ class HDF5IO(HDMFIO):
             new_shape = list(dset.shape)
             new_shape[0] = len(data)
             dset.resize(new_shape)
+        dataio = None if options is None else options.get('dataio')
         try:
-            dset[:] = data
+            if dataio is not None:
+                write_selection(dset, data, dataio=dataio)
+                if dataio.chunk_processors:
+                    chunk = DataChunk(data=np.asarray(data), selection=np.s_[...])
+                    for processor in dataio.chunk_processors:
+                        processor.process_data_chunk(chunk)
+                    finish_chunk_processors(dset, dataio)
+            else:
+                dset[:] = data
         except Exception as e:
             raise e
         return dset
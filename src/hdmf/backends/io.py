@@ -2,7 +2,7 @@ from abc import ABCMeta, abstractmethod
 import os
 from pathlib import Path
 
-from ..build import BuildManager, GroupBuilder
+from ..build import BuildManager, GroupBuilder, Builder
 from ..container import Container, HERDManager
 from .errors import UnsupportedOperation
 from ..utils import docval, getargs, popargs
@@ -50,21 +50,42 @@ class HDMFIO(metaclass=ABCMeta):
         '''The source of the container being read/written i.e. file path'''
         return self.__source
 
-    @docval(returns='the Container object that was read in', rtype=Container)
+    @docval({'name': 'paths', 'type': (list, tuple),
+             'doc': ('the absolute paths (e.g., "/buckets/bucket1") and/or data types (e.g., "DynamicTable") of the '
+                     'objects to read. If provided, only the containers at these paths or of these data types (and '
+                     'the containers they link to or reference) are constructed, and a dict mapping the path of each '
+                     'object to its container is returned. Objects of the given data types that are contained in '
+                     'another object of the given data types are constructed with that object and are not '
+                     'returned separately.'),
+             'default': None},
+            returns='the Container object that was read in, or a dict of Containers if paths is provided',
+            rtype=(Container, dict))
     def read(self, **kwargs):
         """Read a container from the IO source."""
+        paths = getargs('paths', kwargs)
         f_builder = self.read_builder()
         if all(len(v) == 0 for v in f_builder.values()):
             # TODO also check that the keys are appropriate. print a better error message
             raise UnsupportedOperation('Cannot build data. There are no values.')
+        if paths is not None:
+            containers = self.__read_paths(f_builder, paths)
+            self.__set_read_io(containers.values())
+            return containers
         container = self.__manager.construct(f_builder)
-        container.read_io = self
+        self.__set_read_io([container])
+        return container
+
+    def __set_read_io(self, containers):
+        """Set this object as the read_io of the given containers that were read and link them to the HERD file"""
+        for container in containers:
+            container.read_io = self
         if self.herd_path is not None:
             from hdmf.common import HERD
             try:
                 self.herd = HERD.from_zip(path=self.herd_path)
-                if isinstance(container, HERDManager):
-                    container.link_resources(herd=self.herd)
+                for container in containers:
+                    if isinstance(container, HERDManager):
+                        container.link_resources(herd=self.herd)
             except FileNotFoundError:
                 msg = "File not found at {}. HERD not added.".format(self.herd_path)
                 warn(msg)
@@ -72,7 +93,58 @@ class HDMFIO(metaclass=ABCMeta):
                 msg = "Check HERD separately for alterations. HERD not added."
                 warn(msg)
 
-        return container
+    def __read_paths(self, f_builder, paths):
+        """Construct only the containers at the given paths or of the given data types.
+
+        The parents of the constructed containers are not constructed and are left as
+        :py:class:`~hdmf.build.manager.Proxy` objects.
+        """
+        builders = dict()
+        data_types = list()
+        for path in paths:
+            if not isinstance(path, str):
+                raise TypeError("paths must contain only strings - got %s" % type(path))
+            if not path.startswith('/'):
+                data_types.append(path)
+                continue
+            key = path.strip('/')
+            try:
+                builder = f_builder[key] if key else f_builder
+            except KeyError:
+                builder = None
+            if not isinstance(builder, Builder):
+                raise ValueError("Could not find an object at path '%s' in '%s'" % (path, self.__source))
+            builders[path] = builder
+        if len(data_types) > 0:
+            for builder in self.__find_data_type_builders(f_builder, data_types):
+                builders.setdefault(self.__get_builder_path(builder), builder)
+        return {path: self.__manager.construct(builder) for path, builder in builders.items()}
+
+    def __find_data_type_builders(self, f_builder, data_types):
+        """Find the builders in the hierarchy of the given builder that have (a subtype of) one of the data types.
+
+        Links are not followed. The builders within a builder that is found are not searched, since they are
+        constructed with the container of that builder.
+        """
+        stack = [f_builder]
+        while len(stack) > 0:
+            builder = stack.pop()
+            if self.__manager.get_builder_dt(builder) is not None:
+                if any(self.__manager.is_sub_data_type(builder, dt) for dt in data_types):
+                    yield builder
+                    continue
+            if isinstance(builder, GroupBuilder):
+                stack.extend(builder.groups.values())
+                stack.extend(builder.datasets.values())
+
+    @staticmethod
+    def __get_builder_path(builder):
+        """Get the absolute path of the given builder within its file"""
+        names = list()
+        while builder.parent is not None:
+            names.append(builder.name)
+            builder = builder.parent
+        return '/' + '/'.join(reversed(names))
 
     @docval({'name': 'container', 'type': Container, 'doc': 'the Container object to write'},
             {'name': 'herd', 'type': 'hdmf.common.resources.HERD',
@@ -1,5 +1,8 @@
 """Module with utility functions and classes used for implementation of I/O backends"""
+import copy
 import os
+import time
+from contextlib import contextmanager
 from ..spec import NamespaceCatalog, GroupSpec, NamespaceBuilder
 from ..utils import docval,  popargs
 
@@ -43,6 +46,68 @@ class WriteStatusTracker(dict):
         return self.get(builder_id, False)
 
 
+class IOStats:
+    """
+    Helper class used for recording statistics of the operations of an I/O backend, i.e., the number of calls and
+    the time spent in each operation, counters for each object in the file, e.g., the number of bytes written to a
+    dataset, and counters for the whole file, e.g., the number of references resolved.
+    """
+
+    def __init__(self, callback=None):
+        """
+        :param callback: a function that is called with the name of the operation, the path of the object, and the
+                         time in seconds spent in the operation each time a timed operation finishes
+        :type callback: callable
+        """
+        self.__callback = callback
+        self.reset()
+
+    def reset(self):
+        """Reset all statistics"""
+        self.__operations = dict()
+        self.__objects = dict()
+        self.__counters = dict()
+
+    @contextmanager
+    def timed(self, operation, path=None):
+        """
+        Context manager that records a call of the given operation on the object with the given path and the time
+        spent in it. The time is also added to the 'time' counter of the object.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stats = self.__operations.setdefault(operation, {'calls': 0, 'time': 0.0})
+            stats['calls'] += 1
+            stats['time'] += elapsed
+            if path is not None:
+                self.add(path, **{operation + '_time': elapsed})
+            if self.__callback is not None:
+                self.__callback(operation, path, elapsed)
+
+    def add(self, path, **counters):
+        """Add the given values to the counters of the object with the given path"""
+        stats = self.__objects.setdefault(path, dict())
+        for key, value in counters.items():
+            stats[key] = stats.get(key, 0) + value
+
+    def count(self, **counters):
+        """Add the given values to the counters of the file"""
+        for key, value in counters.items():
+            self.__counters[key] = self.__counters.get(key, 0) + value
+
+    def get(self):
+        """
+        Get a copy of the statistics as a dict with the keys 'operations', which maps the name of each operation to a
+        dict with the number of 'calls' and the total 'time' in seconds, 'objects', which maps the path of each
+        object to a dict of its counters, and 'counters', which maps the name of each counter of the file to its value
+        """
+        return copy.deepcopy({'operations': self.__operations, 'objects': self.__objects,
+                              'counters': self.__counters})
+
+
 class NamespaceToBuilderHelper(object):
     """Helper class used in HDF5IO (and possibly elsewhere) to convert a namespace to a builder for I/O"""
 
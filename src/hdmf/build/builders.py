@@ -151,6 +151,7 @@ class GroupBuilder(BaseBuilder):
         # dictionary mapping subgroup/dataset/attribute/link name to the key that maps to the
         # subgroup/dataset/attribute/link sub-dictionary that maps the name to the builder
         self.obj_type = dict()
+        self.__loader = None
         super().__init__(name, attributes, parent, source)
         super().__setitem__(GroupBuilder.__group, dict())
         super().__setitem__(GroupBuilder.__dataset, dict())
@@ -168,6 +169,26 @@ class GroupBuilder(BaseBuilder):
             return list(d.values())
         return d
 
+    def _set_loader(self, loader):
+        """Defer adding the subgroups, datasets, and links of this group until they are first accessed.
+
+        This is used by I/O backends to read the hierarchy of a file on demand. *loader* is called once, with this
+        builder as its only argument, the first time the subgroups, datasets, or links are accessed. The loader
+        should add the sub-builders using :py:meth:`set_group`, :py:meth:`set_dataset`, and :py:meth:`set_link`.
+        """
+        self.__loader = loader
+
+    @property
+    def loaded(self):
+        """Whether the subgroups, datasets, and links of this group have been loaded."""
+        return self.__loader is None
+
+    def __load(self):
+        if self.__loader is not None:
+            # unset the loader first so that accessing sub-builders from within the loader does not recurse
+            loader, self.__loader = self.__loader, None
+            loader(self)
+
     @property
     def source(self):
         ''' The source of this Builder '''
@@ -190,16 +211,19 @@ class GroupBuilder(BaseBuilder):
     @property
     def groups(self):
         """The subgroups contained in this group."""
+        self.__load()
         return super().__getitem__(GroupBuilder.__group)
 
     @property
     def datasets(self):
         """The datasets contained in this group."""
+        self.__load()
         return super().__getitem__(GroupBuilder.__dataset)
 
     @property
     def links(self):
         """The links contained in this group."""
+        self.__load()
         return super().__getitem__(GroupBuilder.__link)
 
     @docval(*get_docval(BaseBuilder.set_attribute))
@@ -281,6 +305,7 @@ class GroupBuilder(BaseBuilder):
 
     def __get_rec(self, key_ar):
         # recursive helper for __getitem__ and get
+        self.__load()
         if len(key_ar) == 1:
             # get the correct dictionary (groups, datasets, links, attributes) associated with the key
             # then look up the key within that dictionary to get the builder
@@ -294,6 +319,7 @@ class GroupBuilder(BaseBuilder):
         raise NotImplementedError('__setitem__')
 
     def __contains__(self, item):
+        self.__load()
         return self.obj_type.__contains__(item)
 
     def items(self):
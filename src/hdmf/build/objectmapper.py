@@ -13,7 +13,6 @@ from .manager import Proxy, BuildManager
 
 from .warnings import (MissingRequiredBuildWarning, DtypeConversionWarning, IncorrectQuantityBuildWarning,
                        IncorrectDatasetShapeBuildWarning)
-from hdmf.backends.hdf5.h5_utils import H5DataIO
 
 from ..container import AbstractContainer, Data, DataRegion
 from ..term_set import TermSetWrapper
@@ -984,6 +983,7 @@ class ObjectMapper(metaclass=ExtenderMeta):
                 for d in container.data:
                     target_builder = self.__get_target_builder(d, build_manager, builder)
                     bldr_data.append(ReferenceBuilder(target_builder))
+                from hdmf.backends.hdf5.h5_utils import H5DataIO  # circular import fix
                 if isinstance(container.data, H5DataIO):
                     # This is here to support appending a dataset of references.
                     bldr_data = H5DataIO(bldr_data, **container.data.get_io_params())
@@ -1232,6 +1232,9 @@ class ObjectMapper(metaclass=ExtenderMeta):
         if isinstance(spec, GroupSpec):
             if not isinstance(builder, GroupBuilder):  # pragma: no cover
                 raise ValueError("__get_subspec_values - must pass GroupBuilder with GroupSpec")
+            if not (spec.groups or spec.datasets or spec.links):
+                # there is nothing to map, so avoid loading the sub-builders of a lazily read GroupBuilder
+                return ret
             # first aggregate links by data type and separate them
             # by group and dataset
             groups = dict(builder.groups)  # make a copy so we can separate links
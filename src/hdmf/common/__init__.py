@@ -130,14 +130,19 @@ def _get_resources():
 
 @docval({'name': 'namespace_path', 'type': str,
          'doc': 'the path to the YAML with the namespace definition'},
+        {'name': 'cache_dir', 'type': str,
+         'doc': ('a directory in which to cache the parsed namespaces and specifications. Defaults to the value of '
+                 'the HDMF_NAMESPACE_CACHE_DIR environment variable. Only use a directory that is trusted and that '
+                 'cannot be written by other users.'),
+         'default': None},
         returns="the namespaces loaded from the given file", rtype=tuple,
         is_method=False)
 def load_namespaces(**kwargs):
     '''
     Load namespaces from file
     '''
-    namespace_path = getargs('namespace_path', kwargs)
-    return __TYPE_MAP.load_namespaces(namespace_path)
+    namespace_path, cache_dir = getargs('namespace_path', 'cache_dir', kwargs)
+    return __TYPE_MAP.load_namespaces(namespace_path, cache_dir=cache_dir)
 
 
 def available_namespaces():
@@ -2,10 +2,10 @@
 Module providing additional functionality for dealing with hierarchically nested tables, i.e.,
 tables containing DynamicTableRegion references.
 """
-import pandas as pd
 import numpy as np
 from hdmf.common.table import DynamicTable, DynamicTableRegion, VectorIndex
 from hdmf.common.alignedtable import AlignedDynamicTable
+from hdmf.container import _DATAFRAME_TYPE
 from hdmf.utils import docval, getargs
 
 
@@ -30,6 +30,7 @@ def to_hierarchical_dataframe(dynamic_table):
     * :py:meth:`~hdmf.common.hierarchicaltable.drop_id_columns` to remove all 'id' columns
     * :py:meth:`~hdmf.common.hierarchicaltable.flatten_column_index` to flatten the column index
     """
+    import pandas as pd
     # TODO: Need to deal with the case where we have more than one DynamicTableRegion column in a given table
     # Get the references column
     foreign_columns = dynamic_table.get_foreign_columns()
@@ -194,7 +195,7 @@ def __flatten_column_name(col):
         return col
 
 
-@docval({'name': 'dataframe', 'type': pd.DataFrame,
+@docval({'name': 'dataframe', 'type': _DATAFRAME_TYPE,
          'doc': 'Pandas dataframe to update (usually generated by the to_hierarchical_dataframe function)'},
         {'name': 'inplace', 'type': 'bool', 'doc': 'Update the dataframe inplace or return a modified copy',
          'default': False},
@@ -222,7 +223,7 @@ def drop_id_columns(**kwargs):
     return dataframe if inplace else re
 
 
-@docval({'name': 'dataframe', 'type': pd.DataFrame,
+@docval({'name': 'dataframe', 'type': _DATAFRAME_TYPE,
          'doc': 'Pandas dataframe to update (usually generated by the to_hierarchical_dataframe function)'},
         {'name': 'max_levels', 'type': (int, np.integer),
          'doc': 'Maximum number of levels to use in the resulting column Index. NOTE:  When '
@@ -1,4 +1,3 @@
-import pandas as pd
 import numpy as np
 from . import register_class, EXP_NAMESPACE
 from . import get_type_map
@@ -215,6 +214,7 @@ class HERD(Container):
             all differences into a single error so that the assertion will indicate
             all found differences.
         """
+        import pandas as pd
         errors = []
         try:
             pd.testing.assert_frame_equal(left.keys.to_dataframe(),
@@ -860,6 +860,7 @@ class HERD(Container):
         """
         Get all entities/resources associated with an object.
         """
+        import pandas as pd
         file = kwargs['file']
         container = kwargs['container']
         attribute = kwargs['attribute']
@@ -908,6 +909,7 @@ class HERD(Container):
         Returns: :py:class:`~pandas.DataFrame` with all data merged into a single, flat, denormalized table.
 
         """
+        import pandas as pd
         use_categories = popargs('use_categories', kwargs)
         # Step 1: Combine the entities, keys, and entity_keys table
         ent_key_df = self.entity_keys.to_dataframe()
@@ -1004,6 +1006,7 @@ class HERD(Container):
         """
         Method to read in zipped tsv files to populate HERD.
         """
+        import pandas as pd
         zip_file = kwargs['path']
         directory = cls.get_zip_directory(zip_file)
 
@@ -1,4 +1,3 @@
-import scipy.sparse as sps
 from . import register_class
 from ..container import Container
 from ..utils import docval, popargs, to_uint_array,  get_data_shape, AllowPositional
@@ -7,7 +6,7 @@ from ..utils import docval, popargs, to_uint_array,  get_data_shape, AllowPositi
 @register_class('CSRMatrix')
 class CSRMatrix(Container):
 
-    @docval({'name': 'data', 'type': (sps.csr_matrix, 'array_data'),
+    @docval({'name': 'data', 'type': ('csr_matrix', 'array_data'),
              'doc': 'the data to use for this CSRMatrix or CSR data array.'
                     'If passing CSR data array, *indices*, *indptr*, and *shape* must also be provided'},
             {'name': 'indices', 'type': 'array_data', 'doc': 'CSR index array', 'default': None},
@@ -16,6 +15,7 @@ class CSRMatrix(Container):
             {'name': 'name', 'type': str, 'doc': 'the name to use for this when storing', 'default': 'csr_matrix'},
             allow_positional=AllowPositional.WARNING)
     def __init__(self, **kwargs):
+        import scipy.sparse as sps
         data, indices, indptr, shape = popargs('data', 'indices', 'indptr', 'shape', kwargs)
         super().__init__(**kwargs)
         if not isinstance(data, sps.csr_matrix):
@@ -9,11 +9,10 @@ from typing import NamedTuple, Union
 from warnings import warn
 
 import numpy as np
-import pandas as pd
 import itertools
 
 from . import register_class, EXP_NAMESPACE
-from ..container import Container, Data
+from ..container import Container, Data, _DATAFRAME_TYPE
 from ..data_utils import DataIO, AbstractDataChunkIterator
 from ..utils import docval, getargs, ExtenderMeta, popargs, pystr, AllowPositional, check_type, is_ragged
 from ..term_set import TermSetWrapper
@@ -122,6 +121,26 @@ class VectorIndex(VectorData):
             self.target.extend(arg, **kwargs)
         self.append(self.__check_precision(len(self.target)))
 
+    def add_vectors(self, args):
+        """
+        Add the given data values to the target VectorData and append the corresponding indices to this VectorIndex
+
+        The data values are added to the target in a single call and the indices are computed with a cumulative sum.
+
+        :param args: The data values to be added to self.target, one for each new element of this VectorIndex
+        """
+        args = list(args)
+        if len(args) == 0:
+            return
+        values = list(itertools.chain.from_iterable(args))
+        if isinstance(self.target, VectorIndex):
+            self.target.add_vectors(values)
+        else:
+            self.target.extend(values)
+        indices = np.cumsum([len(a) for a in args]) + (len(self.target) - len(values))
+        self.__check_precision(int(indices[-1]))
+        super(VectorData, self).extend(indices.astype(self.__uint))
+
     def __check_precision(self, idx):
         """
         Check precision of current dataset and, if necessary, adjust precision to accommodate new value.
@@ -719,6 +738,98 @@ class DynamicTable(Container):
                           "with different lengths."),
                          stacklevel=3)
 
+    @docval({'name': 'data', 'type': dict,
+             'doc': ('dict mapping the name of each column to the values of the rows to add to the column. For an '
+                     'indexed column, the value of each row is the list of elements of the row.')},
+            {'name': 'id', 'type': 'array_data', 'doc': 'the IDs for the rows', 'default': None},
+            {'name': 'enforce_unique_id', 'type': bool, 'doc': 'enforce that the id in the table must be unique',
+             'default': False},
+            {'name': 'check_ragged', 'type': bool, 'default': True,
+             'doc': ('whether or not to check for ragged arrays when adding data to the table. '
+                     'Set to False to avoid checking every element if performance issues occur.')})
+    def add_rows(self, **kwargs):
+        """
+        Add multiple rows to the table. If *id* is not provided, it will auto-increment.
+
+        The data are validated once and each column is extended in a single call, which is much faster than calling
+        :py:meth:`add_row` for each row.
+        """
+        data, row_ids, enforce_unique_id, check_ragged = getargs('data', 'id', 'enforce_unique_id', 'check_ragged',
+                                                                 kwargs)
+        data = dict(data)
+        if row_ids is None:
+            row_ids = data.pop('id', None)
+
+        for colname in self.__colids:
+            if colname not in data:
+                raise ValueError("column '%s' missing" % colname)
+
+        # check to see if any of the extra columns just need to be added
+        extra_columns = set(data.keys()) - set(self.__colids.keys())
+        if extra_columns:
+            for col in self.__columns__:
+                if col['name'] in extra_columns:
+                    if data[col['name']] is not None:
+                        self.add_column(col['name'], col['description'],
+                                        index=col.get('index', False),
+                                        table=col.get('table', False),
+                                        enum=col.get('enum', False),
+                                        col_cls=col.get('class', VectorData),
+                                        # Pass through extra keyword arguments for add_column that
+                                        # subclasses may have added
+                                        **{k: col[k] for k in col.keys()
+                                           if k not in DynamicTable.__reserved_colspec_keys})
+                    extra_columns.remove(col['name'])
+        if extra_columns:
+            raise ValueError(
+                '\n'.join([
+                    'row data keys don\'t match available columns',
+                    'you supplied {} extra keys: {}'.format(len(extra_columns), extra_columns)
+                ])
+            )
+
+        num_rows = len(row_ids) if row_ids is not None else None
+        for colname in self.__colids:
+            if num_rows is None:
+                num_rows = len(data[colname])
+            elif len(data[colname]) != num_rows:
+                raise ValueError("column '%s' has %d rows, expected %d" % (colname, len(data[colname]), num_rows))
+        if not num_rows:
+            return
+
+        bad_data = []
+        for colname, colnum in self.__colids.items():
+            col = self.__df_cols[colnum]
+            if not isinstance(col, VectorIndex) and isinstance(col.data, TermSetWrapper):
+                bad_data.extend(val for val in data[colname] if not col.data.termset.validate(term=val))
+        if len(bad_data) != 0:
+            msg = ('"%s" is not in the term set.' % ', '.join([str(item) for item in bad_data]))
+            raise ValueError(msg)
+
+        if row_ids is None:
+            row_ids = range(len(self), len(self) + num_rows)
+        if enforce_unique_id:
+            row_ids = np.asarray(row_ids)
+            duplicates = row_ids[np.isin(row_ids, self.id.data)]
+            if len(duplicates) == 0:
+                unique_ids, counts = np.unique(row_ids, return_counts=True)
+                duplicates = unique_ids[counts > 1]
+            if len(duplicates) > 0:
+                raise ValueError("id %i already in the table" % duplicates[0])
+        self.id.extend(list(row_ids))
+
+        for colname, colnum in self.__colids.items():
+            c = self.__df_cols[colnum]
+            if isinstance(c, VectorIndex):
+                c.add_vectors(data[colname])
+            else:
+                c.extend(data[colname])
+                if check_ragged and is_ragged(c.data):
+                    warn(("Data has elements with different lengths and therefore cannot be coerced into an "
+                          "N-dimensional array. Use the 'index' argument when creating a column to add rows "
+                          "with different lengths."),
+                         stacklevel=3)
+
     def __eq__(self, other):
         """Compare if the two DynamicTables contain the same data.
 
@@ -1095,6 +1206,7 @@ class DynamicTable(Container):
         :param coldata: dict mapping column names to values (list/arrays or dataframes)
         :type coldata: dict
         """
+        import pandas as pd
         id_index_orig = coldata.pop('id')
         id_index = [id_index_orig]
         df_input = OrderedDict()
@@ -1118,6 +1230,7 @@ class DynamicTable(Container):
         :param coldata: dict mapping column names to values (list/arrays or dataframes)
         :type coldata: dict
         """
+        import pandas as pd
         id_index = coldata.pop('id')
         df_input = OrderedDict()
         for k in coldata:  # for each column
@@ -1257,7 +1370,7 @@ class DynamicTable(Container):
 
     @classmethod
     @docval(
-        {'name': 'df', 'type': pd.DataFrame, 'doc': 'source DataFrame'},
+        {'name': 'df', 'type': _DATAFRAME_TYPE, 'doc': 'source DataFrame'},
         {'name': 'name', 'type': str, 'doc': 'the name of this table'},
         {
             'name': 'index_column',
@@ -9,13 +9,16 @@ import os
 
 import h5py
 import numpy as np
-import pandas as pd
 
 from .data_utils import DataIO, append_data, extend_data, AbstractDataChunkIterator
 from .utils import docval, get_docval, getargs, ExtenderMeta, get_data_shape, popargs, LabelledDict
 
 from .term_set import TermSet, TermSetWrapper
 
+# docval type of pandas.DataFrame, given by name so that pandas is imported only when it is used. The module of
+# DataFrame is 'pandas' in pandas >= 3 and 'pandas.core.frame' in older versions
+_DATAFRAME_TYPE = ('pandas.DataFrame', 'pandas.core.frame.DataFrame')
+
 def _set_exp(cls):
     """Set a class as being experimental"""
     cls._experimental = True
@@ -887,6 +890,9 @@ class Data(AbstractContainer):
 
         self._validate_new_data(data)
         self.__data = data
+        # numpy array with spare capacity that the data is a view of, see __grow
+        self.__buffer = None
+        self.__buffer_view = None
 
     @property
     def data(self):
@@ -983,7 +989,8 @@ class Data(AbstractContainer):
 
     def append(self, arg):
         self._validate_new_data_element(arg)
-        self.__data = append_data(self.__data, arg)
+        if not self.__grow(arg, extend=False):
+            self.__data = append_data(self.__data, arg)
 
     def extend(self, arg):
         """
@@ -993,7 +1000,44 @@ class Data(AbstractContainer):
         :param arg: The iterable to add to the end of this VectorData
         """
         self._validate_new_data(arg)
-        self.__data = extend_data(self.__data, arg)
+        if not self.__grow(arg, extend=True):
+            self.__data = extend_data(self.__data, arg)
+
+    def __grow(self, arg, extend):
+        """
+        Add elements to the end of data held in a numpy array, using an array with spare capacity.
+
+        The capacity of the array is doubled when it is full, so that adding n elements one at a time copies O(n)
+        elements instead of the O(n^2) elements copied by np.append. The data of this Data container is a view of the
+        filled part of the array, so it always has the exact length of the data.
+
+        :return: False if the data is not a numpy array that can be grown, e.g., a structured array, or arg does not
+                 have the shape of the elements of the data
+        """
+        data = self.__data
+        if not isinstance(data, np.ndarray) or data.ndim == 0 or len(data.dtype) > 0:
+            return False
+        if extend:
+            rows = np.asarray(arg)
+            if data.ndim > 1:
+                rows = np.atleast_2d(rows)  # np.vstack accepts a single element
+        else:
+            rows = np.expand_dims(arg, axis=0)
+        if rows.ndim != data.ndim or rows.shape[1:] != data.shape[1:] or len(rows.dtype) > 0:
+            return False
+        try:
+            dtype = np.result_type(data.dtype, rows.dtype)  # the dtype that np.append would return
+        except TypeError:
+            return False
+        n, m = len(data), len(rows)
+        buffer = self.__buffer
+        if buffer is None or data is not self.__buffer_view or dtype != buffer.dtype or n + m > len(buffer):
+            buffer = np.empty((max(2 * (n + m), 16), ) + data.shape[1:], dtype=dtype)
+            buffer[:n] = data
+            self.__buffer = buffer
+        buffer[n:n + m] = rows
+        self.__data = self.__buffer_view = buffer[:n + m]
+        return True
 
     def _validate_new_data(self, data):
         """Function to validate a new array that will be set or added to data. Raises an error if the data is invalid.
@@ -1577,13 +1621,14 @@ class Table(Data):
     def to_dataframe(self):
         '''Produce a pandas DataFrame containing this table's data.
         '''
+        import pandas as pd
 
         data = {colname: self[colname] for ii, colname in enumerate(self.columns)}
         return pd.DataFrame(data)
 
     @classmethod
     @docval(
-        {'name': 'df', 'type': pd.DataFrame, 'doc': 'input data'},
+        {'name': 'df', 'type': _DATAFRAME_TYPE, 'doc': 'input data'},
         {'name': 'name', 'type': str, 'doc': 'the name of this container', 'default': None},
         {
             'name': 'extra_ok',
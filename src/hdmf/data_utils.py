@@ -1,10 +1,12 @@
 import copy
 import math
 from abc import ABCMeta, abstractmethod
+from collections import deque
 from collections.abc import Iterable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from warnings import warn
-from typing import Tuple
-from itertools import product, chain
+from typing import Optional, Tuple
+from itertools import product, chain, islice
 
 try:
     from zarr import Array as ZarrArray
@@ -17,6 +19,20 @@ import numpy as np
 
 from .utils import docval, getargs, popargs, docval_macro, get_data_shape
 
+_worker_iterator = None  # the GenericDataChunkIterator used by the current worker process
+
+
+def _init_worker_iterator(iterator):
+    """Initialize a worker process of a GenericDataChunkIterator with a copy of the iterator"""
+    global _worker_iterator
+    _worker_iterator = iterator
+
+
+def _get_worker_data(selection):
+    """Get the data of the given selection from the GenericDataChunkIterator of the current worker process"""
+    return _worker_iterator._get_data(selection=selection)
+
+
 def append_data(data, arg):
     from hdmf.backends.hdf5.h5_utils import HDMFDataset
     if isinstance(data, (list, DataIO, HDMFDataset)):
@@ -200,6 +216,25 @@ class GenericDataChunkIterator(AbstractDataChunkIterator):
             doc="Dictionary of keyword arguments to be passed directly to tqdm.",
             default=None,
         ),
+        dict(
+            name="num_workers",
+            type=int,
+            doc=(
+                "Number of workers that fetch the next buffers concurrently while the current buffer is consumed. "
+                "If buffer_shape is not specified, the buffer shape is chosen so that num_workers + 1 buffers fit "
+                "within buffer_gb. Defaults to fetching one buffer at a time when it is requested."
+            ),
+            default=None,
+        ),
+        dict(
+            name="executor_type",
+            type=str,
+            doc=(
+                "The type of workers used if num_workers is specified, either 'thread' or 'process'. "
+                "Process workers require the iterator to be picklable, i.e., to define _to_dict and _from_dict."
+            ),
+            default="thread",
+        ),
     )
 
     @docval(*__docval_init)
@@ -222,6 +257,8 @@ class GenericDataChunkIterator(AbstractDataChunkIterator):
             self.display_progress,
             progress_bar_class,
             progress_bar_options,
+            self.num_workers,
+            self.executor_type,
         ) = getargs(
             "buffer_gb",
             "buffer_shape",
@@ -230,6 +267,8 @@ class GenericDataChunkIterator(AbstractDataChunkIterator):
             "display_progress",
             "progress_bar_class",
             "progress_bar_options",
+            "num_workers",
+            "executor_type",
             kwargs,
         )
         self.progress_bar_options = progress_bar_options or dict()
@@ -244,9 +283,23 @@ class GenericDataChunkIterator(AbstractDataChunkIterator):
         assert (chunk_mb is not None) != (
             chunk_shape is not None
         ), "Only one of 'chunk_mb' or 'chunk_shape' can be specified!"
+        assert self.num_workers is None or self.num_workers > 0, (
+            f"num_workers ({self.num_workers}) must be greater than zero!"
+        )
+        assert self.executor_type in ("thread", "process"), (
+            f"executor_type ({self.executor_type}) must be either 'thread' or 'process'!"
+        )
+        if buffer_gb is not None and self.num_workers is not None:
+            # the buffer being consumed and the buffers being fetched by the workers share the budget
+            buffer_gb = buffer_gb / (self.num_workers + 1)
 
         self._dtype = self._get_dtype()
         self._maxshape = tuple(int(x) for x in self._get_maxshape())
+        source_chunk_shape = self._get_source_chunk_shape()
+        self.source_chunk_shape = (
+            tuple(min(int(x), maxshape_axis) for x, maxshape_axis in zip(source_chunk_shape, self.maxshape))
+            if source_chunk_shape else None
+        )
         chunk_shape = tuple(int(x) for x in chunk_shape) if chunk_shape else chunk_shape
         self.chunk_shape = chunk_shape or self._get_default_chunk_shape(chunk_mb=chunk_mb)
         buffer_shape = tuple(int(x) for x in buffer_shape) if buffer_shape else buffer_shape
@@ -274,6 +327,31 @@ class GenericDataChunkIterator(AbstractDataChunkIterator):
             f"evenly divide the buffer shape ({self.buffer_shape})!"
         )
 
+        self._set_buffer_selection_generator()
+
+        if self.display_progress:
+            try:
+                from tqdm import tqdm
+
+                progress_bar_class = progress_bar_class or tqdm
+
+                if "total" in self.progress_bar_options:
+                    warn("Option 'total' in 'progress_bar_options' is not allowed to be over-written! Ignoring.")
+                    self.progress_bar_options.pop("total")
+
+                self.progress_bar = progress_bar_class(total=self.num_buffers, **self.progress_bar_options)
+            except ImportError:
+                warn(
+                    "You must install tqdm to use the progress bar feature (pip install tqdm)! "
+                    "Progress bar is disabled."
+                )
+                self.display_progress = False
+
+        self._executor = None
+        self._pending_buffers = deque()  # (selection, future) of the buffers being fetched, in order
+
+    def _set_buffer_selection_generator(self):
+        """Set the number of buffers and the generator of the selections of the buffers from the buffer shape."""
         self.num_buffers = math.prod(
             [
                 math.ceil(maxshape_axis / buffer_axis)
@@ -303,24 +381,6 @@ class GenericDataChunkIterator(AbstractDataChunkIterator):
             )
         )
 
-        if self.display_progress:
-            try:
-                from tqdm import tqdm
-
-                progress_bar_class = progress_bar_class or tqdm
-
-                if "total" in self.progress_bar_options:
-                    warn("Option 'total' in 'progress_bar_options' is not allowed to be over-written! Ignoring.")
-                    self.progress_bar_options.pop("total")
-
-                self.progress_bar = progress_bar_class(total=self.num_buffers, **self.progress_bar_options)
-            except ImportError:
-                warn(
-                    "You must install tqdm to use the progress bar feature (pip install tqdm)! "
-                    "Progress bar is disabled."
-                )
-                self.display_progress = False
-
     @docval(
         dict(
             name="chunk_mb",
@@ -350,7 +410,27 @@ class GenericDataChunkIterator(AbstractDataChunkIterator):
             v = tuple(math.floor(x / non_unit_min_v) if x != 1 else x for x in v)
             prod_v = math.prod(v)
         k = math.floor((chunk_bytes / (prod_v * itemsize)) ** (1 / n_dims))
-        return tuple([min(k * x, self.maxshape[dim]) for dim, x in enumerate(v)])
+        chunk_shape = tuple([min(k * x, self.maxshape[dim]) for dim, x in enumerate(v)])
+        if self.source_chunk_shape is not None:
+            chunk_shape = tuple(
+                self._align_chunk_axis(chunk_axis, source_axis, maxshape_axis)
+                for chunk_axis, source_axis, maxshape_axis in zip(chunk_shape, self.source_chunk_shape, self.maxshape)
+            )
+        return chunk_shape
+
+    @staticmethod
+    def _align_chunk_axis(chunk_axis: int, source_axis: int, maxshape_axis: int) -> int:
+        """
+        Align an axis of the chunk shape with an axis of the source chunk shape.
+
+        The aligned axis is the largest multiple of the source axis that does not exceed the chunk axis or, if the
+        chunk axis is smaller than the source axis, the largest divisor of the source axis that does not exceed it.
+        """
+        if chunk_axis >= maxshape_axis:
+            return maxshape_axis
+        if chunk_axis >= source_axis:
+            return chunk_axis // source_axis * source_axis
+        return next(x for x in range(chunk_axis, 0, -1) if source_axis % x == 0)
 
     @docval(
         dict(
@@ -378,12 +458,26 @@ class GenericDataChunkIterator(AbstractDataChunkIterator):
                 buffer_gb * 1e9 / (math.prod(self.chunk_shape) * self.dtype.itemsize)
             ) ** (1 / len(self.chunk_shape))
         )
-        return tuple(
+        buffer_shape = tuple(
             [
                 min(max(k * x, self.chunk_shape[j]), self.maxshape[j])
                 for j, x in enumerate(self.chunk_shape)
             ]
         )
+        if self.source_chunk_shape is not None:
+            # round each axis down to a multiple of both the chunk and source chunk axes, so that no source chunk
+            # is read by more than one buffer, even if this exceeds buffer_gb
+            aligned_buffer_shape = list()
+            for buffer_axis, chunk_axis, source_axis, maxshape_axis in zip(
+                buffer_shape, self.chunk_shape, self.source_chunk_shape, self.maxshape
+            ):
+                unit = chunk_axis * source_axis // math.gcd(chunk_axis, source_axis)
+                if buffer_axis == maxshape_axis or unit >= maxshape_axis:
+                    aligned_buffer_shape.append(maxshape_axis)
+                else:
+                    aligned_buffer_shape.append(max(buffer_axis // unit, 1) * unit)
+            buffer_shape = tuple(aligned_buffer_shape)
+        return buffer_shape
 
     def __iter__(self):
         return self
@@ -395,6 +489,8 @@ class GenericDataChunkIterator(AbstractDataChunkIterator):
         :returns: DataChunk object with the data and selection of the current buffer.
         :rtype: DataChunk
         """
+        if self.num_workers is not None:
+            return self._next_prefetched()
         try:
             buffer_selection = next(self.buffer_selection_generator)
 
@@ -409,6 +505,104 @@ class GenericDataChunkIterator(AbstractDataChunkIterator):
                 self.progress_bar.write("\n")
             raise StopIteration
 
+    def shrink_buffer(self, buffer_gb: Optional[float] = None, buffer_shape: Optional[Tuple[int, ...]] = None) -> bool:
+        """
+        Reduce the buffer shape so that the buffers held at once take at most buffer_gb, e.g., to fit a memory budget.
+
+        If num_workers is set, buffer_gb is shared by the buffer being consumed and the buffers being fetched. The
+        buffer shape is not increased and is at least the chunk shape. Alternatively, the reduced buffer shape can be
+        given as buffer_shape, e.g., to restore the buffer shape of an iterator that was shrunk before it was pickled.
+        Must be called before the first buffer is retrieved.
+
+        :returns: Whether the buffer shape was reduced.
+        """
+        assert (buffer_gb is not None) != (buffer_shape is not None), (
+            "Exactly one of 'buffer_gb' or 'buffer_shape' must be specified!"
+        )
+        if buffer_shape is None:
+            if self.num_workers is not None:
+                buffer_gb = buffer_gb / (self.num_workers + 1)
+            buffer_shape = self._get_default_buffer_shape(buffer_gb=buffer_gb)
+        buffer_shape = tuple(int(x) for x in buffer_shape)
+        if math.prod(buffer_shape) >= math.prod(self.buffer_shape):
+            return False
+        self.buffer_shape = buffer_shape
+        self._set_buffer_selection_generator()
+        if self.display_progress:
+            self.progress_bar.total = self.num_buffers
+        return True
+
+    @property
+    def buffer_nbytes(self) -> int:
+        """The maximum number of bytes of the buffers held at once, including the buffers being fetched."""
+        num_buffers = 1 if self.num_workers is None else self.num_workers + 1
+        return math.prod(self.buffer_shape) * self.dtype.itemsize * num_buffers
+
+    def skip_buffers(self, num_buffers: int):
+        """
+        Skip the next buffers without reading them, e.g., to resume writing the iterator after num_buffers buffers.
+
+        Must be called before the first buffer is retrieved.
+        """
+        for _ in islice(self.buffer_selection_generator, num_buffers):
+            if self.display_progress:
+                self.progress_bar.update(n=1)
+
+    def _submit_buffers(self, num_buffers: int):
+        """Submit the next buffer selections to the workers until num_buffers buffers are being fetched."""
+        if self._executor is None:
+            if self.executor_type == "process":
+                from concurrent.futures import ProcessPoolExecutor
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.num_workers, initializer=_init_worker_iterator, initargs=(self,)
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.num_workers)
+        while len(self._pending_buffers) < num_buffers:
+            buffer_selection = next(self.buffer_selection_generator, None)
+            if buffer_selection is None:
+                break
+            if self.executor_type == "process":
+                future = self._executor.submit(_get_worker_data, buffer_selection)
+            else:
+                future = self._executor.submit(self._get_data, selection=buffer_selection)
+            self._pending_buffers.append((buffer_selection, future))
+
+    def _next_prefetched(self):
+        """
+        Retrieve the next DataChunk object from the buffers fetched by the workers.
+
+        At most num_workers buffers are fetched ahead of the buffer that is returned, and the buffers are returned
+        in the order of buffer_selection_generator.
+        """
+        self._submit_buffers(num_buffers=1)
+        if len(self._pending_buffers) == 0:
+            self._shutdown_executor()
+            if self.display_progress:
+                self.progress_bar.write("\n")
+            raise StopIteration
+        buffer_selection, future = self._pending_buffers.popleft()
+        self._submit_buffers(num_buffers=self.num_workers - 1)
+        try:
+            data = future.result()
+        except BaseException:
+            self._shutdown_executor()
+            raise
+        # fetch the next buffer while the returned buffer is consumed
+        self._submit_buffers(num_buffers=self.num_workers)
+        if self.display_progress:
+            self.progress_bar.update(n=1)
+        return DataChunk(data=data, selection=buffer_selection)
+
+    def _shutdown_executor(self):
+        """Stop the workers, discarding the buffers that are still being fetched."""
+        for _, future in self._pending_buffers:
+            future.cancel()
+        self._pending_buffers.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def __reduce__(self) -> Tuple[Callable, Iterable]:
         instance_constructor = self._from_dict
         initialization_args = (self._to_dict(),)
@@ -441,6 +635,16 @@ class GenericDataChunkIterator(AbstractDataChunkIterator):
         """Retrieve the dtype of the data using minimal I/O."""
         raise NotImplementedError("The setter for the internal dtype has not been built for this DataChunkIterator!")
 
+    def _get_source_chunk_shape(self) -> Optional[Tuple[int, ...]]:
+        """
+        Optional method to add in child classes to report the chunk shape of the source, e.g., an h5py.Dataset.
+
+        If a shape is returned, the default chunk shape is aligned with the source chunks and the default buffer
+        shape is a multiple of both the chunk shape and the source chunk shape, so that each source chunk is read
+        by a single buffer.
+        """
+        return None
+
     def _to_dict(self) -> dict:
         """Optional method to add in child classes to enable pickling (required for multiprocessing)."""
         raise NotImplementedError(
@@ -496,7 +700,14 @@ class DataChunkIterator(AbstractDataChunkIterator):
          'default': None},
         {'name': 'dtype', 'type': np.dtype, 'doc': 'The Numpy data type for the array', 'default': None},
         {'name': 'buffer_size', 'type': int, 'doc': 'Number of values to be buffered in a chunk', 'default': 1},
-        {'name': 'iter_axis', 'type': int, 'doc': 'The dimension to iterate over', 'default': 0}
+        {'name': 'iter_axis', 'type': int, 'doc': 'The dimension to iterate over', 'default': 0},
+        {'name': 'blocks', 'type': bool,
+         'doc': 'If True, the iterator returns blocks of values along the iteration dimension, i.e., arrays with the '
+                'same number of dimensions as the data array, instead of one value at a time. Blocks are not split, '
+                'i.e., a chunk consists of whole blocks with at least buffer_size values unless the iterator is '
+                'exhausted, and a block with at least buffer_size values is used as a chunk without copying it. '
+                'None blocks are skipped.',
+         'default': False}
     )
 
     @docval(*__docval_init)
@@ -512,10 +723,11 @@ class DataChunkIterator(AbstractDataChunkIterator):
                                                                                              'buffer_size',
                                                                                              'iter_axis',
                                                                                              kwargs)
+        self.blocks = getargs('blocks', kwargs)
         self.chunk_index = 0
         # Create an iterator for the data if possible
         if isinstance(self.data, Iterable):
-            if self.iter_axis != 0 and isinstance(self.data, (list, tuple)):
+            if self.iter_axis != 0 and isinstance(self.data, (list, tuple)) and not self.blocks:
                 warn('Iterating over an axis other than the first dimension of list or tuple data '
                      'involves converting the data object to a numpy ndarray, which may incur a computational '
                      'cost.')
@@ -542,7 +754,7 @@ class DataChunkIterator(AbstractDataChunkIterator):
                     self.__data_iter = iter(self.data)
             # Try to get an accurate idea of __maxshape for other Python data structures if possible.
             # Don't just call get_data_shape for a generator as that would potentially trigger loading of all the data
-            elif isinstance(self.data, list) or isinstance(self.data, tuple):
+            elif (isinstance(self.data, list) or isinstance(self.data, tuple)) and not self.blocks:
                 self.__maxshape = get_data_shape(self.data, strict_no_data_load=True)
 
         # If we have a data iterator and do not know the dtype, then read the first chunk
@@ -576,7 +788,9 @@ class DataChunkIterator(AbstractDataChunkIterator):
         :returns: self.__next_chunk, i.e., the DataChunk object describing the next chunk
         """
         from h5py import Dataset as H5Dataset
-        if isinstance(self.data, H5Dataset):
+        # read arrays (except object arrays, which may contain None values) by slicing rather than by iterating
+        if isinstance(self.data, H5Dataset) or (isinstance(self.data, np.ndarray) and self.data.dtype != object
+                                                and self.data.ndim == len(self.maxshape)):
             start_index = self.chunk_index * self.buffer_size
             stop_index = start_index + self.buffer_size
             iter_data_bounds = self.data.shape[self.iter_axis]
@@ -592,42 +806,19 @@ class DataChunkIterator(AbstractDataChunkIterator):
                 self.__next_chunk.data = self.data[selection]
                 self.__next_chunk.selection = selection
         elif self.__data_iter is not None:
-            # the pieces in the buffer - first dimension consists of individual calls to next
-            iter_pieces = []
             # offset of where data begins - shift the selection of where to place this chunk by this much
             curr_chunk_offset = 0
             read_next_empty = False
-            while len(iter_pieces) < self.buffer_size:
-                try:
-                    dat = next(self.__data_iter)
-                    if dat is None and len(iter_pieces) == 0:
-                        # Skip forward in our chunk until we find data
-                        curr_chunk_offset += 1
-                    elif dat is None and len(iter_pieces) > 0:
-                        # Stop iteration if we hit empty data while constructing our block
-                        # Buffer may not be full.
-                        read_next_empty = True
-                        break
-                    else:
-                        # Add pieces of data to our buffer
-                        iter_pieces.append(np.asarray(dat))
-                except StopIteration:
-                    break
-
-            if len(iter_pieces) == 0:
-                self.__next_chunk = DataChunk(None, None)  # signal end of iteration
+            if self.blocks:
+                data = self.__read_blocks()
             else:
-                # concatenate all the pieces into the chunk along the iteration axis
-                piece_shape = list(get_data_shape(iter_pieces[0]))
-                piece_shape.insert(self.iter_axis, 1)  # insert the missing axis
-                next_chunk_shape = piece_shape.copy()
-                next_chunk_shape[self.iter_axis] *= len(iter_pieces)
-                next_chunk_size = next_chunk_shape[self.iter_axis]
+                data, curr_chunk_offset, read_next_empty = self.__read_pieces()
 
-                # use the piece dtype because the actual dtype may not have been determined yet
-                # NOTE: this could be problematic if a generator returns e.g. floats first and ints later
-                self.__next_chunk.data = np.empty(next_chunk_shape, dtype=iter_pieces[0].dtype)
-                self.__next_chunk.data = np.stack(iter_pieces, axis=self.iter_axis)
+            if data is None:
+                self.__next_chunk = DataChunk(None, None)  # signal end of iteration
+            else:
+                self.__next_chunk.data = data
+                next_chunk_size = data.shape[self.iter_axis]
 
                 selection = [slice(None)] * len(self.maxshape)
                 selection[self.iter_axis] = slice(self.__next_chunk_start + curr_chunk_offset,
@@ -645,6 +836,70 @@ class DataChunkIterator(AbstractDataChunkIterator):
         self.chunk_index += 1
         return self.__next_chunk
 
+    def __read_pieces(self):
+        """
+        Read up to buffer_size values from self.__data_iter into a buffer that is allocated once for the chunk
+
+        :returns: tuple with the chunk data (None if no values were read), the number of None values that were
+                  skipped before the first value, and whether reading stopped because of a None value
+        """
+        buffer = None  # the chunk with the iteration axis moved to the front, filled in place
+        num_pieces = 0
+        curr_chunk_offset = 0
+        read_next_empty = False
+        while num_pieces < self.buffer_size:
+            try:
+                dat = next(self.__data_iter)
+            except StopIteration:
+                break
+            if dat is None and num_pieces == 0:
+                # Skip forward in our chunk until we find data
+                curr_chunk_offset += 1
+                continue
+            elif dat is None:
+                # Stop iteration if we hit empty data while constructing our block
+                # Buffer may not be full.
+                read_next_empty = True
+                break
+            dat = np.asarray(dat)
+            if buffer is None:
+                # use the piece dtype because the actual dtype may not have been determined yet
+                buffer = np.empty((self.buffer_size, ) + dat.shape, dtype=dat.dtype)
+            elif dat.shape != buffer.shape[1:]:
+                raise ValueError("all input arrays must have the same shape")
+            elif dat.dtype != buffer.dtype and not np.can_cast(dat.dtype, buffer.dtype):
+                # e.g., a generator returns ints first and floats later
+                buffer = buffer.astype(np.result_type(buffer.dtype, dat.dtype))
+            buffer[num_pieces] = dat
+            num_pieces += 1
+        if buffer is None:
+            return None, curr_chunk_offset, read_next_empty
+        return np.moveaxis(buffer[:num_pieces], 0, self.iter_axis), curr_chunk_offset, read_next_empty
+
+    def __read_blocks(self):
+        """
+        Read whole blocks from self.__data_iter until they contain at least buffer_size values
+
+        :returns: the chunk data, or None if no blocks were read
+        """
+        blocks = list()
+        num_values = 0
+        while num_values < self.buffer_size:
+            try:
+                dat = next(self.__data_iter)
+            except StopIteration:
+                break
+            if dat is None:
+                continue
+            dat = np.asarray(dat)
+            blocks.append(dat)
+            num_values += dat.shape[self.iter_axis]
+        if len(blocks) == 0:
+            return None
+        if len(blocks) == 1:
+            return blocks[0]
+        return np.concatenate(blocks, axis=self.iter_axis)
+
     def __next__(self):
         """
         Return the next data chunk or raise a StopIteration exception if all chunks have been retrieved.
@@ -731,7 +986,10 @@ class DataChunkIterator(AbstractDataChunkIterator):
                 # Size of self.__next_chunk.data along self.iter_axis is not accurate for maxshape because it is just a
                 # chunk. So try to set maxshape along the dimension self.iter_axis based on the shape of self.data if
                 # possible. Otherwise, use None to represent an unlimited size
-                if hasattr(self.data, '__len__') and self.iter_axis == 0:
+                if self.blocks:
+                    # the number of blocks does not determine the size
+                    self.__maxshape[self.iter_axis] = None
+                elif hasattr(self.data, '__len__') and self.iter_axis == 0:
                     # special case of 1-D array
                     self.__maxshape[0] = len(self.data)
                 else:
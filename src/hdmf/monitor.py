@@ -1,6 +1,8 @@
 from abc import ABCMeta, abstractmethod
 
-from .data_utils import AbstractDataChunkIterator, DataChunkIterator, DataChunk
+import numpy as np
+
+from .data_utils import AbstractDataChunkIterator, DataChunk
 from .utils import docval, getargs
 
 
@@ -9,14 +11,27 @@ class NotYetExhausted(Exception):
 
 
 class DataChunkProcessor(AbstractDataChunkIterator, metaclass=ABCMeta):
-
-    @docval({'name': 'data', 'type': DataChunkIterator, 'doc': 'the DataChunkIterator to analyze'})
+    """
+    Process the DataChunks of a DataChunkIterator as they are iterated over, e.g., to compute summary statistics.
+
+    A DataChunkProcessor either wraps a DataChunkIterator and processes its chunks when iterated over, or is
+    passed to :py:class:`~hdmf.backends.hdf5.h5_utils.H5DataIO` as one of its chunk_processors, in which case the
+    chunks are processed as they are written. If the write_processor_attributes option of the H5DataIO is set, the
+    attributes from :py:meth:`get_attributes` are written to the dataset when all chunks have been written. These
+    attributes are not part of the HDMF or any other schema.
+    """
+
+    @docval({'name': 'data', 'type': AbstractDataChunkIterator, 'doc': 'the DataChunkIterator to analyze',
+             'default': None})
     def __init__(self, **kwargs):
         """Initialize the DataChunkIterator"""
         # Get the user parameters
         self.__dci = getargs('data', kwargs)
+        self.__done = False
 
     def __next__(self):
+        if self.__dci is None:
+            raise StopIteration
         try:
             dc = self.__dci.__next__()
         except StopIteration as e:
@@ -26,7 +41,7 @@ class DataChunkProcessor(AbstractDataChunkIterator, metaclass=ABCMeta):
         return dc
 
     def __iter__(self):
-        return iter(self.__dci)
+        return self
 
     def recommended_chunk_shape(self):
         return self.__dci.recommended_chunk_shape()
@@ -34,12 +49,28 @@ class DataChunkProcessor(AbstractDataChunkIterator, metaclass=ABCMeta):
     def recommended_data_shape(self):
         return self.__dci.recommended_data_shape()
 
+    @property
+    def dtype(self):
+        return self.__dci.dtype
+
+    @property
+    def maxshape(self):
+        return self.__dci.maxshape
+
+    def mark_exhausted(self):
+        ''' Mark that all data chunks have been processed, e.g., after the chunks were fed to process_data_chunk '''
+        self.__done = True
+
     def get_final_result(self, **kwargs):
         ''' Return the result of processing data fed by this DataChunkIterator '''
         if not self.__done:
             raise NotYetExhausted()
         return self.compute_final_result()
 
+    def get_attributes(self):
+        ''' Return a dict with the attributes to write to the dataset that the processed data were written to '''
+        raise NotImplementedError("get_attributes not implemented for %s" % self.__class__.__name__)
+
     @abstractmethod
     @docval({'name': 'data_chunk', 'type': DataChunk, 'doc': 'a chunk to process'})
     def process_data_chunk(self, **kwargs):
@@ -71,3 +102,107 @@ class NumSampleCounter(DataChunkProcessor):
     @docval(returns='the result of processing this stream')
     def compute_final_result(self, **kwargs):
         return self.__sample_count
+
+    def get_attributes(self):
+        return {'num_samples': self.get_final_result()}
+
+
+class SummaryStatistics(DataChunkProcessor):
+    """
+    Compute the number of values, number of NaN values, and minimum, maximum, mean, and standard deviation of the
+    values that are not NaN in a single pass over the chunks of real numeric data. Complex data are not supported.
+
+    The means and sums of squared differences from the mean of the chunks are combined with the parallel algorithm
+    of Chan et al., which is numerically stable for large numbers of values. The standard deviation is the
+    population standard deviation.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.__count = 0
+        self.__nan_count = 0
+        self.__min = None
+        self.__max = None
+        self.__mean = 0.
+        self.__m2 = 0.  # sum of squared differences from the mean
+
+    @docval({'name': 'data_chunk', 'type': DataChunk, 'doc': 'a chunk to process'})
+    def process_data_chunk(self, **kwargs):
+        dc = getargs('data_chunk', kwargs)
+        data = np.asarray(dc.data)
+        if data.dtype.kind == 'c':
+            raise ValueError("SummaryStatistics does not support complex data")
+        if data.dtype.kind == 'f':
+            nan = np.isnan(data)
+            nan_count = int(np.count_nonzero(nan))
+            if nan_count > 0:
+                self.__nan_count += nan_count
+                data = data[~nan]
+        data = data.ravel()
+        count = data.size
+        if count == 0:
+            return
+        chunk_min, chunk_max = data.min(), data.max()
+        self.__min = chunk_min if self.__min is None else min(self.__min, chunk_min)
+        self.__max = chunk_max if self.__max is None else max(self.__max, chunk_max)
+        chunk_mean = data.mean(dtype=np.float64)
+        chunk_m2 = np.square(data - chunk_mean).sum(dtype=np.float64)
+        total = self.__count + count
+        delta = chunk_mean - self.__mean
+        self.__mean += delta * count / total
+        self.__m2 += chunk_m2 + delta * delta * self.__count * count / total
+        self.__count = total
+
+    @docval(returns=('dict with the count, nan_count, min, max, mean, and std of the processed data. min, max, mean, '
+                     'and std are None if all values are NaN'))
+    def compute_final_result(self, **kwargs):
+        if self.__count == 0:
+            return dict(count=0, nan_count=self.__nan_count, min=None, max=None, mean=None, std=None)
+        return dict(count=self.__count, nan_count=self.__nan_count, min=self.__min, max=self.__max,
+                    mean=float(self.__mean), std=float(np.sqrt(self.__m2 / self.__count)))
+
+    def get_attributes(self):
+        return {'stats_%s' % k: v for k, v in self.get_final_result().items() if v is not None}
+
+
+class Histogram(DataChunkProcessor):
+    """
+    Compute the histogram of real numeric data in a single pass over the chunks, with fixed bin edges. Complex data
+    are not supported.
+
+    NaN values and values outside of the bin edges are not counted.
+    """
+
+    @docval({'name': 'bins', 'type': ('array_data', int),
+             'doc': 'the number of equal-width bins in range or the monotonically increasing bin edges'},
+            {'name': 'range', 'type': (tuple, list), 'doc': 'the lower and upper edges of the bins if bins is an int',
+             'default': None},
+            {'name': 'data', 'type': AbstractDataChunkIterator, 'doc': 'the DataChunkIterator to analyze',
+             'default': None})
+    def __init__(self, **kwargs):
+        bins, bin_range = getargs('bins', 'range', kwargs)
+        if isinstance(bins, int):
+            if bin_range is None:
+                raise ValueError("range is required if bins is the number of bins")
+            bins = np.linspace(bin_range[0], bin_range[1], bins + 1)
+        super().__init__(data=getargs('data', kwargs))
+        self.__bin_edges = np.asarray(bins)
+        self.__counts = np.zeros(len(self.__bin_edges) - 1, dtype=np.int64)
+
+    @docval({'name': 'data_chunk', 'type': DataChunk, 'doc': 'a chunk to process'})
+    def process_data_chunk(self, **kwargs):
+        dc = getargs('data_chunk', kwargs)
+        data = np.asarray(dc.data).ravel()
+        if data.dtype.kind == 'c':
+            raise ValueError("Histogram does not support complex data")
+        if data.dtype.kind == 'f':
+            data = data[~np.isnan(data)]
+        self.__counts += np.histogram(data, bins=self.__bin_edges)[0]
+
+    @docval(returns='tuple with the counts of the bins and the bin edges')
+    def compute_final_result(self, **kwargs):
+        return self.__counts, self.__bin_edges
+
+    def get_attributes(self):
+        counts, bin_edges = self.get_final_result()
+        return {'histogram_counts': counts, 'histogram_bin_edges': bin_edges}
@@ -1,9 +1,12 @@
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
 from .array import Array
-from .utils import ExtenderMeta, docval_macro, docval, getargs
+from .utils import ExtenderMeta, docval_macro, docval, getargs, popargs
+
+PREFETCH_BLOCK_NBYTES = 2**20  # default size of the blocks read ahead by PrefetchDataset = 1 MiB
 
 
 class Query(metaclass=ExtenderMeta):
@@ -138,7 +141,7 @@ class HDMFDataset(metaclass=ExtenderMeta):
         idx = self.__evaluate_key(key)
         return self.dataset[idx]
 
-    @docval({'name': 'dataset', 'type': ('array_data', Array), 'doc': 'the HDF5 file lazily evaluate'})
+    @docval({'name': 'dataset', 'type': ('array_data', Array, 'HDMFDataset'), 'doc': 'the HDF5 file lazily evaluate'})
     def __init__(self, **kwargs):
         super().__init__()
         self.__dataset = getargs('dataset', kwargs)
@@ -170,6 +173,165 @@ class HDMFDataset(metaclass=ExtenderMeta):
         pass # pragma: no cover
 
 
+class PrefetchDataset(HDMFDataset):
+    """
+    An HDMFDataset that reads ahead along the first dimension of a dataset that is read sequentially
+
+    When a read starts where the previous read stopped, the data is read in blocks of ``block_size`` elements along
+    the first dimension, and the next ``blocks`` blocks are read on a background thread so that later reads are
+    served from memory. Other reads are passed through to the dataset and discard the blocks that were read ahead.
+    Read-ahead is only used for datasets whose slices are numpy arrays.
+
+    Call ``close`` or use the PrefetchDataset as a context manager to stop the background thread.
+    """
+
+    @docval({'name': 'dataset', 'type': ('array_data', Array), 'doc': 'the dataset to read ahead from'},
+            {'name': 'blocks', 'type': int, 'doc': 'the number of blocks to read ahead', 'default': 4},
+            {'name': 'block_size', 'type': int,
+             'doc': ('the number of elements along the first dimension in each block. By default, the chunk size '
+                     'along the first dimension if the dataset is chunked, or about 1 MiB of data otherwise'),
+             'default': None})
+    def __init__(self, **kwargs):
+        blocks, block_size = popargs('blocks', 'block_size', kwargs)
+        super().__init__(**kwargs)
+        if blocks < 1:
+            raise ValueError("blocks must be a positive integer, got %d" % blocks)
+        if block_size is None:
+            block_size = self.__get_default_block_size()
+        elif block_size < 1:
+            raise ValueError("block_size must be a positive integer, got %d" % block_size)
+        self.__nblocks = blocks
+        self.__block_size = block_size
+        self.__executor = None
+        self.__blocks = dict()  # map from index of block to Future of the data of the block
+        self.__prev_stop = None  # the stop of the previous read along the first dimension
+        self.__enabled = True  # whether slices of the dataset are numpy arrays that can be read ahead
+
+    def __get_default_block_size(self):
+        chunks = getattr(self.dataset, 'chunks', None)
+        if chunks:
+            return chunks[0]
+        shape = getattr(self.dataset, 'shape', None)
+        dtype = getattr(self.dataset, 'dtype', None)
+        if shape is None or dtype is None:
+            return 1
+        row_nbytes = int(np.prod(shape[1:], dtype=int)) * np.dtype(dtype).itemsize
+        return max(1, PREFETCH_BLOCK_NBYTES // max(1, row_nbytes))
+
+    @property
+    def blocks(self):
+        """The number of blocks to read ahead"""
+        return self.__nblocks
+
+    @property
+    def block_size(self):
+        """The number of elements along the first dimension in each block"""
+        return self.__block_size
+
+    @property
+    def shape(self):
+        return self.dataset.shape
+
+    def __split_key(self, key):
+        """
+        Split the key into the contiguous range of the first dimension that it selects and the key for the other
+        dimensions. Return None if the key does not select a contiguous range of the first dimension.
+        """
+        first, rest = key, ()
+        if isinstance(key, tuple):
+            if len(key) == 0 or any(k is Ellipsis for k in key):
+                return None
+            first, rest = key[0], key[1:]
+        n = len(self)
+        if isinstance(first, (int, np.integer)) and not isinstance(first, bool):
+            start = int(first) + n if first < 0 else int(first)
+            if not 0 <= start < n:
+                return None
+            return start, start + 1, True, rest
+        if isinstance(first, slice) and first.step in (None, 1):
+            start, stop, _ = first.indices(n)
+            if stop > start:
+                return start, stop, False, rest
+        return None
+
+    def __discard(self):
+        for future in self.__blocks.values():
+            future.cancel()
+        self.__blocks.clear()
+
+    def __read_block(self, idx):
+        start = idx * self.__block_size
+        return self.dataset[start:min(start + self.__block_size, len(self))]
+
+    def __submit(self, idx):
+        if idx not in self.__blocks:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='hdmf-prefetch')
+            self.__blocks[idx] = self.__executor.submit(self.__read_block, idx)
+
+    def __read_rows(self, start, stop):
+        """Read the given range of the first dimension from the blocks and read ahead the next blocks"""
+        bs = self.__block_size
+        first, last = start // bs, (stop - 1) // bs
+        for idx in [idx for idx in self.__blocks if idx < first]:
+            self.__blocks.pop(idx).cancel()
+        for idx in range(first, last + 1):
+            self.__submit(idx)
+        nblocks = -(-len(self) // bs)
+        for idx in range(last + 1, min(last + 1 + self.__nblocks, nblocks)):
+            self.__submit(idx)
+        data = [self.__blocks[idx].result() for idx in range(first, last + 1)]
+        if not all(isinstance(d, np.ndarray) for d in data):
+            return None
+        if len(data) == 1:
+            return data[0][start - first * bs:stop - first * bs]
+        return np.concatenate(data)[start - first * bs:stop - first * bs]
+
+    def __read(self, key):
+        if isinstance(key, Query):
+            return super().__getitem__(key)
+        return self.dataset[key]
+
+    def __getitem__(self, key):
+        split = self.__split_key(key) if self.__enabled else None
+        if split is None:
+            self.__discard()
+            self.__prev_stop = None
+            return self.__read(key)
+        start, stop, is_int, rest = split
+        sequential = start == self.__prev_stop or start // self.__block_size in self.__blocks
+        self.__prev_stop = stop
+        if not sequential:
+            self.__discard()
+            return self.__read(key)
+        rows = self.__read_rows(start, stop)
+        if rows is None:
+            self.__enabled = False
+            self.__discard()
+            return self.__read(key)
+        if is_int:
+            rows = rows[0]
+            return rows[rest] if len(rest) > 0 else rows
+        return rows[(slice(None),) + rest] if len(rest) > 0 else rows
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def close(self):
+        """Discard the blocks that were read ahead and stop the background thread"""
+        self.__discard()
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
 class ReferenceResolver(metaclass=ABCMeta):
     """
     A base class for classes that resolve references
@@ -1,6 +1,10 @@
+import hashlib
+import logging
 import os.path
+import pickle
 import ruamel.yaml as yaml
 import string
+import tempfile
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
 from copy import copy
@@ -11,6 +15,8 @@ from .catalog import SpecCatalog
 from .spec import DatasetSpec, GroupSpec
 from ..utils import docval, getargs, popargs, get_docval
 
+NAMESPACE_CACHE_VERSION = 1  # increment when the format of cached namespaces changes
+
 _namespace_args = [
     {'name': 'doc', 'type': str, 'doc': 'a description about what this namespace represents'},
     {'name': 'name', 'type': str, 'doc': 'the name of this namespace'},
@@ -222,6 +228,106 @@ class YAMLSpecReader(SpecReader):
         return os.path.join(self.source, spec_path)
 
 
+class _NamespaceCacheUnpickler(pickle.Unpickler):
+    """Unpickle cached namespaces and specifications, which contain only builtin types and dates parsed from YAML"""
+
+    __allowed_globals = {'datetime': {'date', 'datetime', 'timedelta', 'timezone'}}
+
+    def find_class(self, module, name):
+        if name not in self.__allowed_globals.get(module, ()):
+            raise pickle.UnpicklingError("'%s.%s' is not allowed in a namespace cache file" % (module, name))
+        return super().find_class(module, name)
+
+
+class CachedYAMLSpecReader(YAMLSpecReader):
+    """
+    A YAMLSpecReader that caches the namespaces and specifications read from a namespace file and the specification
+    files it includes in a binary cache file, so that they do not need to be parsed again when the namespace file is
+    loaded later, e.g., by another process.
+
+    The cache file is keyed by the hash of the namespace file and the version of HDMF. It is used only if the hashes
+    of the included specification files match the hashes of the files when the cache was written.
+
+    The cache directory must be trusted and private to the user. Cache files may only contain the builtin types that
+    the YAML files are parsed into, and cache files with other content are ignored.
+    """
+
+    @docval({'name': 'cache_dir', 'type': str,
+             'doc': ('the directory in which to cache the namespaces. Only use a directory that is trusted and that '
+                     'cannot be written by other users.')},
+            {'name': 'indir', 'type': str, 'doc': 'the path spec files are relative to', 'default': '.'})
+    def __init__(self, **kwargs):
+        self.__cache_dir = popargs('cache_dir', kwargs)
+        super().__init__(**kwargs)
+        self.__specs = dict()
+        self.logger = logging.getLogger('%s.%s' % (self.__class__.__module__, self.__class__.__qualname__))
+
+    @property
+    def cache_dir(self):
+        """The directory in which to cache the namespaces"""
+        return self.__cache_dir
+
+    def read_namespace(self, namespace_path):
+        with open(namespace_path, 'rb') as f:
+            ns_hash = hashlib.sha256(f.read()).hexdigest()
+        from .. import __version__
+        key = repr((NAMESPACE_CACHE_VERSION, __version__, os.path.realpath(namespace_path), ns_hash))
+        cache_path = os.path.join(self.__cache_dir, hashlib.sha256(key.encode('UTF-8')).hexdigest() + '.pkl')
+        cached = self.__load_cache(cache_path)
+        if cached is not None:
+            self.__specs = cached['specs']
+            return cached['namespaces']
+        namespaces = super().read_namespace(namespace_path)
+        sources = [s['source'] for ns in namespaces for s in ns['schema'] if 'source' in s]
+        try:
+            specs = {source: super(CachedYAMLSpecReader, self).read_spec(source) for source in sources}
+            hashes = {source: self.__hash_spec_file(source) for source in sources}
+        except Exception as e:
+            # e.g., a spec file that is not needed because its namespace is already loaded does not exist
+            self.logger.debug("Could not cache the namespaces in '%s': %s" % (namespace_path, e))
+            return namespaces
+        self.__write_cache(cache_path, dict(hashes=hashes, namespaces=namespaces, specs=specs))
+        self.__specs = specs
+        return namespaces
+
+    def read_spec(self, spec_path):
+        specs = self.__specs.pop(spec_path, None)
+        if specs is None:
+            specs = super().read_spec(spec_path)
+        return specs
+
+    def __hash_spec_file(self, spec_path):
+        if not os.path.isabs(spec_path):
+            spec_path = os.path.join(self.source, spec_path)
+        with open(spec_path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def __load_cache(self, cache_path):
+        """Read the cached namespaces and specs. Return None if they cannot be read or are out of date."""
+        if not os.path.isfile(cache_path):
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = _NamespaceCacheUnpickler(f).load()
+            for source, spec_hash in cached['hashes'].items():
+                if self.__hash_spec_file(source) != spec_hash:
+                    return None
+        except Exception as e:
+            self.logger.debug("Could not read cached namespaces from '%s': %s" % (cache_path, e))
+            return None
+        return cached
+
+    def __write_cache(self, cache_path, cached):
+        """Write the namespaces and specs to the cache file if possible"""
+        try:
+            os.makedirs(self.__cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=self.__cache_dir, suffix='.tmp', delete=False) as f:
+                pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, cache_path)  # replace atomically so that readers never see a partial cache file
+        except Exception as e:
+            self.logger.debug("Could not write cached namespaces to '%s': %s" % (cache_path, e))
+
+
 class NamespaceCatalog:
 
     @docval({'name': 'group_spec_cls', 'type': type,
@@ -510,16 +616,28 @@ class NamespaceCatalog:
             {'name': 'reader',
              'type': SpecReader,
              'doc': 'the class to user for reading specifications', 'default': None},
+            {'name': 'cache_dir', 'type': str,
+             'doc': ('a directory in which to cache the parsed namespaces and specifications, so that they are not '
+                     'parsed again when the namespace file is loaded later. Defaults to the value of the '
+                     'HDMF_NAMESPACE_CACHE_DIR environment variable. Ignored if reader is given. Only use a '
+                     'directory that is trusted and that cannot be written by other users.'),
+             'default': None},
             returns='a dictionary describing the dependencies of loaded namespaces', rtype=dict)
     def load_namespaces(self, **kwargs):
         """Load the namespaces in the given file"""
-        namespace_path, resolve, reader = getargs('namespace_path', 'resolve', 'reader', kwargs)
+        namespace_path, resolve, reader, cache_dir = getargs('namespace_path', 'resolve', 'reader', 'cache_dir',
+                                                             kwargs)
         if reader is None:
             # load namespace definition from file
             if not os.path.exists(namespace_path):
                 msg = "namespace file '%s' not found" % namespace_path
                 raise IOError(msg)
-            reader = YAMLSpecReader(indir=os.path.dirname(namespace_path))
+            if cache_dir is None:
+                cache_dir = os.environ.get('HDMF_NAMESPACE_CACHE_DIR')
+            if cache_dir:
+                reader = CachedYAMLSpecReader(cache_dir=cache_dir, indir=os.path.dirname(namespace_path))
+            else:
+                reader = YAMLSpecReader(indir=os.path.dirname(namespace_path))
         ns_path_key = os.path.join(reader.source, os.path.basename(namespace_path))
         ret = self.__included_specs.get(ns_path_key)
         if ret is None:
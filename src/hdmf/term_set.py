@@ -5,7 +5,6 @@ from .utils import docval
 import warnings
 import numpy as np
 from .data_utils import append_data, extend_data
-from ruamel.yaml import YAML
 
 
 class TermSet:
@@ -175,6 +174,7 @@ class TermSet:
         schema_dict = schema_as_dict(schema)
         schemasheet_schema_path = os.path.join(self.schemasheets_folder, f"{schema_dict['name']}.yaml")
 
+        from ruamel.yaml import YAML
         with open(schemasheet_schema_path, "w") as f:
             yaml=YAML(typ='safe')
             yaml.dump(schema_dict, f)
@@ -381,6 +381,7 @@ class TypeConfigurator:
         """
         Load the configuration file for validation on the fields defined for the objects within the file.
         """
+        from ruamel.yaml import YAML
         with open(config_path, 'r') as config:
             yaml=YAML(typ='safe')
             termset_config = yaml.load(config)
@@ -3,6 +3,8 @@ import copy as _copy
 import types
 import warnings
 from abc import ABCMeta
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
 
 import h5py
@@ -23,6 +25,8 @@ except ImportError:
     pass
 
 
+_TermSetWrapper = None  # hdmf.term_set.TermSetWrapper, which is imported when docval is first called
+
 # code to signify how to handle positional arguments in docval
 AllowPositional = Enum('AllowPositional', 'ALLOWED WARNING ERROR')
 
@@ -188,8 +192,134 @@ def __fmt_str_quotes(x):
     return str(x)
 
 
+def __compile_type_check(argtype):
+    """
+    Compile a docval argument type into a function that checks whether a value that is not None has the type
+
+    Types that are checked with :py:func:`isinstance` are collected into a single tuple and types given as class
+    names are collected into a set, so that values are checked without walking the argument type.
+
+    :return: function that takes a value and returns True if the value is a valid instance of argtype
+    """
+    if argtype is None:
+        return lambda value: True
+    classes = list()
+    names = set()
+    for t in (argtype if isinstance(argtype, (list, tuple)) else (argtype,)):
+        if isinstance(t, str):
+            if t in __macros:  # the types of macros can change, so check them when they are used
+                return lambda value: check_type(value, argtype)
+            elif t == 'uint':
+                classes.extend(__supported_uint_types)
+            elif t == 'int':
+                classes.extend(__supported_int_types)
+            elif t == 'float':
+                classes.extend(__supported_float_types)
+            elif t == 'bool':
+                classes.extend(__supported_bool_types)
+            else:
+                names.add(t)
+        elif t is int:
+            classes.extend(__supported_int_types)
+        elif t is float:
+            classes.extend(__supported_float_types)
+        elif t is bool:
+            classes.extend(__supported_bool_types)
+        elif isinstance(t, type):
+            classes.append(t)
+        else:
+            return lambda value: check_type(value, argtype)
+    classes = tuple(classes)
+    if not names:
+        return lambda value: isinstance(value, classes)
+
+    def check(value):
+        if isinstance(value, classes):
+            return True
+        for cls in value.__class__.__mro__:
+            if cls.__name__ in names or f"{cls.__module__}.{cls.__qualname__}" in names:
+                return True
+        return False
+    return check
+
+
+def __compile_validator(validator):
+    """
+    Compile the argument specifications of docval once, so that they do not need to be analyzed for each call
+
+    :param validator: List of dicts from docval with the description of the arguments, with the arguments without
+                      a default value first
+    :return: Dict with:
+        * 'names' : List of the names of the arguments
+        * 'duplicated' : List of the names that are used by more than one argument
+        * 'positional' : List of (argument, type check) of the arguments without a default value
+        * 'keyword' : List of (argument, type check) of the arguments with a default value
+    """
+    names = [x['name'] for x in validator]
+    duplicated = [item for item, count in collections.Counter(names).items() if count > 1]
+    checks = [(arg, __compile_type_check(arg['type'])) for arg in validator]
+    return {'names': names,
+            'duplicated': duplicated,
+            'positional': [(arg, check) for arg, check in checks if 'default' not in arg],
+            'keyword': [(arg, check) for arg, check in checks if 'default' in arg]}
+
+
+# whether docval checks the types, shapes, and enumerated values of arguments. This is a context variable so that
+# disabling the checks applies only to the calling thread or asyncio task
+__validation_enabled = ContextVar('docval_validation_enabled', default=True)
+
+
+def set_docval_validation(enabled):
+    """
+    Enable or disable the checks of the types, shapes, and enumerated values of arguments by docval
+
+    Disabling the checks speeds up calls of functions decorated with docval, e.g., in production code that calls
+    them with arguments that are known to be valid. Missing and unrecognized arguments are still reported.
+
+    The setting applies only to the current context, i.e., the calling thread or asyncio task. Other threads
+    continue to check the arguments.
+
+    :param enabled: whether docval checks the arguments of functions
+    :type enabled: bool
+    """
+    __validation_enabled.set(bool(enabled))
+
+
+@contextmanager
+def skip_docval_validation():
+    """
+    Context manager to skip the checks of the types, shapes, and enumerated values of arguments by docval
+
+    Use this for trusted calls with arguments that are known to be valid. The checks are skipped only in the current
+    context, i.e., the calling thread or asyncio task. See :py:func:`set_docval_validation`.
+    """
+    token = __validation_enabled.set(False)
+    try:
+        yield
+    finally:
+        __validation_enabled.reset(token)
+
+
+def __check_shape(argname, argval, arg, value_errors):
+    """Check the shape of the given argument value and append any error to value_errors"""
+    valshape = get_data_shape(argval)
+    while valshape is None:
+        if argval is None:
+            break
+        if not hasattr(argval, argname):
+            fmt_val = (argval, argname, arg['shape'])
+            value_errors.append("cannot check shape of object '%s' for argument '%s' (expected shape '%s')" % fmt_val)
+            break
+        # unpack, e.g. if TimeSeries is passed for arg 'data', then TimeSeries.data is checked
+        argval = getattr(argval, argname)
+        valshape = get_data_shape(argval)
+    if valshape is not None and not __shape_okay_multi(argval, arg['shape']):
+        fmt_val = (argname, valshape, arg['shape'])
+        value_errors.append("incorrect shape for '%s' (got '%s', expected '%s')" % fmt_val)
+
+
 def __parse_args(validator, args, kwargs, enforce_type=True, enforce_shape=True, allow_extra=False,  # noqa: C901
-                 allow_positional=AllowPositional.ALLOWED):
+                 allow_positional=AllowPositional.ALLOWED, compiled=None):
     """
     Internal helper function used by the docval decorator to parse and validate function arguments
 
@@ -206,11 +336,22 @@ def __parse_args(validator, args, kwargs, enforce_type=True, enforce_shape=True,
                              AllowPositional.ALLOWED: positional arguments are allowed
                              AllowPositional.WARNING: return warning if positional arguments are supplied
                              AllowPositional.ERROR: return error if positional arguments are supplied
+    :param compiled: The validator compiled with __compile_validator, or None to compile it
 
     :return: Dict with:
         * 'args' : Dict all arguments where keys are the names and values are the values of the arguments.
         * 'errors' : List of string with error messages
     """
+    global _TermSetWrapper
+    if compiled is None:
+        compiled = __compile_validator(validator)
+    if _TermSetWrapper is None:
+        from .term_set import TermSetWrapper  # circular import fix
+        _TermSetWrapper = TermSetWrapper
+    if not __validation_enabled.get():
+        enforce_type = enforce_shape = enforce_enum = False
+    else:
+        enforce_enum = True
 
     ret = dict()
     syntax_errors = list()
@@ -221,23 +362,22 @@ def __parse_args(validator, args, kwargs, enforce_type=True, enforce_shape=True,
     extras = dict()  # has to be initialized to empty here, to avoid spurious errors reported upon early raises
     try:
         # check for duplicates in docval
-        names = [x['name'] for x in validator]
-        duplicated = [item for item, count in collections.Counter(names).items()
-                      if count > 1]
-        if duplicated:
+        if compiled['duplicated']:
             raise ValueError(
-                'The following names are duplicated: {}'.format(duplicated))
+                'The following names are duplicated: {}'.format(compiled['duplicated']))
 
         if allow_extra:  # extra keyword arguments are allowed so do not consider them when checking number of args
             if len(args) > len(validator):
                 raise TypeError(
-                    'Expected at most %d arguments %r, got %d positional' % (len(validator), names, len(args))
+                    'Expected at most %d arguments %r, got %d positional' % (len(validator), compiled['names'],
+                                                                             len(args))
                 )
         else:  # allow for keyword args
             if len(args) + len(kwargs) > len(validator):
                 raise TypeError(
                     'Expected at most %d arguments %r, got %d: %d positional and %d keyword %s'
-                    % (len(validator), names, len(args) + len(kwargs), len(args), len(kwargs), sorted(kwargs))
+                    % (len(validator), compiled['names'], len(args) + len(kwargs), len(args), len(kwargs),
+                       sorted(kwargs))
                 )
 
         if args:
@@ -249,15 +389,9 @@ def __parse_args(validator, args, kwargs, enforce_type=True, enforce_shape=True,
                 msg = 'Only keyword arguments (e.g., func(argname=value, ...)) are allowed for this method.'
                 syntax_errors.append(msg)
 
-        # iterate through the docval specification and find a matching value in args / kwargs
-        it = iter(validator)
-        arg = next(it)
-
         # process positional arguments of the docval specification (no default value)
         extras = dict(kwargs)
-        while True:
-            if 'default' in arg:
-                break
+        for arg, check in compiled['positional']:
             argname = arg['name']
             argval_set = False
             if argname in kwargs:
@@ -276,14 +410,13 @@ def __parse_args(validator, args, kwargs, enforce_type=True, enforce_shape=True,
             if not argval_set:
                 type_errors.append("missing argument '%s'" % argname)
             else:
-                from .term_set import TermSetWrapper # circular import fix
                 wrapper = None
-                if isinstance(argval, TermSetWrapper):
+                if isinstance(argval, _TermSetWrapper):
                     wrapper = argval
                     # we can use this to unwrap the dataset/attribute to use the "item" for docval to validate the type.
                     argval = argval.value
                 if enforce_type:
-                    if not check_type(argval, arg['type']):
+                    if argval is None or not check(argval):
                         if argval is None:
                             fmt_val = (argname, __format_type(arg['type']))
                             type_errors.append("None is not allowed for '%s' (expected '%s', not None)" % fmt_val)
@@ -291,22 +424,8 @@ def __parse_args(validator, args, kwargs, enforce_type=True, enforce_shape=True,
                             fmt_val = (argname, type(argval).__name__, __format_type(arg['type']))
                             type_errors.append("incorrect type for '%s' (got '%s', expected '%s')" % fmt_val)
                 if enforce_shape and 'shape' in arg:
-                    valshape = get_data_shape(argval)
-                    while valshape is None:
-                        if argval is None:
-                            break
-                        if not hasattr(argval, argname):
-                            fmt_val = (argval, argname, arg['shape'])
-                            value_errors.append("cannot check shape of object '%s' for argument '%s' "
-                                                "(expected shape '%s')" % fmt_val)
-                            break
-                        # unpack, e.g. if TimeSeries is passed for arg 'data', then TimeSeries.data is checked
-                        argval = getattr(argval, argname)
-                        valshape = get_data_shape(argval)
-                    if valshape is not None and not __shape_okay_multi(argval, arg['shape']):
-                        fmt_val = (argname, valshape, arg['shape'])
-                        value_errors.append("incorrect shape for '%s' (got '%s', expected '%s')" % fmt_val)
-                if 'enum' in arg:
+                    __check_shape(argname, argval, arg, value_errors)
+                if enforce_enum and 'enum' in arg:
                     err = __check_enum(argval, arg)
                     if err:
                         value_errors.append(err)
@@ -317,11 +436,10 @@ def __parse_args(validator, args, kwargs, enforce_type=True, enforce_shape=True,
 
                 ret[argname] = argval
             argsi += 1
-            arg = next(it)
 
         # process arguments of the docval specification with a default value
         # NOTE: the default value will be deepcopied, so 'default': list() is safe unlike in normal python
-        while True:
+        for arg, check in compiled['keyword']:
             argname = arg['name']
             if argname in kwargs:
                 ret[argname] = kwargs.get(argname)
@@ -333,14 +451,15 @@ def __parse_args(validator, args, kwargs, enforce_type=True, enforce_shape=True,
                 ret[argname] = _copy.deepcopy(arg['default'])
             argval = ret[argname]
 
-            from .term_set import TermSetWrapper # circular import fix
-            wrapper = None
-            if isinstance(argval, TermSetWrapper):
-                wrapper = argval
+            if isinstance(argval, _TermSetWrapper):
                 # we can use this to unwrap the dataset/attribute to use the "item" for docval to validate the type.
                 argval = argval.value
             if enforce_type:
-                if not check_type(argval, arg['type'], arg['default'] is None or arg.get('allow_none', False)):
+                if argval is None:
+                    valid = arg['default'] is None or arg.get('allow_none', False)
+                else:
+                    valid = check(argval)
+                if not valid:
                     if argval is None and arg['default'] is None:
                         fmt_val = (argname, __format_type(arg['type']))
                         type_errors.append("None is not allowed for '%s' (expected '%s', not None)" % fmt_val)
@@ -348,31 +467,11 @@ def __parse_args(validator, args, kwargs, enforce_type=True, enforce_shape=True,
                         fmt_val = (argname, type(argval).__name__, __format_type(arg['type']))
                         type_errors.append("incorrect type for '%s' (got '%s', expected '%s')" % fmt_val)
             if enforce_shape and 'shape' in arg and argval is not None:
-                valshape = get_data_shape(argval)
-                while valshape is None:
-                    if argval is None:
-                        break
-                    if not hasattr(argval, argname):
-                        fmt_val = (argval, argname, arg['shape'])
-                        value_errors.append("cannot check shape of object '%s' for argument '%s' (expected shape '%s')"
-                                            % fmt_val)
-                        break
-                    # unpack, e.g. if TimeSeries is passed for arg 'data', then TimeSeries.data is checked
-                    argval = getattr(argval, argname)
-                    valshape = get_data_shape(argval)
-                if valshape is not None and not __shape_okay_multi(argval, arg['shape']):
-                    fmt_val = (argname, valshape, arg['shape'])
-                    value_errors.append("incorrect shape for '%s' (got '%s', expected '%s')" % fmt_val)
-            if 'enum' in arg and argval is not None:
+                __check_shape(argname, argval, arg, value_errors)
+            if enforce_enum and 'enum' in arg and argval is not None:
                 err = __check_enum(argval, arg)
                 if err:
                     value_errors.append(err)
-            if wrapper is not None:
-                # reassign the wrapper so that it can be used to flag HERD "on write"
-                argval = wrapper
-            arg = next(it)
-    except StopIteration:
-        pass
     except TypeError as e:
         type_errors.append(str(e))
     except ValueError as e:
@@ -630,6 +729,7 @@ def docval(*validator, **options):  # noqa: C901
                 pos.append(a)
         loc_val = pos + kw
         _docval[__docval_args_loc] = loc_val
+        compiled = __compile_validator(loc_val)
 
         def _check_args(args, kwargs):
             """Parse and check arguments to decorated function. Raise warnings and errors as appropriate."""
@@ -643,7 +743,8 @@ def docval(*validator, **options):  # noqa: C901
                 enforce_type=enforce_type,
                 enforce_shape=enforce_shape,
                 allow_extra=allow_extra,
-                allow_positional=allow_positional
+                allow_positional=allow_positional,
+                compiled=compiled
             )
 
             parse_warnings = parsed.get('future_warnings')
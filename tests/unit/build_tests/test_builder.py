@@ -235,6 +235,53 @@ class TestGroupBuilderGetters(TestCase):
             self.assertItemsEqual(values, self.gb.values())
 
 
+class TestGroupBuilderLoader(TestCase):
+
+    def setUp(self):
+        self.calls = 0
+
+    def loader(self, builder):
+        self.calls += 1
+        builder.set_group(GroupBuilder('gb2'))
+        builder.set_dataset(DatasetBuilder('db', list(range(10))))
+
+    def test_loaded_default(self):
+        gb = GroupBuilder('gb')
+        self.assertTrue(gb.loaded)
+
+    def test_set_loader(self):
+        gb = GroupBuilder('gb')
+        gb._set_loader(self.loader)
+        self.assertFalse(gb.loaded)
+        self.assertEqual(self.calls, 0)
+
+    def test_load_on_access(self):
+        gb = GroupBuilder('gb')
+        gb._set_loader(self.loader)
+        self.assertIn('gb2', gb.groups)
+        self.assertTrue(gb.loaded)
+        self.assertIn('db', gb.datasets)
+        self.assertEqual(self.calls, 1)
+
+    def test_load_on_getitem(self):
+        gb = GroupBuilder('gb')
+        gb._set_loader(self.loader)
+        self.assertIs(gb['gb2'].parent, gb)
+        self.assertEqual(self.calls, 1)
+
+    def test_load_on_contains(self):
+        gb = GroupBuilder('gb')
+        gb._set_loader(self.loader)
+        self.assertIn('db', gb)
+        self.assertEqual(self.calls, 1)
+
+    def test_attributes_do_not_load(self):
+        gb = GroupBuilder('gb', attributes={'key': 'value'})
+        gb._set_loader(self.loader)
+        self.assertEqual(gb.attributes['key'], 'value')
+        self.assertFalse(gb.loaded)
+
+
 class TestGroupBuilderIsEmpty(TestCase):
 
     def test_is_empty_true(self):
@@ -516,6 +516,85 @@ class TestDynamicTable(TestCase):
         table.add_row(foo=5, bar=50.0, baz='lizard', qux=[1, 2, 3])
         table.add_row(foo=5, bar=50.0, baz='lizard', qux=[1, 2, 3 ,4], check_ragged=False)
 
+    def test_add_rows(self):
+        table = self.with_spec()
+        table.add_rows(data={'foo': [1, 2], 'bar': [10.0, 20.0], 'baz': ['cat', 'dog']})
+        table.add_rows({'foo': [3, 4, 5], 'bar': [30.0, 40.0, 50.0], 'baz': ['bird', 'fish', 'lizard']})
+        self.check_table(table)
+
+    def test_add_rows_equals_add_row(self):
+        table = self.with_spec()
+        table.add_column(name='qux', description='qux column', index=True)
+        table.add_column(name='quux', description='quux column', index=2)
+        table.add_rows(data={'foo': [1, 2], 'bar': [10.0, 20.0], 'baz': ['cat', 'dog'],
+                             'qux': [[1, 2, 3], []], 'quux': [[[1], [2, 3]], [[4, 5, 6]]]},
+                       id=[5, 6])
+        expected = self.with_spec()
+        expected.add_column(name='qux', description='qux column', index=True)
+        expected.add_column(name='quux', description='quux column', index=2)
+        expected.add_row(foo=1, bar=10.0, baz='cat', qux=[1, 2, 3], quux=[[1], [2, 3]], id=5)
+        expected.add_row(foo=2, bar=20.0, baz='dog', qux=[], quux=[[4, 5, 6]], id=6)
+        self.assertListEqual(table.id.data, expected.id.data)
+        for name in ('foo', 'bar', 'baz', 'qux', 'qux_index', 'quux', 'quux_index', 'quux_index_index'):
+            with self.subTest(column=name):
+                self.assertListEqual(table.get(name).data, expected.get(name).data)
+        self.assertListEqual(table['quux'][1], [[4, 5, 6]])
+
+    def test_add_rows_index_precision(self):
+        table = self.with_spec()
+        table.add_column(name='qux', description='qux column', index=True)
+        table.add_rows(data={'foo': [1, 2], 'bar': [10.0, 20.0], 'baz': ['cat', 'dog'], 'qux': [[0] * 200, [1] * 100]})
+        self.assertListEqual(table['qux_index'].data, [200, 300])
+        self.assertIsInstance(table['qux_index'].data[0], np.uint16)
+
+    def test_add_rows_numpy_column(self):
+        table = self.with_columns_and_data()
+        table.add_rows(data={'foo': np.array([6, 7]), 'bar': [60.0, 70.0], 'baz': ['cow', 'pig']})
+        self.assertEqual(len(table), 7)
+        self.assertListEqual(table['foo'][5:], [6, 7])
+        self.assertListEqual(table.id.data, list(range(7)))
+
+    def test_add_rows_missing_column(self):
+        table = self.with_spec()
+        with self.assertRaisesWith(ValueError, "column 'baz' missing"):
+            table.add_rows(data={'foo': [1, 2], 'bar': [10.0, 20.0]})
+
+    def test_add_rows_extra_column(self):
+        table = self.with_spec()
+        msg = "row data keys don't match available columns\nyou supplied 1 extra keys: {'qux'}"
+        with self.assertRaisesWith(ValueError, msg):
+            table.add_rows(data={'foo': [1], 'bar': [10.0], 'baz': ['cat'], 'qux': [1]})
+
+    def test_add_rows_unequal_length(self):
+        table = self.with_spec()
+        with self.assertRaisesWith(ValueError, "column 'bar' has 1 rows, expected 2"):
+            table.add_rows(data={'foo': [1, 2], 'bar': [10.0], 'baz': ['cat', 'dog']})
+        with self.assertRaisesWith(ValueError, "column 'foo' has 2 rows, expected 3"):
+            table.add_rows(data={'foo': [1, 2], 'bar': [10.0, 20.0], 'baz': ['cat', 'dog']}, id=[1, 2, 3])
+        self.assertEqual(len(table), 0)
+
+    def test_add_rows_enforce_unique_id(self):
+        table = self.with_spec()
+        table.add_row(foo=1, bar=10.0, baz='cat', id=10)
+        with self.assertRaisesWith(ValueError, "id 10 already in the table"):
+            table.add_rows(data={'foo': [2, 3], 'bar': [20.0, 30.0], 'baz': ['dog', 'bird']}, id=[11, 10],
+                           enforce_unique_id=True)
+        with self.assertRaisesWith(ValueError, "id 12 already in the table"):
+            table.add_rows(data={'foo': [2, 3], 'bar': [20.0, 30.0], 'baz': ['dog', 'bird']}, id=[12, 12],
+                           enforce_unique_id=True)
+        table.add_rows(data={'foo': [2, 3], 'bar': [20.0, 30.0], 'baz': ['dog', 'bird']}, id=[11, 12],
+                       enforce_unique_id=True)
+        self.assertListEqual(table.id.data, [10, 11, 12])
+
+    def test_add_rows_without_required_index(self):
+        msg = ("Data has elements with different lengths and therefore cannot be coerced into an N-dimensional "
+               "array. Use the 'index' argument when creating a column to add rows with different lengths.")
+        table = self.with_spec()
+        table.add_column(name='qux', description='qux column')
+        with self.assertWarnsWith(UserWarning, msg):
+            table.add_rows(data={'foo': [5, 6], 'bar': [50.0, 60.0], 'baz': ['lizard', 'cow'],
+                                 'qux': [[1, 2, 3], [1, 2, 3, 4]]})
+
     def test_add_column_auto_index_int(self):
         """
         Add a column as a list of lists after we have already added data so that we need to create a single VectorIndex
@@ -1787,6 +1866,15 @@ class TestDynamicTableClassColumns(TestCase):
         self.assertListEqual(table.col2.data, ['b', 'b2'])
         # self.assertListEqual(table.col4.data, [('d1', 'd2'), ('d3', 'd4')])  # TODO this should work
 
+    def test_add_rows_opt_column(self):
+        """Test that adding rows with an optional column works."""
+        table = SubTable(name='subtable', description='subtable description')
+        table.add_rows(data=dict(col1=['a', 'a'], col2=['b', 'b2'], col3=['c', 'c'], col4=[('d1', 'd2'), ('d3', 'd4')],
+                                 col5=['e', 'e'], col7=['g', 'g']))
+        self.assertTupleEqual(table.colnames, ('col1', 'col3', 'col5', 'col7', 'col2', 'col4'))
+        self.assertListEqual(table.col2.data, ['b', 'b2'])
+        self.assertListEqual(table['col4'][1], ['d3', 'd4'])
+
     def test_add_row_opt_column_after_data(self):
         """Test that adding a row with an optional column after adding a row without the column raises an error."""
         table = SubTable(name='subtable', description='subtable description')
@@ -2501,6 +2589,19 @@ class TestDoubleIndex(TestCase):
         self.assertListEqual(foo_ind_ind.data, [2, 3, 5])
         self.assertListEqual(foo_ind_ind[2], [['c11', 'c12', 'c13'], ['c21', 'c22']])
 
+    def test_add_vectors(self):
+        foo = VectorData(name='foo', description='foo column', data=['a11', 'a12', 'a21', 'b11'])
+        foo_ind = VectorIndex(name='foo_index', target=foo, data=[2, 3, 4])
+        foo_ind_ind = VectorIndex(name='foo_index_index', target=foo_ind, data=[2, 3])
+
+        foo_ind_ind.add_vectors([[['c11', 'c12', 'c13'], ['c21', 'c22']], [['d11']]])
+
+        self.assertListEqual(foo.data, ['a11', 'a12', 'a21', 'b11', 'c11', 'c12', 'c13', 'c21', 'c22', 'd11'])
+        self.assertListEqual(foo_ind.data, [2, 3, 4, 7, 9, 10])
+        self.assertListEqual(foo_ind_ind.data, [2, 3, 5, 6])
+        self.assertListEqual(foo_ind_ind[2], [['c11', 'c12', 'c13'], ['c21', 'c22']])
+        self.assertListEqual(foo_ind_ind[3], [['d11']])
+
 
 class TestDTDoubleIndex(TestCase):
 
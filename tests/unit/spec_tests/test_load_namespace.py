@@ -1,11 +1,15 @@
 import json
 import os
+import pickle
 import ruamel.yaml as yaml
-from tempfile import gettempdir
+import shutil
+from tempfile import gettempdir, mkdtemp
+from unittest import mock
 import warnings
 
 from hdmf.common import get_type_map
 from hdmf.spec import AttributeSpec, DatasetSpec, GroupSpec, SpecNamespace, NamespaceCatalog, NamespaceBuilder
+from hdmf.spec.namespace import YAMLSpecReader
 from hdmf.testing import TestCase, remove_test_file
 
 from tests.unit.helpers.utils import CustomGroupSpec, CustomDatasetSpec, CustomSpecNamespace
@@ -123,6 +127,54 @@ class TestSpecLoad(TestCase):
         ext_dsets = {s.name for s in es_spec.datasets}
         self.assertSetEqual(src_dsets, ext_dsets)
 
+    def test_cache_dir(self):
+        cache_dir = mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        self.ns_catalog.load_namespaces(self.namespace_path, cache_dir=cache_dir)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+        # the specs are read from the cache instead of from the YAML files
+        ns_catalog = NamespaceCatalog()
+        with mock.patch.object(YAMLSpecReader, 'read_spec', side_effect=AssertionError('spec file was parsed')):
+            ns_catalog.load_namespaces(self.namespace_path, cache_dir=cache_dir)
+        self.assertEqual(ns_catalog.get_spec(self.NS_NAME, 'SpikeData'),
+                         self.ns_catalog.get_spec(self.NS_NAME, 'SpikeData'))
+        self.assertEqual(ns_catalog.get_namespace(self.NS_NAME)['version'], '0.1.0')
+
+    def test_cache_dir_modified_spec(self):
+        cache_dir = mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        self.ns_catalog.load_namespaces(self.namespace_path, cache_dir=cache_dir)
+        with open(self.specs_path, 'w') as tmp:
+            yaml_obj = yaml.YAML(typ='safe', pure=True)
+            yaml_obj.dump(json.loads(json.dumps({'groups': [self.spec]})), tmp)
+
+        ns_catalog = NamespaceCatalog()
+        ns_catalog.load_namespaces(self.namespace_path, cache_dir=cache_dir)
+        self.assertNotIn('SpikeData', ns_catalog.get_namespace(self.NS_NAME).get_registered_types())
+
+    def test_cache_dir_environment_variable(self):
+        cache_dir = mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        with mock.patch.dict(os.environ, {'HDMF_NAMESPACE_CACHE_DIR': cache_dir}):
+            self.ns_catalog.load_namespaces(self.namespace_path)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+    def test_cache_dir_disallowed_global(self):
+        """Test that a cache file that loads classes or functions is ignored"""
+        cache_dir = mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        self.ns_catalog.load_namespaces(self.namespace_path, cache_dir=cache_dir)
+        with open(os.path.join(cache_dir, os.listdir(cache_dir)[0]), 'wb') as f:
+            pickle.dump(os.getcwd, f)
+
+        ns_catalog = NamespaceCatalog()
+        with self.assertLogs('hdmf.spec.namespace.CachedYAMLSpecReader', level='DEBUG') as cm:
+            ns_catalog.load_namespaces(self.namespace_path, cache_dir=cache_dir)
+        self.assertIn('getcwd\' is not allowed in a namespace cache file', cm.output[0])
+        self.assertEqual(ns_catalog.get_spec(self.NS_NAME, 'SpikeData'),
+                         self.ns_catalog.get_spec(self.NS_NAME, 'SpikeData'))
+
 
 class TestSpecLoadEdgeCase(TestCase):
 
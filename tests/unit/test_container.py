@@ -490,6 +490,53 @@ class TestData(TestCase):
         data_obj = Data('my_data', [[0, 1, 2, 3, 4], [0, 1, 2, 3, 4]])
         self.assertTupleEqual(data_obj.shape, (2, 5))
 
+    def test_append_nparray(self):
+        """Test that appending to np.array data grows a buffer and the data is a view of the filled part"""
+        arr = np.arange(3)
+        data_obj = Data('my_data', arr)
+        for i in range(3, 100):
+            data_obj.append(i)
+        np.testing.assert_array_equal(data_obj.data, np.arange(100))
+        self.assertEqual(len(data_obj), 100)
+        np.testing.assert_array_equal(arr, np.arange(3))  # the original array is not modified
+        self.assertGreaterEqual(len(data_obj.data.base), 100)
+
+    def test_append_nparray_dtype(self):
+        """Test that appending to np.array data promotes the dtype as np.append does"""
+        data_obj = Data('my_data', np.array(['a', 'b']))
+        data_obj.append('cde')
+        data_obj.append('f')
+        np.testing.assert_array_equal(data_obj.data, np.array(['a', 'b', 'cde', 'f']))
+        data_obj = Data('my_data', np.arange(2))
+        data_obj.append(2.5)
+        np.testing.assert_array_equal(data_obj.data, np.array([0., 1., 2.5]))
+
+    def test_append_nparray_replaced(self):
+        """Test that appending to np.array data that was replaced after an append does not use the old buffer"""
+        data_obj = Data('my_data', np.arange(3))
+        data_obj.append(3)
+        data_obj.transform(lambda data: data * 2)
+        data_obj.append(8)
+        np.testing.assert_array_equal(data_obj.data, np.array([0, 2, 4, 6, 8]))
+
+    def test_extend_nparray(self):
+        """Test that extending np.array data adds the elements along the first dimension"""
+        data_obj = Data('my_data', np.arange(3))
+        data_obj.extend([3, 4])
+        data_obj.extend(np.arange(5, 10))
+        np.testing.assert_array_equal(data_obj.data, np.arange(10))
+        data_obj = Data('my_data', np.arange(4).reshape(2, 2))
+        data_obj.extend([4, 5])
+        data_obj.extend([[6, 7], [8, 9]])
+        data_obj.append([10, 11])
+        np.testing.assert_array_equal(data_obj.data, np.arange(12).reshape(6, 2))
+
+    def test_append_nparray_bad_shape(self):
+        """Test that appending an element with the wrong shape to np.array data raises an error"""
+        data_obj = Data('my_data', np.arange(4).reshape(2, 2))
+        with self.assertRaises(ValueError):
+            data_obj.append([1, 2, 3])
+
 
 class TestAbstractContainerFieldsConf(TestCase):
 
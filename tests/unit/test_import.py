@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+from hdmf.testing import TestCase
+
+
+class TestLazyImports(TestCase):
+    """Test that heavy dependencies are not imported until they are used, to keep the startup of hdmf fast"""
+
+    def get_imported_modules(self, code, modules):
+        """Run the code in a new interpreter and return which of the given modules were imported"""
+        code += "\nimport sys\nprint(','.join(m for m in %r if m in sys.modules))" % (modules, )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        return [m for m in result.stdout.strip().split(',') if m]
+
+    def test_import_hdmf(self):
+        modules = ['pandas', 'scipy.sparse', 'ruamel.yaml', 'hdmf.backends.hdf5', 'hdmf.common']
+        self.assertListEqual(self.get_imported_modules('import hdmf', modules), [])
+
+    def test_import_hdmf_common(self):
+        modules = ['pandas', 'scipy.sparse']
+        self.assertListEqual(self.get_imported_modules('import hdmf.common', modules), [])
+
+    def test_import_hdmf_build(self):
+        """Test that importing hdmf.build before the HDF5 backend does not cause a circular import"""
+        self.assertListEqual(self.get_imported_modules('import hdmf.build', ['hdmf.build']), ['hdmf.build'])
+
+    def test_lazy_attributes(self):
+        modules = ['hdmf.backends.hdf5']
+        code = 'import hdmf\nassert hdmf.H5Dataset.__name__ == "H5Dataset"'
+        self.assertListEqual(self.get_imported_modules(code, modules), modules)
+        with self.assertRaisesWith(AttributeError, "module 'hdmf' has no attribute 'H5Dataset2'"):
+            import hdmf
+            hdmf.H5Dataset2
+
+
+class TestDataFrameTypeNames(TestCase):
+    """Test that docval types given by the name of pandas.DataFrame match the class in all supported pandas versions"""
+
+    def test_pandas_versions(self):
+        import pandas as pd
+        from hdmf.common import DynamicTable
+        from hdmf.common.hierarchicaltable import drop_id_columns, flatten_column_index
+        from hdmf.container import Table, _DATAFRAME_TYPE
+        from hdmf.utils import check_type, docval, get_docval
+
+        # in pandas < 3, the module of DataFrame is 'pandas.core.frame'
+        OldDataFrame = type('DataFrame', (), {'__module__': 'pandas.core.frame'})
+
+        @docval({'name': 'df', 'type': _DATAFRAME_TYPE, 'doc': 'a dataframe'}, is_method=False)
+        def func(**kwargs):
+            return kwargs['df']
+
+        for df in (pd.DataFrame(), OldDataFrame()):
+            self.assertIs(func(df), df)
+            for f, arg in ((DynamicTable.from_dataframe, 'df'), (Table.from_dataframe, 'df'),
+                           (drop_id_columns, 'dataframe'), (flatten_column_index, 'dataframe')):
+                self.assertTrue(check_type(df, get_docval(f, arg)[0]['type']))
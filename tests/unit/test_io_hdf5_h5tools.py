@@ -1,6 +1,9 @@
 """Test module to validate that HDF5IO is working"""
 import os
+import pickle
 import unittest
+from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 from io import BytesIO
 from pathlib import Path
@@ -8,20 +11,24 @@ import shutil
 import tempfile
 from glob import glob
 import zipfile
+import zlib
 
 import h5py
 import numpy as np
-from h5py import SoftLink, HardLink, ExternalLink, File
+from h5py import SoftLink, HardLink, ExternalLink, File, Group
 from h5py import filters as h5py_filters
 from hdmf.backends.hdf5 import H5DataIO
-from hdmf.backends.hdf5.h5tools import HDF5IO, SPEC_LOC_ATTR, H5PY_3
+from hdmf.backends.hdf5.h5tools import HDF5IO, SPEC_LOC_ATTR, H5PY_3, RDCC_NBYTES
+from hdmf.backends.hdf5.h5_utils import BuilderH5RegionDataset, H5RegionSlicer, read_regions, _chunk_nbytes
 from hdmf.backends.io import HDMFIO
 from hdmf.backends.warnings import BrokenLinkWarning
 from hdmf.backends.errors import UnsupportedOperation
 from hdmf.build import GroupBuilder, DatasetBuilder, BuildManager, TypeMap, OrphanContainerBuildError, LinkBuilder
+from hdmf.build.manager import Proxy
 from hdmf.container import Container
 from hdmf import Data, docval
-from hdmf.data_utils import DataChunkIterator, GenericDataChunkIterator, InvalidDataIOError
+from hdmf.data_utils import DataChunk, DataChunkIterator, GenericDataChunkIterator, InvalidDataIOError
+from hdmf.monitor import Histogram, NumSampleCounter, SummaryStatistics
 from hdmf.spec.catalog import SpecCatalog
 from hdmf.spec.namespace import NamespaceCatalog, SpecNamespace
 from hdmf.spec.spec import GroupSpec, DtypeSpec
@@ -63,6 +70,29 @@ class NumpyArrayGenericDataChunkIterator(GenericDataChunkIterator):
         return self.array.dtype
 
 
+class PicklableNumpyArrayGenericDataChunkIterator(NumpyArrayGenericDataChunkIterator):
+    """Iterator that fails after reading fail_after buffers, which is not pickled"""
+
+    def __init__(self, array: np.ndarray, fail_after=None, **kwargs):
+        self.fail_after = fail_after
+        self._kwargs = kwargs
+        super().__init__(array=array, **kwargs)
+
+    def _get_data(self, selection):
+        if self.fail_after is not None:
+            if self.fail_after == 0:
+                raise RuntimeError("interrupted")
+            self.fail_after -= 1
+        return self.array[selection]
+
+    def _to_dict(self):
+        return dict(array=self.array, kwargs=self._kwargs)
+
+    @staticmethod
+    def _from_dict(dictionary):
+        return PicklableNumpyArrayGenericDataChunkIterator(array=dictionary["array"], **dictionary["kwargs"])
+
+
 class H5IOTest(TestCase):
     """Tests for h5tools IO tools"""
 
@@ -407,6 +437,117 @@ class H5IOTest(TestCase):
         self.assertEqual(dset.shuffle, True)
         self.assertEqual(dset.fletcher32, True)
 
+    def test_write_dataset_list_compression_workers(self):
+        a = H5DataIO(np.arange(1000).reshape(100, 10),
+                     chunks=(30, 4),
+                     compression='gzip',
+                     compression_opts=5,
+                     shuffle=True,
+                     fillvalue=-1,
+                     compression_workers=2)
+        with patch('zlib.compress', wraps=zlib.compress) as mock:
+            self.io.write_dataset(self.f, DatasetBuilder('test_dataset', a, attributes={}))
+        # all chunks, including the chunks at the edges of the dataset, are compressed by hdmf
+        self.assertEqual(mock.call_count, 4 * 3)
+        dset = self.f['test_dataset']
+        self.assertListEqual(dset[:].tolist(), a.data.tolist())
+        self.assertEqual(dset.compression, 'gzip')
+        self.assertEqual(dset.shuffle, True)
+
+    def test_write_dataset_iterable_compression_workers(self):
+        # the chunks of the iterator are not aligned with the chunks of the dataset
+        daiter = DataChunkIterator(data=np.arange(100, dtype='f8'), buffer_size=15)
+        wrapped_daiter = H5DataIO(data=daiter, chunks=(10,), compression='gzip', compression_workers=2)
+        with patch('zlib.compress', wraps=zlib.compress) as mock:
+            self.io.write_dataset(self.f, DatasetBuilder('test_dataset', wrapped_daiter, attributes={}))
+        # chunks covered by a single chunk of the iterator are compressed by hdmf
+        self.assertEqual(mock.call_count, 7)
+        dset = self.f['test_dataset']
+        self.assertListEqual(dset[:].tolist(), list(range(100)))
+
+    def test_write_dataset_iterable_compression_workers_one_pool(self):
+        """Test that the chunks of all parts of all DataChunks of a dataset are compressed on a single thread pool"""
+        data = np.arange(100, dtype='f8')
+        data[40:60] = 0.
+        daiter = DataChunkIterator(data=data, buffer_size=30)
+        wrapped_daiter = H5DataIO(data=daiter, chunks=(10,), fillvalue=0., compression='gzip', compression_workers=2,
+                                  skip_fill_chunks=True)
+        with patch('hdmf.backends.hdf5.h5_utils.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock:
+            self.io.write_dataset(self.f, DatasetBuilder('test_dataset', wrapped_daiter, attributes={}))
+        self.assertEqual(mock.call_count, 1)
+        np.testing.assert_array_equal(self.f['test_dataset'][:], data)
+
+    def test_write_dataset_string_compression_workers(self):
+        a = H5DataIO(np.array(['a', 'b', 'c'], dtype=object), compression='gzip', compression_workers=2)
+        self.io.write_dataset(self.f, DatasetBuilder('test_dataset', a, attributes={}))
+        dset = self.f['test_dataset']
+        self.assertListEqual([s.decode('utf-8') for s in dset[:]], ['a', 'b', 'c'])
+
+    def test_write_dataset_iterable_skip_fill_chunks(self):
+        data = np.zeros((100, 10))
+        data[25:35, 2] = 1.
+        data[90:, :] = np.nan
+        daiter = DataChunkIterator(data=data, buffer_size=20)
+        wrapped_daiter = H5DataIO(data=daiter, chunks=(10, 5), fillvalue=0., skip_fill_chunks=True)
+        self.io.write_dataset(self.f, DatasetBuilder('test_dataset', wrapped_daiter, attributes={}))
+        dset = self.f['test_dataset']
+        np.testing.assert_array_equal(dset[:], data)
+        # only the chunks with values other than the fill value are allocated
+        self.assertEqual(dset.id.get_num_chunks(), 4)
+        self.assertEqual(wrapped_daiter.skipped_chunks, 16)
+
+    def test_write_dataset_iterable_skip_fill_chunks_nan(self):
+        data = np.full(100, np.nan)
+        data[42] = 1.
+        daiter = DataChunkIterator(data=data, buffer_size=30)
+        wrapped_daiter = H5DataIO(data=daiter, chunks=(10,), fillvalue=np.nan, compression='gzip',
+                                  compression_workers=2, skip_fill_chunks=True)
+        self.io.write_dataset(self.f, DatasetBuilder('test_dataset', wrapped_daiter, attributes={}))
+        dset = self.f['test_dataset']
+        np.testing.assert_array_equal(dset[:], data)
+        self.assertEqual(dset.id.get_num_chunks(), 1)
+        self.assertEqual(wrapped_daiter.skipped_chunks, 9)
+
+    def test_write_dataset_list_skip_fill_chunks(self):
+        a = H5DataIO(np.arange(100) // 50, chunks=(10,), skip_fill_chunks=True)
+        self.io.write_dataset(self.f, DatasetBuilder('test_dataset', a, attributes={}))
+        dset = self.f['test_dataset']
+        self.assertListEqual(dset[:].tolist(), a.data.tolist())
+        self.assertEqual(dset.id.get_num_chunks(), 5)
+        self.assertEqual(a.skipped_chunks, 5)
+
+    def test_write_dataset_iterable_chunk_processors(self):
+        data = np.arange(100.)
+        data[7] = np.nan
+        daiter = DataChunkIterator(data=data, buffer_size=15)
+        wrapped_daiter = H5DataIO(data=daiter,
+                                  chunk_processors=[SummaryStatistics(), Histogram(bins=2, range=(0, 100))],
+                                  write_processor_attributes=True)
+        self.io.write_dataset(self.f, DatasetBuilder('test_dataset', wrapped_daiter, attributes={}))
+        dset = self.f['test_dataset']
+        self.assertEqual(dset.attrs['stats_count'], 99)
+        self.assertEqual(dset.attrs['stats_nan_count'], 1)
+        self.assertEqual(dset.attrs['stats_min'], 0.)
+        self.assertEqual(dset.attrs['stats_max'], 99.)
+        self.assertAlmostEqual(dset.attrs['stats_mean'], np.nanmean(data))
+        self.assertAlmostEqual(dset.attrs['stats_std'], np.nanstd(data))
+        self.assertListEqual(dset.attrs['histogram_counts'].tolist(), [49, 50])
+        self.assertListEqual(dset.attrs['histogram_bin_edges'].tolist(), [0., 50., 100.])
+
+    def test_write_dataset_list_chunk_processors(self):
+        a = H5DataIO([1, 2, 3], chunk_processors=[NumSampleCounter()], write_processor_attributes=True)
+        self.io.write_dataset(self.f, DatasetBuilder('test_dataset', a, attributes={}))
+        self.assertEqual(self.f['test_dataset'].attrs['num_samples'], 3)
+
+    def test_write_dataset_chunk_processors_no_attributes(self):
+        """Test that the attributes of chunk processors are not written by default"""
+        daiter = DataChunkIterator(data=np.arange(10.), buffer_size=4)
+        stats = SummaryStatistics()
+        wrapped_daiter = H5DataIO(data=daiter, chunk_processors=[stats])
+        self.io.write_dataset(self.f, DatasetBuilder('test_dataset', wrapped_daiter, attributes={}))
+        self.assertEqual(len(self.f['test_dataset'].attrs), 0)
+        self.assertEqual(stats.get_final_result()['max'], 9.)
+
     #############################################
     #  write_dataset tests: data chunk iterator
     #############################################
@@ -814,6 +955,62 @@ class H5IOTest(TestCase):
             bldr = io.read_builder()
             np.testing.assert_array_equal(bldr['test_dataset'].data[()], a)
 
+    def test_read_builder_hierarchy(self):
+        grp = self.f.create_group('test_group')
+        grp.attrs['test_attr'] = 'foobar'
+        grp.create_dataset('test_dataset', data=np.arange(5))
+        grp.create_group('test_subgroup')
+        grp['test_softlink'] = SoftLink('/test_group/test_dataset')
+        self.io.close()
+        with HDF5IO(self.path, 'r') as io:
+            bldr = io.read_builder()['test_group']
+            self.assertEqual(bldr.attributes, {'test_attr': 'foobar'})
+            self.assertEqual(bldr.location, '/')
+            self.assertEqual(bldr.source, os.path.abspath(self.path))
+            self.assertEqual(bldr.datasets['test_dataset'].location, '/test_group')
+            np.testing.assert_array_equal(bldr.datasets['test_dataset'].data[:], np.arange(5))
+            self.assertEqual(bldr.groups['test_subgroup'].attributes, {})
+            self.assertIs(bldr.links['test_softlink'].builder, bldr.datasets['test_dataset'])
+
+    def test_read_builder_hard_links(self):
+        """Test that an object with multiple hard links is read once and added to each parent."""
+        grp = self.f.create_group('test_group')
+        sub = grp.create_group('test_subgroup')
+        sub.create_dataset('test_dataset', data=np.arange(5))
+        other = self.f.create_group('other_group')
+        other['hard_link'] = sub
+        other['soft_link'] = SoftLink('/test_group/test_subgroup/test_dataset')
+        self.io.close()
+        with HDF5IO(self.path, 'r') as io:
+            bldr = io.read_builder()
+            # the builder is named after the link that is read first
+            sub_bldr = bldr['other_group'].groups['hard_link']
+            self.assertIs(bldr['test_group'].groups['hard_link'], sub_bldr)
+            self.assertIs(bldr['other_group'].links['soft_link'].builder, sub_bldr.datasets['test_dataset'])
+            self.assertIs(io.get_builder(io._file['test_group/test_subgroup']), sub_bldr)
+
+    def test_read_builder_groups_not_opened(self):
+        """Test that groups without attributes or soft links are not opened when the whole file is read."""
+        self.f.create_group('test_group').create_group('test_subgroup')
+        self.f.create_group('attr_group').attrs['test_attr'] = 'foobar'
+        self.io.close()
+        with HDF5IO(self.path, 'r') as io:
+            with patch('hdmf.backends.hdf5.h5tools.Group', wraps=Group) as group:
+                bldr = io.read_builder()
+            self.assertEqual(group.call_count, 1)
+            self.assertEqual(bldr['attr_group'].attributes, {'test_attr': 'foobar'})
+            self.assertEqual(bldr['test_group/test_subgroup'].attributes, {})
+
+    def test_read_builder_track_order(self):
+        """Test that the order of the subgroups of a group with tracked creation order is preserved on read."""
+        grp = self.f.create_group('test_group', track_order=True)
+        for name in ('c', 'a', 'b'):
+            grp.create_group(name)
+        self.io.close()
+        with HDF5IO(self.path, 'r') as io:
+            bldr = io.read_builder()
+            self.assertListEqual(list(bldr['test_group'].groups.keys()), ['c', 'a', 'b'])
+
 
 class TestRoundTrip(TestCase):
 
@@ -913,6 +1110,885 @@ class TestRoundTrip(TestCase):
             remove_test_file('./HERD.zip')
 
 
+class TestLazyRead(TestCase):
+
+    def setUp(self):
+        self.manager = get_foo_buildmanager()
+        self.path = get_temp_filepath()
+        foo1 = Foo('foo1', [1, 2, 3, 4, 5], "I am foo1", 17, 3.14)
+        foo2 = Foo('foo2', [6, 7, 8], "I am foo2", 34, 6.28)
+        foobucket = FooBucket('bucket1', [foo1, foo2])
+        self.foofile = FooFile(buckets=[foobucket], foo_link=foo1, foo_ref_attr=foo2)
+        with HDF5IO(self.path, manager=self.manager, mode='w') as io:
+            io.write(self.foofile)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_lazy_default(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r') as io:
+            self.assertFalse(io.lazy)
+
+    def test_read_builder_unloaded(self):
+        foofile = FooFile(buckets=[FooBucket('bucket1', [Foo('foo1', [1, 2, 3], "I am foo1", 17, 3.14)])])
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='w') as io:
+            io.write(foofile)
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r', lazy=True) as io:
+            root = io.read_builder()
+            self.assertFalse(root.loaded)
+            bucket = root.groups['buckets'].groups['bucket1']
+            self.assertTrue(root.loaded)
+            self.assertFalse(bucket.loaded)
+            foo_holder = bucket.groups['foo_holder']
+            self.assertFalse(foo_holder.loaded)
+            self.assertEqual(bucket.attributes['data_type'], 'FooBucket')
+
+    def test_roundtrip(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r', lazy=True) as io:
+            read_foofile = io.read()
+            self.assertContainerEqual(read_foofile, self.foofile, ignore_hdmf_attrs=True)
+
+    def test_references(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r', lazy=True) as io:
+            read_foofile = io.read()
+            bucket = read_foofile.buckets['bucket1']
+            self.assertIs(read_foofile.foo_link, bucket.foos['foo1'])
+            self.assertIs(read_foofile.foo_ref_attr, bucket.foos['foo2'])
+
+    def test_get_builder(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r', lazy=True) as io:
+            io.read_builder()
+            builder = io.get_builder(io._file['buckets/bucket1/foo_holder/foo1'])
+            self.assertEqual(builder.name, 'foo1')
+            self.assertEqual(builder.attributes['attr1'], 'I am foo1')
+
+
+class TestReadPaths(TestCase):
+
+    def setUp(self):
+        self.manager = get_foo_buildmanager()
+        self.path = get_temp_filepath()
+        foo1 = Foo('foo1', [1, 2, 3, 4, 5], "I am foo1", 17, 3.14)
+        foo2 = Foo('foo2', [6, 7, 8], "I am foo2", 34, 6.28)
+        foo3 = Foo('foo3', [9, 10], "I am foo3", 51, 9.42)
+        self.foofile = FooFile(buckets=[FooBucket('bucket1', [foo1, foo2]), FooBucket('bucket2', [foo3])])
+        with HDF5IO(self.path, manager=self.manager, mode='w') as io:
+            io.write(self.foofile)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_read_path(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r') as io:
+            read_foos = io.read(paths=['/buckets/bucket2/foo_holder/foo3'])
+            self.assertEqual(list(read_foos.keys()), ['/buckets/bucket2/foo_holder/foo3'])
+            read_foo3 = read_foos['/buckets/bucket2/foo_holder/foo3']
+            self.assertContainerEqual(read_foo3, self.foofile.buckets['bucket2'].foos['foo3'],
+                                      ignore_hdmf_attrs=True)
+            self.assertIsInstance(read_foo3.parent, Proxy)
+            # groups that are not along the path are not read
+            buckets_builder = io.read_builder().groups['buckets']
+            self.assertFalse(buckets_builder.groups['bucket1'].loaded)
+
+    def test_read_data_type(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r') as io:
+            read_buckets = io.read(paths=['FooBucket'])
+            self.assertCountEqual(read_buckets.keys(), ['/buckets/bucket1', '/buckets/bucket2'])
+            self.assertContainerEqual(read_buckets['/buckets/bucket1'], self.foofile.buckets['bucket1'],
+                                      ignore_hdmf_attrs=True)
+
+    def test_read_data_type_read_io(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r') as io:
+            read_foos = io.read(paths=['Foo', '/buckets/bucket1'])
+            self.assertCountEqual(read_foos.keys(), ['/buckets/bucket1', '/buckets/bucket1/foo_holder/foo1',
+                                                     '/buckets/bucket1/foo_holder/foo2',
+                                                     '/buckets/bucket2/foo_holder/foo3'])
+            for container in read_foos.values():
+                self.assertIs(container.read_io, io)
+
+    def test_read_data_type_nested(self):
+        """Test that objects of the data types within other objects of the data types are not returned separately"""
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r') as io:
+            read_buckets = io.read(paths=['FooBucket', 'Foo'])
+            self.assertCountEqual(read_buckets.keys(), ['/buckets/bucket1', '/buckets/bucket2'])
+            self.assertEqual(len(read_buckets['/buckets/bucket1'].foos), 2)
+
+    def test_read_data_type_not_loaded(self):
+        """Test that the groups that do not contain objects of the data types are not loaded"""
+        self.foofile = FooFile(buckets=[FooBucket('bucket1', [Foo('foo1', [1, 2], "I am foo1", 17, 3.14)]),
+                                        FooBucket('bucket2', [])])
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='w') as io:
+            io.write(self.foofile)
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r') as io:
+            read_foos = io.read(paths=['Foo'])
+            self.assertListEqual(list(read_foos.keys()), ['/buckets/bucket1/foo_holder/foo1'])
+            self.assertFalse(io.read_builder().groups['buckets'].groups['bucket2'].loaded)
+
+    def test_read_path_then_all(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r') as io:
+            read_bucket = io.read(paths=['/buckets/bucket1'])['/buckets/bucket1']
+            read_foofile = io.read()
+            self.assertIs(read_foofile.buckets['bucket1'], read_bucket)
+            self.assertIs(read_bucket.parent, read_foofile)
+
+    def test_read_missing_path(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r') as io:
+            msg = "Could not find an object at path '/buckets/bucket3' in '%s'" % io.source
+            with self.assertRaisesWith(ValueError, msg):
+                io.read(paths=['/buckets/bucket3'])
+
+
+class TestStructureCache(TestCase):
+
+    def setUp(self):
+        self.path = get_temp_filepath()
+        self.cache_dir = tempfile.mkdtemp()
+        foo1 = Foo('foo1', ['a', 'b', 'c'], "I am foo1", 17, 3.14)
+        foo2 = Foo('foo2', ['d', 'e'], "I am foo2", 34, 6.28)
+        self.foofile = FooFile(buckets=[FooBucket('bucket1', [foo1, foo2])], foo_link=foo1, foo_ref_attr=foo2,
+                               foofile_data=[1, 2, 3])
+        with HDF5IO(self.path, manager=get_foo_buildmanager("text"), mode='w') as io:
+            io.write(self.foofile)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        shutil.rmtree(self.cache_dir)
+
+    def test_cache_dir_default(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager("text"), mode='r') as io:
+            self.assertIsNone(io.cache_dir)
+
+    def test_roundtrip(self):
+        for _ in range(2):
+            with HDF5IO(self.path, manager=get_foo_buildmanager("text"), mode='r', cache_dir=self.cache_dir) as io:
+                read_foofile = io.read()
+                self.assertContainerEqual(read_foofile, self.foofile, ignore_hdmf_attrs=True)
+                bucket = read_foofile.buckets['bucket1']
+                self.assertIs(read_foofile.foo_link, bucket.foos['foo1'])
+                self.assertIs(read_foofile.foo_ref_attr, bucket.foos['foo2'])
+                self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_read_from_cache(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager("text"), mode='r', cache_dir=self.cache_dir) as io:
+            io.read_builder()
+        with HDF5IO(self.path, manager=get_foo_buildmanager("text"), mode='r', cache_dir=self.cache_dir) as io:
+            # the cached structure is used even though the file is not read lazily
+            with patch.object(HDF5IO, '_HDF5IO__read_group', side_effect=AssertionError('file should not be read')):
+                root = io.read_builder()
+            foo1 = root['buckets/bucket1/foo_holder/foo1']
+            self.assertEqual(foo1.attributes['attr1'], 'I am foo1')
+            self.assertIsInstance(foo1['my_data'].data, h5py.Dataset)
+            self.assertListEqual(foo1['my_data'].data[:].tolist(), ['a', 'b', 'c'])
+            self.assertListEqual(root['foofile_data'].data[:].tolist(), [1, 2, 3])
+            self.assertIs(root['links'].links['foo_link'].builder, foo1)
+            self.assertIs(io.get_builder(io._file['buckets/bucket1/foo_holder/foo1']), foo1)
+            self.assertTrue(io.get_written(foo1))
+
+    def test_modified_file(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager("text"), mode='r', cache_dir=self.cache_dir) as io:
+            io.read_builder()
+        with HDF5IO(self.path, manager=get_foo_buildmanager("text"), mode='a') as io:
+            read_foofile = io.read()
+            read_foofile.add_bucket(FooBucket('bucket2', [Foo('foo3', ['f'], "I am foo3", 51, 9.42)]))
+            io.write(read_foofile)
+        with HDF5IO(self.path, manager=get_foo_buildmanager("text"), mode='r', cache_dir=self.cache_dir) as io:
+            read_foofile = io.read()
+            self.assertIn('bucket2', read_foofile.buckets)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_no_cache_in_append_mode(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager("text"), mode='a', cache_dir=self.cache_dir) as io:
+            io.read_builder()
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_no_cache_when_lazy(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager("text"), mode='r', cache_dir=self.cache_dir,
+                    lazy=True) as io:
+            io.read()
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_invalid_cache(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager("text"), mode='r', cache_dir=self.cache_dir) as io:
+            io.read_builder()
+        cache_path = os.path.join(self.cache_dir, os.listdir(self.cache_dir)[0])
+        with open(cache_path, 'wb') as f:
+            f.write(b'not a pickle')
+        with HDF5IO(self.path, manager=get_foo_buildmanager("text"), mode='r', cache_dir=self.cache_dir) as io:
+            read_foofile = io.read()
+            self.assertContainerEqual(read_foofile, self.foofile, ignore_hdmf_attrs=True)
+
+    def test_cache_with_disallowed_global(self):
+        """Test that a cache file that loads other classes or functions is not loaded"""
+        with HDF5IO(self.path, manager=get_foo_buildmanager("text"), mode='r', cache_dir=self.cache_dir) as io:
+            io.read_builder()
+        cache_path = os.path.join(self.cache_dir, os.listdir(self.cache_dir)[0])
+        with open(cache_path, 'wb') as f:
+            pickle.dump(os.getcwd, f)
+        with HDF5IO(self.path, manager=get_foo_buildmanager("text"), mode='r', cache_dir=self.cache_dir) as io:
+            with self.assertLogs(io.logger, level='DEBUG') as cm:
+                read_foofile = io.read()
+            self.assertContainerEqual(read_foofile, self.foofile, ignore_hdmf_attrs=True)
+        self.assertTrue(any("'posix.getcwd' is not allowed" in msg or "'nt.getcwd' is not allowed" in msg
+                            for msg in cm.output))
+
+    def test_cache_dir_not_writable(self):
+        """Test that the file is read when the cache directory cannot be created"""
+        cache_dir = os.path.join(self.cache_dir, 'file')
+        open(cache_dir, 'w').close()
+        with HDF5IO(self.path, manager=get_foo_buildmanager("text"), mode='r', cache_dir=cache_dir) as io:
+            with self.assertLogs(io.logger, level='DEBUG') as cm:
+                read_foofile = io.read()
+            self.assertContainerEqual(read_foofile, self.foofile, ignore_hdmf_attrs=True)
+        self.assertTrue(any("Could not cache structure" in msg for msg in cm.output))
+
+
+class TestMemmapRead(TestCase):
+
+    def setUp(self):
+        self.path = get_temp_filepath()
+        self.cache_dir = tempfile.mkdtemp()
+        foo1 = Foo('foo1', np.arange(10, dtype=np.int32), "I am foo1", 17, 3.14)
+        foo2 = Foo('foo2', H5DataIO(np.arange(5), compression='gzip'), "I am foo2", 34, 6.28)
+        foofile = FooFile(buckets=[FooBucket('bucket1', [foo1, foo2])])
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='w') as io:
+            io.write(foofile)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        shutil.rmtree(self.cache_dir)
+
+    def test_memmap_default(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r') as io:
+            self.assertFalse(io.memmap)
+            foo1 = io.read().buckets['bucket1'].foos['foo1']
+            self.assertIsInstance(foo1.my_data, h5py.Dataset)
+
+    def test_memmap_contiguous(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r', memmap=True) as io:
+            self.assertTrue(io.memmap)
+            foo1 = io.read().buckets['bucket1'].foos['foo1']
+            self.assertIsInstance(foo1.my_data, np.memmap)
+            self.assertFalse(foo1.my_data.flags.writeable)
+            self.assertEqual(foo1.my_data.dtype, np.int32)
+            np.testing.assert_array_equal(foo1.my_data[2:5], [2, 3, 4])
+
+    def test_memmap_filtered(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r', memmap=True) as io:
+            foo2 = io.read().buckets['bucket1'].foos['foo2']
+            self.assertIsInstance(foo2.my_data, h5py.Dataset)
+
+    def test_memmap_append_mode(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='a', memmap=True) as io:
+            foo1 = io.read().buckets['bucket1'].foos['foo1']
+            self.assertIsInstance(foo1.my_data, h5py.Dataset)
+
+    def test_memmap_structure_cache(self):
+        for _ in range(2):
+            with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r', memmap=True,
+                        cache_dir=self.cache_dir) as io:
+                foo1 = io.read().buckets['bucket1'].foos['foo1']
+                self.assertIsInstance(foo1.my_data, np.memmap)
+                np.testing.assert_array_equal(foo1.my_data, np.arange(10))
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r', cache_dir=self.cache_dir) as io:
+            foo1 = io.read().buckets['bucket1'].foos['foo1']
+            self.assertIsInstance(foo1.my_data, h5py.Dataset)
+
+
+class TestChunkCache(TestCase):
+
+    def setUp(self):
+        self.path = get_temp_filepath()
+        self.cache_dir = tempfile.mkdtemp()
+        with h5py.File(self.path, 'w') as f:
+            f.create_dataset('data1', data=np.zeros((100, 100)), chunks=(10, 20))
+            f.create_dataset('data2', data=np.zeros((100, 100)), chunks=(10, 10))
+            f.create_dataset('contiguous', data=np.zeros((100, 100)))
+            # the default number of chunk slots depends on the version of HDF5
+            self.default_nslots = f.id.get_access_plist().get_cache()[1]
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        shutil.rmtree(self.cache_dir)
+
+    def get_chunk_cache(self, builder, name):
+        return builder[name].data.id.get_access_plist().get_chunk_cache()
+
+    def test_default(self):
+        with HDF5IO(self.path, mode='r') as io:
+            self.assertIsNone(io.chunk_cache)
+            root = io.read_builder()
+            self.assertEqual(self.get_chunk_cache(root, 'data1'), (self.default_nslots, RDCC_NBYTES, 0.75))
+
+    def test_per_dataset(self):
+        chunk_cache = {'/data1': {'rdcc_nbytes': 2**20, 'rdcc_nslots': 1009, 'rdcc_w0': 1.0},
+                       '/data2': {'rdcc_nbytes': 2**21}}
+        with HDF5IO(self.path, mode='r', chunk_cache=chunk_cache) as io:
+            root = io.read_builder()
+            self.assertEqual(self.get_chunk_cache(root, 'data1'), (1009, 2**20, 1.0))
+            self.assertEqual(self.get_chunk_cache(root, 'data2'), (self.default_nslots, 2**21, 0.75))
+
+    def test_auto(self):
+        # open the file with a default chunk cache that is smaller than the chunks read along a dimension
+        with h5py.File(self.path, 'r', rdcc_nbytes=4000) as f:
+            with HDF5IO(file=f, mode='r', chunk_cache='auto') as io:
+                root = io.read_builder()
+                # a column of data1 spans 10 chunks of 10 x 20 float64 values
+                self.assertEqual(self.get_chunk_cache(root, 'data1'), (1009, 10 * 1600, 0.75))
+                self.assertEqual(self.get_chunk_cache(root, 'data2'), (1009, 10 * 800, 0.75))
+
+    def test_auto_default_large_enough(self):
+        # the default chunk cache of 32 MiB already holds the chunks read along a dimension
+        with HDF5IO(self.path, mode='r', chunk_cache='auto') as io:
+            root = io.read_builder()
+            self.assertEqual(self.get_chunk_cache(root, 'data1'), (self.default_nslots, RDCC_NBYTES, 0.75))
+
+    def test_auto_budget(self):
+        with h5py.File(self.path, 'r', rdcc_nbytes=4000) as f:
+            with HDF5IO(file=f, mode='r', chunk_cache='auto', chunk_cache_budget=20000) as io:
+                root = io.read_builder()
+                # the 4000 bytes left after sizing the cache of data1 are not more than the default
+                self.assertEqual(self.get_chunk_cache(root, 'data1'), (1009, 10 * 1600, 0.75))
+                self.assertEqual(self.get_chunk_cache(root, 'data2'), (self.default_nslots, 4000, 0.75))
+
+    def test_auto_budget_partial(self):
+        with h5py.File(self.path, 'r', rdcc_nbytes=4000) as f:
+            with HDF5IO(file=f, mode='r', chunk_cache='auto', chunk_cache_budget=22000) as io:
+                root = io.read_builder()
+                self.assertEqual(self.get_chunk_cache(root, 'data1'), (1009, 10 * 1600, 0.75))
+                self.assertEqual(self.get_chunk_cache(root, 'data2'), (1009, 6000, 0.75))
+
+    def test_auto_structure_cache(self):
+        for _ in range(2):
+            with h5py.File(self.path, 'r', rdcc_nbytes=4000) as f:
+                with HDF5IO(file=f, mode='r', chunk_cache='auto', cache_dir=self.cache_dir) as io:
+                    root = io.read_builder()
+                    self.assertEqual(self.get_chunk_cache(root, 'data1'), (1009, 10 * 1600, 0.75))
+
+    def test_invalid(self):
+        msg = "chunk_cache must be 'auto', a dict, or None, got 'bad'"
+        with self.assertRaisesWith(ValueError, msg):
+            HDF5IO(self.path, mode='r', chunk_cache='bad')
+
+
+class TestGetContainerById(TestCase):
+
+    def setUp(self):
+        self.path = get_temp_filepath()
+        self.foo1 = Foo('foo1', [1, 2, 3, 4, 5], "I am foo1", 17, 3.14)
+        self.foo2 = Foo('foo2', [6, 7, 8], "I am foo2", 34, 6.28)
+        self.foofile = FooFile(buckets=[FooBucket('bucket1', [self.foo1]), FooBucket('bucket2', [self.foo2])])
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='w') as io:
+            io.write(self.foofile)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_get_container_by_id(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r') as io:
+            read_foo2 = io.get_container_by_id(self.foo2.object_id)
+            self.assertContainerEqual(read_foo2, self.foo2, ignore_hdmf_attrs=True)
+            self.assertIsInstance(read_foo2.parent, Proxy)
+            # only the groups along the path to the container are read
+            self.assertFalse(io.read_builder()['buckets'].groups['bucket1'].loaded)
+
+    def test_get_root_by_id(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r') as io:
+            read_foofile = io.get_container_by_id(self.foofile.object_id)
+            self.assertContainerEqual(read_foofile, self.foofile, ignore_hdmf_attrs=True)
+
+    def test_get_container_by_id_after_read(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r') as io:
+            read_foofile = io.read()
+            self.assertIs(io.get_container_by_id(self.foo1.object_id), read_foofile.buckets['bucket1'].foos['foo1'])
+
+    def test_get_container_by_id_after_write(self):
+        foo3 = Foo('foo3', [9, 10], "I am foo3", 51, 9.42)
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='a') as io:
+            read_foofile = io.read()
+            self.assertIs(io.get_container_by_id(self.foo1.object_id), read_foofile.buckets['bucket1'].foos['foo1'])
+            read_foofile.add_bucket(FooBucket('bucket3', [foo3]))
+            io.write(read_foofile)
+            self.assertIs(io.get_container_by_id(foo3.object_id), foo3)
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r') as io:
+            self.assertContainerEqual(io.get_container_by_id(foo3.object_id), foo3, ignore_hdmf_attrs=True)
+
+    def test_missing_object_id(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r') as io:
+            msg = "No object with object ID 'bad_id' found in file '%s'" % io.source
+            with self.assertRaisesWith(ValueError, msg):
+                io.get_container_by_id('bad_id')
+
+
+class TestIOStats(TestCase):
+
+    def setUp(self):
+        self.path = get_temp_filepath()
+        self.foo1 = Foo('foo1', [1, 2, 3, 4, 5], "I am foo1", 17, 3.14)
+        self.foofile = FooFile(buckets=[FooBucket('bucket1', [self.foo1])])
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_disabled(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='w') as io:
+            io.write(self.foofile)
+            self.assertIsNone(io.get_io_stats())
+
+    def test_write(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='w', io_stats=True) as io:
+            io.write(self.foofile)
+            stats = io.get_io_stats()
+        self.assertEqual(stats['operations']['write_dataset']['calls'], 1)
+        self.assertEqual(stats['operations']['list_fill']['calls'], 1)
+        self.assertIn('write_group', stats['operations'])
+        self.assertIn('add_refs', stats['operations'])
+        foo_stats = stats['objects']['/buckets/bucket1/foo_holder/foo1/my_data']
+        with File(self.path, 'r') as f:
+            self.assertEqual(foo_stats['bytes_written'], f['/buckets/bucket1/foo_holder/foo1/my_data'].nbytes)
+        self.assertEqual(foo_stats['write_calls'], 1)
+        self.assertIn('write_dataset_time', foo_stats)
+        self.assertGreater(stats['objects']['/buckets/bucket1/foo_holder/foo1']['attributes_written'], 0)
+
+    def test_write_strings(self):
+        foo1 = Foo('foo1', ['a', 'bcd', '\u00e9'], "I am foo1", 17, 3.14)
+        self.foofile = FooFile(buckets=[FooBucket('bucket1', [foo1])])
+        with HDF5IO(self.path, manager=get_foo_buildmanager("text"), mode='w', io_stats=True) as io:
+            io.write(self.foofile)
+            stats = io.get_io_stats()
+        # the bytes of the UTF-8 encoded strings are counted, not the size of the references to them
+        self.assertEqual(stats['objects']['/buckets/bucket1/foo_holder/foo1/my_data']['bytes_written'], 6)
+
+    def test_chunk_nbytes_strings(self):
+        chunk = DataChunk(data=np.array(['a', 'bcd', '\u00e9'], dtype=object), selection=np.s_[0:3])
+        self.assertEqual(_chunk_nbytes(chunk), 6)
+
+    def test_write_dci(self):
+        foo1 = Foo('foo1', DataChunkIterator(data=np.arange(10), buffer_size=4), "I am foo1", 17, 3.14)
+        self.foofile = FooFile(buckets=[FooBucket('bucket1', [foo1])])
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='w', io_stats=True) as io:
+            io.write(self.foofile)
+            stats = io.get_io_stats()
+        self.assertEqual(stats['operations']['exhaust_dci']['calls'], 1)
+        foo_stats = stats['objects']['/buckets/bucket1/foo_holder/foo1/my_data']
+        self.assertEqual(foo_stats['chunks_written'], 3)
+        self.assertEqual(foo_stats['bytes_written'], 10 * np.dtype(int).itemsize)
+
+    def test_read(self):
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='w') as io:
+            io.write(self.foofile)
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r', io_stats=True) as io:
+            io.read()
+            stats = io.get_io_stats()
+            self.assertEqual(stats['operations']['read_dataset']['calls'], 1)
+            self.assertIn('read_group_time', stats['objects']['/'])
+            self.assertIn('attributes_read', stats['objects']['/buckets/bucket1/foo_holder/foo1'])
+            io.reset_io_stats()
+            self.assertDictEqual(io.get_io_stats(), {'operations': {}, 'objects': {}, 'counters': {}})
+
+    def test_callback(self):
+        calls = []
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='w',
+                    io_stats_callback=lambda *args: calls.append(args)) as io:
+            io.write(self.foofile)
+            self.assertIsNotNone(io.get_io_stats())
+        self.assertIn(('write_dataset', '/buckets/bucket1/foo_holder/foo1/my_data'), [c[:2] for c in calls])
+        self.assertTrue(all(c[2] >= 0 for c in calls))
+
+
+class TestDCIPrefetch(TestCase):
+
+    def setUp(self):
+        self.path = get_temp_filepath()
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_write(self):
+        foos = [Foo('foo%d' % i, DataChunkIterator(data=np.arange(i, i + 100), buffer_size=7), "I am foo", 17, 3.14)
+                for i in range(3)]
+        foofile = FooFile(buckets=[FooBucket('bucket1', foos)])
+        # buffer at most two chunks of 7 int64 values
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='w', dci_prefetch_workers=2,
+                    dci_prefetch_max_bytes=112) as io:
+            io.write(foofile)
+        with File(self.path, 'r') as f:
+            for i in range(3):
+                data = f['buckets/bucket1/foo_holder/foo%d/my_data' % i][:]
+                self.assertListEqual(data.tolist(), list(range(i, i + 100)))
+
+    def test_write_error(self):
+        def gen():
+            yield 1
+            raise ValueError("read failed")
+
+        foo = Foo('foo1', DataChunkIterator(data=gen(), buffer_size=1), "I am foo", 17, 3.14)
+        foofile = FooFile(buckets=[FooBucket('bucket1', [foo])])
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='w', dci_prefetch_workers=1) as io:
+            with self.assertRaisesWith(ValueError, "read failed"):
+                io.write(foofile)
+
+    def test_invalid(self):
+        with self.assertRaisesWith(ValueError, "dci_prefetch_workers must be a positive integer, got 0"):
+            HDF5IO(self.path, mode='w', dci_prefetch_workers=0)
+
+
+class LoggingNumpyArrayGenericDataChunkIterator(NumpyArrayGenericDataChunkIterator):
+    """Iterator that appends its name to a log when it reads a buffer"""
+
+    def __init__(self, array: np.ndarray, name, log, **kwargs):
+        self.name = name
+        self.log = log
+        super().__init__(array=array, **kwargs)
+
+    def _get_data(self, selection):
+        self.log.append(self.name)
+        return self.array[selection]
+
+
+class TestDCIMemoryBudget(TestCase):
+
+    def setUp(self):
+        self.path = get_temp_filepath()
+        self.log = list()
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def write(self, chunk_shape, **kwargs):
+        iterators = [LoggingNumpyArrayGenericDataChunkIterator(np.arange(i, i + 100), name=i, log=self.log,
+                                                               buffer_shape=(50,), chunk_shape=chunk_shape)
+                     for i in range(3)]
+        foos = [Foo('foo%d' % i, iterator, "I am foo", 17, 3.14) for i, iterator in enumerate(iterators)]
+        foofile = FooFile(buckets=[FooBucket('bucket1', foos)])
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='w', io_stats=True, **kwargs) as io:
+            io.write(foofile, exhaust_dci=False)
+            stats = io.get_io_stats()
+        with File(self.path, 'r') as f:
+            for i in range(3):
+                data = f['buckets/bucket1/foo_holder/foo%d/my_data' % i][:]
+                self.assertListEqual(data.tolist(), list(range(i, i + 100)))
+        return iterators, stats
+
+    def test_no_budget(self):
+        self.write(chunk_shape=(50,))
+        self.assertListEqual(self.log, [0, 1, 2, 0, 1, 2])
+
+    def test_shrink_buffers(self):
+        # the buffers of 400 bytes are shrunk to fit their share of 800 bytes
+        iterators, _ = self.write(chunk_shape=(10,), dci_max_buffer_bytes=800)
+        for iterator in iterators:
+            self.assertTupleEqual(iterator.buffer_shape, (30,))
+        self.assertListEqual(self.log, [0, 1, 2] * 4)
+
+    def test_start_within_budget(self):
+        # the buffers cannot be shrunk below the chunk shape, so only two iterators are exhausted at a time
+        _, stats = self.write(chunk_shape=(50,), dci_max_buffer_bytes=800)
+        self.assertListEqual(self.log, [0, 1, 0, 1, 2, 2])
+        for i in range(3):
+            self.assertIn('dci_wait_time', stats['objects']['/buckets/bucket1/foo_holder/foo%d/my_data' % i])
+
+    def test_shrink_buffers_prefetch(self):
+        # a single prefetch thread exhausts one iterator at a time, which gets the whole budget
+        iterators, _ = self.write(chunk_shape=(10,), dci_max_buffer_bytes=200, dci_prefetch_workers=1)
+        for iterator in iterators:
+            self.assertTupleEqual(iterator.buffer_shape, (20,))
+
+    def test_invalid(self):
+        with self.assertRaisesWith(ValueError, "dci_max_buffer_bytes must be a positive integer, got 0"):
+            HDF5IO(self.path, mode='w', dci_max_buffer_bytes=0)
+
+
+class TestCheckpointedWrite(TestCase):
+
+    def setUp(self):
+        self.path = get_temp_filepath()
+        self.checkpoint = self.path + '.checkpoint'
+
+    def tearDown(self):
+        for path in (self.path, self.checkpoint, self.checkpoint + '.iterators'):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def write(self, fail_after=None, dataio_kwargs=None, checkpoint_chunks=1, checkpoint_interval=None, **kwargs):
+        foos = [Foo('foo%d' % i,
+                    H5DataIO(PicklableNumpyArrayGenericDataChunkIterator(np.arange(i, i + 100), fail_after=fail_after,
+                                                                         buffer_shape=(10,), chunk_shape=(5,)),
+                             chunk_processors=[SummaryStatistics()], write_processor_attributes=True,
+                             **(dataio_kwargs or dict())),
+                    "I am foo", 17, 3.14)
+                for i in range(2)]
+        foos.append(Foo('foo2', [1, 2, 3], "I am foo", 17, 3.14))
+        foofile = FooFile(buckets=[FooBucket('bucket1', foos)])
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='w', **kwargs) as io:
+            io.write(foofile, checkpoint=self.checkpoint, checkpoint_chunks=checkpoint_chunks,
+                     checkpoint_interval=checkpoint_interval)
+
+    def test_write(self):
+        self.write()
+        self.assertFalse(os.path.exists(self.checkpoint))
+        self.assertFalse(os.path.exists(self.checkpoint + '.iterators'))
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r') as io:
+            read_foofile = io.read()
+            foos = read_foofile.buckets['bucket1'].foos
+            self.assertListEqual(foos['foo1'].my_data[:].tolist(), list(range(1, 101)))
+            self.assertListEqual(foos['foo2'].my_data[:].tolist(), [1, 2, 3])
+
+    def test_resume_write(self):
+        with self.assertRaisesWith(RuntimeError, "interrupted"):
+            self.write(fail_after=3)
+        self.assertTrue(os.path.exists(self.checkpoint))
+        # the rest of the file was written before the iterators
+        with File(self.path, 'r') as f:
+            self.assertListEqual(f['buckets/bucket1/foo_holder/foo2/my_data'][:].tolist(), [1, 2, 3])
+        with patch.object(PicklableNumpyArrayGenericDataChunkIterator, '_get_data',
+                          autospec=True, side_effect=lambda self, selection: self.array[selection]) as mock:
+            with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='a') as io:
+                io.resume_write(self.checkpoint)
+        # the iterators are written in turn, so three buffers of each were written before the write was interrupted
+        self.assertEqual(mock.call_count, 20 - 6)
+        self.assertFalse(os.path.exists(self.checkpoint))
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='r') as io:
+            read_foofile = io.read()
+            foos = read_foofile.buckets['bucket1'].foos
+            for i in range(2):
+                self.assertListEqual(foos['foo%d' % i].my_data[:].tolist(), list(range(i, i + 100)))
+        # the statistics of the chunks that were written before the write was interrupted are restored
+        with File(self.path, 'r') as f:
+            attrs = f['buckets/bucket1/foo_holder/foo1/my_data'].attrs
+            self.assertEqual(attrs['stats_count'], 100)
+            self.assertEqual(attrs['stats_min'], 1)
+            self.assertEqual(attrs['stats_max'], 100)
+
+    def test_save_every_chunks(self):
+        replaced = list()
+        replace = os.replace
+
+        def record_replace(src, dst):
+            replaced.append(dst)
+            return replace(src, dst)
+
+        with patch('hdmf.backends.hdf5.h5_utils.os.replace', record_replace):
+            self.write(checkpoint_chunks=4)
+        # the iterators are saved once. the progress is saved before the iterators are exhausted, after every four
+        # of the 20 chunks of the two iterators, and when each iterator is exhausted.
+        self.assertEqual(replaced.count(self.checkpoint + '.iterators'), 1)
+        self.assertEqual(replaced.count(self.checkpoint), 1 + 5 + 2)
+
+    def test_save_every_interval(self):
+        with patch('hdmf.backends.hdf5.h5_utils.HDF5IODataChunkIteratorCheckpoint.save', autospec=True) as save:
+            self.write(checkpoint_chunks=None, checkpoint_interval=3600)
+        # the progress is only saved before the iterators are exhausted and when each iterator is exhausted
+        self.assertEqual(save.call_count, 1 + 2)
+
+    def test_resume_write_twice(self):
+        """Test that the chunk processors are saved while a write is resumed"""
+        with self.assertRaisesWith(RuntimeError, "interrupted"):
+            self.write(fail_after=3)
+        calls = list()
+
+        def get_data(iterator, selection):
+            calls.append(selection)
+            if len(calls) > 5:
+                raise RuntimeError("interrupted again")
+            return iterator.array[selection]
+
+        with patch.object(PicklableNumpyArrayGenericDataChunkIterator, '_get_data', autospec=True,
+                          side_effect=get_data):
+            with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='a') as io:
+                with self.assertRaisesWith(RuntimeError, "interrupted again"):
+                    io.resume_write(self.checkpoint, checkpoint_chunks=1)
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='a') as io:
+            io.resume_write(self.checkpoint)
+        with File(self.path, 'r') as f:
+            for i in range(2):
+                dset = f['buckets/bucket1/foo_holder/foo%d/my_data' % i]
+                self.assertListEqual(dset[:].tolist(), list(range(i, i + 100)))
+                self.assertEqual(dset.attrs['stats_count'], 100)
+                self.assertEqual(dset.attrs['stats_min'], i)
+
+    def test_resume_write_dataio_options(self):
+        """Test that the iterators are wrapped in H5DataIOs with the original options when the write is resumed"""
+        dataio_kwargs = dict(compression='gzip', compression_opts=4, shuffle=True, fillvalue=-1,
+                             compression_workers=2, skip_fill_chunks=True)
+        with self.assertRaisesWith(RuntimeError, "interrupted"):
+            self.write(fail_after=3, dataio_kwargs=dataio_kwargs)
+        with patch('hdmf.backends.hdf5.h5tools.H5DataIO', wraps=H5DataIO) as mock:
+            with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='a') as io:
+                io.resume_write(self.checkpoint)
+        self.assertEqual(mock.call_count, 2)
+        for call in mock.call_args_list:
+            self.assertDictEqual({k: call.kwargs[k] for k in dataio_kwargs}, dataio_kwargs)
+            self.assertTupleEqual(call.kwargs['chunks'], (5,))
+            self.assertFalse(call.kwargs['allow_plugin_filters'])
+            self.assertEqual(len(call.kwargs['chunk_processors']), 1)
+        with File(self.path, 'r') as f:
+            for i in range(2):
+                data = f['buckets/bucket1/foo_holder/foo%d/my_data' % i][:]
+                self.assertListEqual(data.tolist(), list(range(i, i + 100)))
+
+    def test_resume_write_shrunk_buffers(self):
+        # the buffers of 80 bytes are shrunk to 40 bytes to fit the budget
+        with self.assertRaisesWith(RuntimeError, "interrupted"):
+            self.write(fail_after=3, dci_max_buffer_bytes=100)
+        with patch.object(PicklableNumpyArrayGenericDataChunkIterator, '_get_data',
+                          autospec=True, side_effect=lambda self, selection: self.array[selection]) as mock:
+            with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='a') as io:
+                io.resume_write(self.checkpoint)
+        self.assertEqual(mock.call_count, 40 - 6)
+        with File(self.path, 'r') as f:
+            for i in range(2):
+                data = f['buckets/bucket1/foo_holder/foo%d/my_data' % i][:]
+                self.assertListEqual(data.tolist(), list(range(i, i + 100)))
+
+    def test_not_picklable(self):
+        foo = Foo('foo1', DataChunkIterator(data=(i for i in range(10))), "I am foo", 17, 3.14)
+        foofile = FooFile(buckets=[FooBucket('bucket1', [foo])])
+        msg = ("Cannot checkpoint the write of dataset '/buckets/bucket1/foo_holder/foo1/my_data' because its "
+               "DataChunkIterator cannot be pickled. Use a GenericDataChunkIterator that defines _to_dict and "
+               "_from_dict.")
+        with HDF5IO(self.path, manager=get_foo_buildmanager(), mode='w') as io:
+            with self.assertRaisesWith(ValueError, msg):
+                io.write(foofile, checkpoint=self.checkpoint)
+
+
+class TestReadDatasetOfReferences(TestCase):
+
+    def setUp(self):
+        self.path = get_temp_filepath()
+        bazs = [Baz(name='baz%d' % i) for i in range(3)]
+        baz_data = BazData(name='baz_data1', data=[bazs[i % 3] for i in range(10)])
+        bucket = BazBucket(name='bucket1', bazs=bazs, baz_data=baz_data)
+        with HDF5IO(self.path, manager=get_baz_buildmanager(), mode='w') as write_io:
+            write_io.write(bucket)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_read_slices(self):
+        with HDF5IO(self.path, manager=get_baz_buildmanager(), mode='r') as read_io:
+            read_bucket = read_io.read()
+            bazs = [read_bucket.bazs['baz%d' % (i % 3)] for i in range(10)]
+            data = read_bucket.baz_data.data
+            self.assertListEqual(data[:], bazs)
+            self.assertListEqual(data[2:7], bazs[2:7])
+            self.assertListEqual(data[[0, 4, 5]], [bazs[0], bazs[4], bazs[5]])
+            self.assertListEqual(data[3:3], [])
+            self.assertListEqual(data[8:1:-3], bazs[8:1:-3])
+            self.assertListEqual(data[[-1, 2]], [bazs[9], bazs[2]])
+            self.assertListEqual(data[np.arange(10) % 4 == 0], [bazs[0], bazs[4], bazs[8]])
+            self.assertIs(data[4], bazs[4])
+
+    def test_read_builders(self):
+        with HDF5IO(self.path, manager=get_baz_buildmanager(), mode='r') as read_io:
+            f_builder = read_io.read_builder()
+            baz_builders = [f_builder['bazs/baz%d' % (i % 3)] for i in range(10)]
+            self.assertListEqual(f_builder['baz_data'].data[:], baz_builders)
+
+    def test_resolve_unique_targets_once(self):
+        with HDF5IO(self.path, manager=get_baz_buildmanager(), mode='r') as read_io:
+            data = read_io.read().baz_data.data
+            with patch.object(read_io, 'get_builder', wraps=read_io.get_builder) as get_builder:
+                data[:]
+                self.assertEqual(get_builder.call_count, 3)
+                data[0:5]
+                self.assertEqual(get_builder.call_count, 3)
+
+    def test_read_refs_of_uncached_targets(self):
+        with HDF5IO(self.path, manager=get_baz_buildmanager(), mode='r') as read_io:
+            data = read_io.read().baz_data.data
+            calls = list()
+            getitem = h5py.Dataset.__getitem__
+
+            def count_getitem(dset, args, *pargs, **kwargs):
+                calls.append(args)
+                return getitem(dset, args, *pargs, **kwargs)
+
+            with patch.object(h5py.Dataset, '__getitem__', count_getitem):
+                data[0:2]
+                # the references to the two targets are read once after their addresses are read
+                self.assertListEqual(calls, [[0, 1]])
+                data[:]
+                self.assertListEqual(calls, [[0, 1], [2]])
+                data[3:8]
+                self.assertListEqual(calls, [[0, 1], [2]])
+
+
+class TestReadRegions(TestCase):
+
+    def setUp(self):
+        self.path = get_temp_filepath()
+        with h5py.File(self.path, 'w') as f:
+            dset = f.create_dataset('data', data=np.arange(40).reshape(20, 2))
+            other = f.create_dataset('other', data=np.arange(10) * 10)
+            refs = [dset.regionref[0:3], dset.regionref[2:5, 1:2], dset.regionref[10:12], dset.regionref[[1, 7]],
+                    other.regionref[4:6], dset.regionref[3:6]]
+            f.create_dataset('refs', data=refs, dtype=h5py.regionref_dtype)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_read_regions(self):
+        with h5py.File(self.path, 'r') as f:
+            dset = f['data']
+            refs = [ref for ref in f['refs'][:] if f[ref] == dset]
+            with patch.object(h5py.Dataset, 'read_direct', autospec=True,
+                              side_effect=h5py.Dataset.read_direct) as read_direct:
+                regions = read_regions(dset, refs)
+                # the first and last regions are adjacent and select the same columns, so they are read at once
+                self.assertEqual(read_direct.call_count, 3)
+            for ref, region in zip(refs, regions):
+                np.testing.assert_array_equal(region, dset[ref])
+
+    def test_read_regions_far_apart(self):
+        with h5py.File(self.path, 'a') as f:
+            dset = f.create_dataset('wide', shape=(2, 1_000_002), dtype=np.uint8, chunks=(1, 1000))
+            dset[0, 0:2] = [1, 2]
+            dset[1, 1_000_000:1_000_002] = [3, 4]
+            refs = [dset.regionref[0:1, 0:2], dset.regionref[1:2, 1_000_000:1_000_002]]
+            sizes = list()
+            read_direct = h5py.Dataset.read_direct
+
+            def count_read_direct(dset, dest, *args, **kwargs):
+                sizes.append(dest.size)
+                return read_direct(dset, dest, *args, **kwargs)
+
+            with patch.object(h5py.Dataset, 'read_direct', count_read_direct):
+                regions = read_regions(dset, refs)
+            # the regions are adjacent along the first dimension but not merged, so only the regions are read
+            self.assertListEqual(sizes, [2, 2])
+            np.testing.assert_array_equal(regions[0], [[1, 2]])
+            np.testing.assert_array_equal(regions[1], [[3, 4]])
+
+    def test_region_slicer_read_regions(self):
+        with h5py.File(self.path, 'r') as f:
+            dset = f['data']
+            refs = [ref for ref in f['refs'][:] if f[ref] == dset]
+            slicers = [H5RegionSlicer(dset, ref) for ref in refs]
+            H5RegionSlicer.read_regions(slicers)
+            for ref, slicer in zip(refs, slicers):
+                np.testing.assert_array_equal(slicer[:], dset[ref])
+
+    def test_region_dataset_slice(self):
+        with HDF5IO(self.path, mode='r') as io:
+            io.read_builder()
+            refs = io._file['refs']
+            regions = BuilderH5RegionDataset(refs, io)[1:]
+            self.assertEqual(len(regions), 5)
+            for ref, region in zip(refs[1:], regions):
+                np.testing.assert_array_equal(region, io._file[ref][ref])
+
+
 class TestHDF5IO(TestCase):
 
     def setUp(self):
@@ -3777,6 +4853,33 @@ class H5DataIOTests(TestCase):
         dataio = H5DataIO(data=[1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
         self.assertEqual(dataio.maxshape, (10,))
 
+    def test_dataio_compression_workers(self):
+        dataio = H5DataIO(data=np.arange(10), compression=True, compression_workers=4)
+        self.assertEqual(dataio.compression_workers, 4)
+        self.assertNotIn('compression_workers', dataio.io_settings)
+        with self.assertRaisesWith(ValueError, "compression_workers requires gzip compression"):
+            H5DataIO(data=np.arange(10), compression_workers=4)
+        with self.assertRaisesWith(ValueError, "compression_workers cannot be used with the fletcher32 checksum"):
+            H5DataIO(data=np.arange(10), compression='gzip', fletcher32=True, compression_workers=4)
+        with self.assertRaisesWith(ValueError, "compression_workers must be a positive integer, not 0"):
+            H5DataIO(data=np.arange(10), compression='gzip', compression_workers=0)
+
+    def test_dataio_chunk_processors(self):
+        processor = SummaryStatistics()
+        dataio = H5DataIO(data=np.arange(10), chunk_processors=[processor])
+        self.assertListEqual(dataio.chunk_processors, [processor])
+        self.assertNotIn('chunk_processors', dataio.io_settings)
+        self.assertFalse(dataio.write_processor_attributes)
+        self.assertNotIn('write_processor_attributes', dataio.io_settings)
+        with self.assertRaisesWith(ValueError, "chunk_processors must be DataChunkProcessors, not int"):
+            H5DataIO(data=np.arange(10), chunk_processors=[1])
+
+    def test_dataio_skip_fill_chunks(self):
+        dataio = H5DataIO(data=np.arange(10), skip_fill_chunks=True)
+        self.assertTrue(dataio.skip_fill_chunks)
+        self.assertEqual(dataio.skipped_chunks, 0)
+        self.assertNotIn('skip_fill_chunks', dataio.io_settings)
+
 
 def test_hdf5io_can_read():
     assert not HDF5IO.can_read("not_a_file")
@@ -4,7 +4,7 @@ from abc import ABCMeta, abstractmethod
 import numpy as np
 from h5py import File
 from hdmf.array import SortedArray, LinSpace
-from hdmf.query import HDMFDataset, Query
+from hdmf.query import HDMFDataset, PrefetchDataset, Query
 from hdmf.testing import TestCase
 
 
@@ -159,3 +159,81 @@ class CompoundQueryTest(TestCase):
 
     def tearDown(self):
         pass
+
+
+class RecordingDataset(HDMFDataset):
+    """An HDMFDataset that records the keys it is read with"""
+
+    def __init__(self, dataset):
+        super().__init__(dataset)
+        self.keys = list()
+
+    @property
+    def shape(self):
+        return self.dataset.shape
+
+    def __getitem__(self, key):
+        self.keys.append(key)
+        return self.dataset[key]
+
+
+class PrefetchDatasetTest(TestCase):
+
+    def setUp(self):
+        self.array = np.arange(300).reshape(100, 3)
+        self.dset = RecordingDataset(self.array)
+        self.prefetch = PrefetchDataset(self.dset, blocks=2, block_size=10)
+
+    def tearDown(self):
+        self.prefetch.close()
+
+    def test_sequential(self):
+        for i in range(0, 100, 5):
+            np.testing.assert_array_equal(self.prefetch[i:i+5], self.array[i:i+5])
+        # only the first read is passed through, the rest is read in blocks
+        self.assertEqual(self.dset.keys[0], slice(0, 5))
+        self.assertListEqual(self.dset.keys[1:], [slice(i, i + 10) for i in range(0, 100, 10)])
+
+    def test_read_ahead(self):
+        self.prefetch[0:5]
+        self.prefetch[5:8]
+        np.testing.assert_array_equal(self.prefetch[8:30], self.array[8:30])
+        # the blocks that were read ahead are not read again
+        self.assertListEqual(self.dset.keys[:4], [slice(0, 5), slice(0, 10), slice(10, 20), slice(20, 30)])
+        self.assertEqual(len(self.dset.keys), len(set((k.start, k.stop) for k in self.dset.keys)))
+
+    def test_multidimensional_keys(self):
+        self.prefetch[0:5]
+        np.testing.assert_array_equal(self.prefetch[5:15, 1:], self.array[5:15, 1:])
+        np.testing.assert_array_equal(self.prefetch[15, [0, 2]], self.array[15, [0, 2]])
+        np.testing.assert_array_equal(self.prefetch[16], self.array[16])
+        self.assertEqual(self.prefetch[17, 1], self.array[17, 1])
+
+    def test_random_access(self):
+        np.testing.assert_array_equal(self.prefetch[50:55], self.array[50:55])
+        np.testing.assert_array_equal(self.prefetch[10:15], self.array[10:15])
+        np.testing.assert_array_equal(self.prefetch[[1, 3]], self.array[[1, 3]])
+        np.testing.assert_array_equal(self.prefetch[::2], self.array[::2])
+        self.assertListEqual(self.dset.keys[:3], [slice(50, 55), slice(10, 15), [1, 3]])
+
+    def test_iter(self):
+        np.testing.assert_array_equal(np.array(list(self.prefetch)), self.array)
+
+    def test_non_array_data(self):
+        dset = RecordingDataset(list(range(20)))
+        with PrefetchDataset(dset, block_size=5) as prefetch:
+            prefetch[0:5]
+            self.assertListEqual(prefetch[5:10], list(range(5, 10)))
+            self.assertListEqual(prefetch[10:15], list(range(10, 15)))
+
+    def test_default_block_size(self):
+        with File('PrefetchDatasetTest.h5', 'w', driver='core', backing_store=False) as f:
+            chunked = f.create_dataset('chunked', data=self.array, chunks=(7, 3))
+            self.assertEqual(PrefetchDataset(chunked).block_size, 7)
+        self.assertEqual(PrefetchDataset(np.zeros((10, 2**16))).block_size, 2)
+
+    def test_invalid_arguments(self):
+        with self.assertRaisesWith(ValueError, "blocks must be a positive integer, got 0"):
+            PrefetchDataset(self.array, blocks=0)
+        with self.assertRaisesWith(ValueError, "block_size must be a positive integer, got 0"):
+            PrefetchDataset(self.array, block_size=0)
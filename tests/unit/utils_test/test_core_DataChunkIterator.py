@@ -432,6 +432,47 @@ class DataChunkIteratorTests(TestCase):
         self.assertIsNone(dci.recommended_chunk_shape())
 
 
+    def test_custom_iter_mixed_dtype(self):
+        """Test that values of a wider dtype than the first value are not truncated."""
+        dci = DataChunkIterator(data=iter([1, 2, 3.5]), buffer_size=3)
+        chunk = next(dci)
+        self.assertListEqual(chunk.data.tolist(), [1.0, 2.0, 3.5])
+        self.assertEqual(chunk.data.dtype, np.dtype(float))
+
+    def test_custom_iter_mismatched_shape(self):
+        dci = DataChunkIterator(data=iter([np.arange(3), np.arange(2)]), dtype=np.dtype(int), buffer_size=2)
+        with self.assertRaisesWith(ValueError, "all input arrays must have the same shape"):
+            next(dci)
+
+    def test_blocks_first_axis(self):
+        blocks = [np.arange(0, 6).reshape(3, 2), np.arange(6, 10).reshape(2, 2), np.arange(10, 18).reshape(4, 2)]
+        dci = DataChunkIterator(data=iter(blocks), buffer_size=4, blocks=True)
+        self.assertTupleEqual(dci.maxshape, (None, 2))
+        self.assertEqual(dci.dtype, np.dtype(int))
+        chunks = list(dci)
+        # blocks are combined until there are at least buffer_size values, and are not split
+        self.assertListEqual([c.selection for c in chunks], [(slice(0, 5), slice(None)), (slice(5, 9), slice(None))])
+        self.assertListEqual(chunks[0].data.tolist(), np.arange(0, 10).reshape(5, 2).tolist())
+        # a block with at least buffer_size values is not copied
+        self.assertIs(chunks[1].data, blocks[2])
+
+    def test_blocks_last_axis(self):
+        blocks = [np.arange(6).reshape(2, 3), None, np.arange(6, 10).reshape(2, 2)]
+        dci = DataChunkIterator(data=blocks, buffer_size=5, iter_axis=1, blocks=True)
+        self.assertTupleEqual(dci.maxshape, (2, None))
+        chunks = list(dci)
+        self.assertEqual(len(chunks), 1)
+        self.assertTupleEqual(chunks[0].selection, (slice(None), slice(0, 5)))
+        self.assertListEqual(chunks[0].data.tolist(), [[0, 1, 2, 6, 7], [3, 4, 5, 8, 9]])
+
+    def test_numpy_array_not_copied(self):
+        a = np.arange(10)
+        dci = DataChunkIterator(data=a, buffer_size=4)
+        chunk = next(dci)
+        self.assertTrue(np.shares_memory(chunk.data, a))
+        self.assertTupleEqual(chunk.selection, (slice(0, 4), ))
+
+
 class DataChunkTests(TestCase):
 
     def setUp(self):
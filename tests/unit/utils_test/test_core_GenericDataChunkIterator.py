@@ -461,3 +461,96 @@ class GenericDataChunkIteratorTests(TestCase):
         assert post_dump_iterator.chunk_shape == pre_dump_iterator.chunk_shape
         assert post_dump_iterator.buffer_shape == pre_dump_iterator.buffer_shape
         assert_array_equal(post_dump_iterator.array, pre_dump_iterator.array)
+
+    def test_num_workers(self):
+        test_array = np.arange(2000 * 384, dtype="int16").reshape(2000, 384)
+        for executor_type in ("thread", "process"):
+            with self.subTest(executor_type=executor_type):
+                iterator = PickleableNumpyArrayDataChunkIterator(
+                    array=test_array, buffer_shape=(100, 384), chunk_shape=(50, 384), num_workers=2,
+                    executor_type=executor_type,
+                )
+                selections = list()
+                for data_chunk in iterator:
+                    selections.append(data_chunk.selection)
+                    assert_array_equal(data_chunk.data, test_array[data_chunk.selection])
+                expected_selections = [(slice(i, i + 100), slice(0, 384)) for i in range(0, 2000, 100)]
+                self.assertListEqual(selections, expected_selections)
+                self.assertIsNone(iterator._executor)
+
+    def test_skip_buffers(self):
+        iterator = self.TestNumpyArrayDataChunkIterator(
+            array=self.test_array, buffer_shape=(500, 384), chunk_shape=(100, 384)
+        )
+        iterator.skip_buffers(num_buffers=2)
+        selections = [data_chunk.selection for data_chunk in iterator]
+        self.assertListEqual(selections, [(slice(1000, 1500), slice(0, 384)), (slice(1500, 2000), slice(0, 384))])
+
+    def test_shrink_buffer(self):
+        iterator = self.TestNumpyArrayDataChunkIterator(
+            array=self.test_array, buffer_shape=(1000, 384), chunk_shape=(100, 384), num_workers=1
+        )
+        self.assertEqual(iterator.buffer_nbytes, 2 * 1000 * 384 * self.test_array.dtype.itemsize)
+        # the buffer being consumed and the buffer being fetched share the budget
+        self.assertTrue(iterator.shrink_buffer(buffer_gb=8 * 100 * 384 * self.test_array.dtype.itemsize / 1e9))
+        self.assertTupleEqual(iterator.buffer_shape, (200, 384))
+        self.assertEqual(iterator.num_buffers, 10)
+        self.assertFalse(iterator.shrink_buffer(buffer_gb=1.0))
+        self.assertTrue(iterator.shrink_buffer(buffer_shape=(100, 384)))
+        self.assertEqual(len(list(iterator)), 20)
+
+    def test_num_workers_buffer_gb(self):
+        # the buffer being consumed and the buffers being fetched by two workers share the buffer_gb budget
+        iterator = self.TestNumpyArrayDataChunkIterator(
+            array=self.test_array, buffer_gb=0.0015, chunk_shape=(100, 384), num_workers=2
+        )
+        expected = self.TestNumpyArrayDataChunkIterator(
+            array=self.test_array, buffer_gb=0.0005, chunk_shape=(100, 384)
+        )
+        self.assertEqual(iterator.buffer_shape, expected.buffer_shape)
+
+    def test_num_workers_error(self):
+        class FailingDataChunkIterator(self.TestNumpyArrayDataChunkIterator):
+            def _get_data(self, selection) -> np.ndarray:
+                if selection[0].start > 0:
+                    raise ValueError("read failed")
+                return super()._get_data(selection)
+
+        iterator = FailingDataChunkIterator(
+            array=self.test_array, buffer_shape=(1000, 384), chunk_shape=(100, 384), num_workers=2
+        )
+        next(iterator)
+        with self.assertRaisesWith(ValueError, "read failed"):
+            next(iterator)
+        self.assertIsNone(iterator._executor)
+
+    def test_num_workers_assertions(self):
+        with self.assertRaisesWith(exc_type=AssertionError, exc_msg="num_workers (0) must be greater than zero!"):
+            self.TestNumpyArrayDataChunkIterator(array=self.test_array, num_workers=0)
+        with self.assertRaisesWith(
+            exc_type=AssertionError, exc_msg="executor_type (dask) must be either 'thread' or 'process'!"
+        ):
+            self.TestNumpyArrayDataChunkIterator(array=self.test_array, num_workers=2, executor_type="dask")
+
+    def test_source_chunk_shape(self):
+        class SourceChunkedDataChunkIterator(self.TestNumpyArrayDataChunkIterator):
+            def _get_source_chunk_shape(self) -> Tuple[int, ...]:
+                return (70, 1000)
+
+        iterator = SourceChunkedDataChunkIterator(array=self.test_array, buffer_gb=0.0005, chunk_mb=0.05)
+        self.assertEqual(iterator.source_chunk_shape, (70, 384))
+        # the default chunk shape (350, 70) is aligned with the source chunks
+        self.assertEqual(iterator.chunk_shape, (350, 64))
+        # the buffer shape is a multiple of both the chunk shape and the source chunk shape
+        self.assertEqual(iterator.buffer_shape, (1050, 384))
+        self.check_direct_hdf5_write(iterator_options=dict(buffer_gb=0.0005, chunk_mb=0.05))
+
+    def test_source_chunk_shape_smaller_chunk(self):
+        class SourceChunkedDataChunkIterator(self.TestNumpyArrayDataChunkIterator):
+            def _get_source_chunk_shape(self) -> Tuple[int, ...]:
+                return (300, 300)
+
+        iterator = SourceChunkedDataChunkIterator(array=self.test_array, chunk_shape=(100, 128), buffer_gb=0.0005)
+        # the buffer shape is a multiple of the least common multiple of the chunk and source chunk shapes
+        self.assertEqual(iterator.buffer_shape, (300, 384))
+        self.assertEqual(SourceChunkedDataChunkIterator._align_chunk_axis(128, 300, 384), 100)
@@ -1,7 +1,10 @@
+import threading
+
 import numpy as np
 from hdmf.testing import TestCase
 from hdmf.utils import (docval, fmt_docval_args, get_docval, getargs, popargs, AllowPositional, get_docval_macro,
-                        docval_macro, popargs_to_dict, call_docval_func)
+                        docval_macro, popargs_to_dict, call_docval_func, set_docval_validation,
+                        skip_docval_validation)
 
 
 class MyTestClass(object):
@@ -1183,3 +1186,57 @@ Args:
     arg1 (:py:class:`~int` or :py:class:`~numpy.ndarray` or ``Dummy1`` or :py:class:`~tests.unit.utils_test.test_docval.TestStringType.Dummy2`): doc
 """  # noqa: E501
         assert myfunc.__doc__ == expected
+
+
+class TestDocvalValidation(TestCase):
+
+    def setUp(self):
+        @docval({'name': 'arg1', 'type': int, 'doc': 'argument1 is required', 'shape': (None, )},
+                {'name': 'arg2', 'type': str, 'doc': 'argument2', 'default': 'a', 'enum': ['a', 'b']},
+                is_method=False)
+        def method(**kwargs):
+            return kwargs
+        self.method = method
+
+    def tearDown(self):
+        set_docval_validation(True)
+
+    def test_skip_docval_validation(self):
+        with skip_docval_validation():
+            self.assertDictEqual(self.method('x', 'c'), {'arg1': 'x', 'arg2': 'c'})
+        msg = "TestDocvalValidation.setUp.<locals>.method: incorrect type for 'arg1' (got 'str', expected 'int')"
+        with self.assertRaisesWith(TypeError, msg):
+            self.method('x')
+
+    def test_set_docval_validation(self):
+        set_docval_validation(False)
+        self.assertDictEqual(self.method(None), {'arg1': None, 'arg2': 'a'})
+        set_docval_validation(True)
+        with self.assertRaises(TypeError):
+            self.method(None)
+
+    def test_skip_docval_validation_missing_args(self):
+        """Test that missing and unrecognized arguments are reported when skipping validation"""
+        with skip_docval_validation():
+            msg = "TestDocvalValidation.setUp.<locals>.method: missing argument 'arg1'"
+            with self.assertRaisesWith(TypeError, msg):
+                self.method()
+            msg = "TestDocvalValidation.setUp.<locals>.method: unrecognized argument: 'arg3'"
+            with self.assertRaisesWith(TypeError, msg):
+                self.method(arg1=1, arg3=2)
+
+    def test_skip_docval_validation_other_thread(self):
+        """Test that skipping validation in one thread does not skip it in other threads"""
+        results = []
+
+        def call():
+            try:
+                self.method('x')
+            except TypeError as e:
+                results.append(e)
+
+        with skip_docval_validation():
+            thread = threading.Thread(target=call)
+            thread.start()
+            thread.join()
+        self.assertEqual(len(results), 1)
@@ -0,0 +1,87 @@
+import numpy as np
+from hdmf.data_utils import DataChunk, DataChunkIterator
+from hdmf.monitor import Histogram, NotYetExhausted, NumSampleCounter, SummaryStatistics
+from hdmf.testing import TestCase
+
+
+class NumSampleCounterTests(TestCase):
+
+    def test_iterate(self):
+        counter = NumSampleCounter(data=DataChunkIterator(data=np.arange(10), buffer_size=3))
+        with self.assertRaises(NotYetExhausted):
+            counter.get_final_result()
+        self.assertEqual(len(list(counter)), 4)
+        self.assertEqual(counter.get_final_result(), 10)
+        self.assertEqual(counter.get_attributes(), {'num_samples': 10})
+
+    def test_delegate(self):
+        dci = DataChunkIterator(data=np.arange(10), buffer_size=3)
+        counter = NumSampleCounter(data=dci)
+        self.assertEqual(counter.dtype, dci.dtype)
+        self.assertEqual(counter.maxshape, dci.maxshape)
+        self.assertEqual(counter.recommended_data_shape(), dci.recommended_data_shape())
+
+
+class SummaryStatisticsTests(TestCase):
+
+    def test_process_data_chunks(self):
+        data = np.random.default_rng(0).normal(loc=1e6, size=(100, 3))
+        data[[5, 50], 1] = np.nan
+        stats = SummaryStatistics()
+        for i in range(0, 100, 30):
+            stats.process_data_chunk(DataChunk(data=data[i:i + 30], selection=np.s_[i:i + 30]))
+        stats.mark_exhausted()
+        result = stats.get_final_result()
+        self.assertEqual(result['count'], 298)
+        self.assertEqual(result['nan_count'], 2)
+        self.assertEqual(result['min'], np.nanmin(data))
+        self.assertEqual(result['max'], np.nanmax(data))
+        self.assertAlmostEqual(result['mean'], np.nanmean(data))
+        self.assertAlmostEqual(result['std'], np.nanstd(data))
+
+    def test_iterate_int(self):
+        stats = SummaryStatistics(data=DataChunkIterator(data=np.arange(10), buffer_size=4))
+        for _ in stats:
+            pass
+        self.assertEqual(stats.get_attributes(),
+                         {'stats_count': 10, 'stats_nan_count': 0, 'stats_min': 0, 'stats_max': 9,
+                          'stats_mean': 4.5, 'stats_std': np.std(np.arange(10))})
+
+    def test_all_nan(self):
+        stats = SummaryStatistics()
+        stats.process_data_chunk(DataChunk(data=np.full(3, np.nan), selection=np.s_[0:3]))
+        stats.mark_exhausted()
+        self.assertEqual(stats.get_attributes(), {'stats_count': 0, 'stats_nan_count': 3})
+
+    def test_complex(self):
+        stats = SummaryStatistics()
+        with self.assertRaisesWith(ValueError, "SummaryStatistics does not support complex data"):
+            stats.process_data_chunk(DataChunk(data=np.array([1 + 2j, 3 - 1j]), selection=np.s_[0:2]))
+
+
+class HistogramTests(TestCase):
+
+    def test_process_data_chunks(self):
+        data = np.array([0.5, 1.5, 1.7, np.nan, 2.5, 10.])
+        hist = Histogram(bins=3, range=(0, 3))
+        hist.process_data_chunk(DataChunk(data=data[:3], selection=np.s_[0:3]))
+        hist.process_data_chunk(DataChunk(data=data[3:], selection=np.s_[3:6]))
+        hist.mark_exhausted()
+        counts, bin_edges = hist.get_final_result()
+        self.assertListEqual(counts.tolist(), [1, 2, 1])
+        self.assertListEqual(bin_edges.tolist(), [0., 1., 2., 3.])
+
+    def test_bin_edges(self):
+        hist = Histogram(bins=[0, 5, 10], data=DataChunkIterator(data=np.arange(10), buffer_size=4))
+        for _ in hist:
+            pass
+        self.assertListEqual(hist.get_attributes()['histogram_counts'].tolist(), [5, 5])
+
+    def test_no_range(self):
+        with self.assertRaisesWith(ValueError, "range is required if bins is the number of bins"):
+            Histogram(bins=3)
+
+    def test_complex(self):
+        hist = Histogram(bins=3, range=(0, 3))
+        with self.assertRaisesWith(ValueError, "Histogram does not support complex data"):
+            hist.process_data_chunk(DataChunk(data=np.array([1 + 2j, 3 - 1j]), selection=np.s_[0:2]))